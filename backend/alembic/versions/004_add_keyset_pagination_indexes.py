@@ -0,0 +1,46 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Composite indexes matching the list sort keys so that cursor pages are
+    # served by a backward index scan instead of sort + offset
+    op.create_index(
+        "idx_tils_keyset",
+        "tils",
+        ["day_number", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_books_keyset",
+        "books",
+        ["updated_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_book_notes_keyset",
+        "book_notes",
+        ["book_id", "reading_date", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_book_notes_keyset", table_name="book_notes")
+    op.drop_index("idx_books_keyset", table_name="books")
+    op.drop_index("idx_tils_keyset", table_name="tils")
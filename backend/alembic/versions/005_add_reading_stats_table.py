@@ -0,0 +1,44 @@
+"""Add reading_stats summary table
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Single-row summary; populated lazily by the application on first read
+    op.create_table(
+        "reading_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("total_books", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("reading_books", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed_books", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_notes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("notes_this_month", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("month_start", sa.Date(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("reading_stats")
@@ -0,0 +1,38 @@
+"""Add pattern-ops slug indexes for prefix lookups
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables whose slug is allocated with "slug = base OR slug LIKE 'base-%'"
+SLUG_TABLES = ("tils", "books", "book_notes", "tags")
+
+
+def upgrade() -> None:
+    # The existing unique slug indexes use the database collation, which
+    # cannot serve LIKE 'prefix%'; varchar_pattern_ops indexes can.
+    for table in SLUG_TABLES:
+        op.create_index(
+            f"idx_{table}_slug_pattern",
+            table,
+            ["slug"],
+            unique=False,
+            postgresql_ops={"slug": "varchar_pattern_ops"},
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(SLUG_TABLES):
+        op.drop_index(f"idx_{table}_slug_pattern", table_name=table)
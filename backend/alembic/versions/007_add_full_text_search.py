@@ -0,0 +1,65 @@
+"""Add generated tsvector columns and GIN indexes for full-text search
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match app.models.search.SEARCH_TS_CONFIG
+TS_CONFIG = "simple"
+
+
+def upgrade() -> None:
+    # Title matches rank above excerpt, which ranks above body text
+    op.execute(
+        f"""
+        ALTER TABLE tils ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('{TS_CONFIG}', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('{TS_CONFIG}', coalesce(excerpt, '')), 'B') ||
+            setweight(to_tsvector('{TS_CONFIG}', coalesce(content, '')), 'C')
+        ) STORED
+        """
+    )
+    op.execute(
+        f"""
+        ALTER TABLE book_notes ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('{TS_CONFIG}', coalesce(chapter_title, '')), 'A') ||
+            setweight(to_tsvector('{TS_CONFIG}', coalesce(content, '')), 'C')
+        ) STORED
+        """
+    )
+
+    op.create_index(
+        "idx_tils_search_vector",
+        "tils",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "idx_book_notes_search_vector",
+        "book_notes",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_book_notes_search_vector", table_name="book_notes")
+    op.drop_index("idx_tils_search_vector", table_name="tils")
+    op.drop_column("book_notes", "search_vector")
+    op.drop_column("tils", "search_vector")
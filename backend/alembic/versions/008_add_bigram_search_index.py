@@ -0,0 +1,79 @@
+"""Add character-bigram search columns for Korean substring search
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Every distinct two-character window of each word becomes a lexeme, so
+    # Korean substrings (e.g. a stem without its particle) are indexable even
+    # when only two syllables long, which pg_trgm cannot serve.
+    # Word split must match app.crud.search._WORD_SPLIT_RE.
+    op.execute(
+        r"""
+        CREATE FUNCTION text_bigrams(txt text) RETURNS tsvector
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT coalesce(array_to_tsvector(array_agg(DISTINCT gram)), ''::tsvector)
+            FROM (
+                SELECT substr(word, i, 2) AS gram
+                FROM regexp_split_to_table(
+                         lower(coalesce(txt, '')), '[[:space:]!-/:-@[-`{-~]+'
+                     ) AS word,
+                     generate_series(1, greatest(length(word) - 1, 1)) AS i
+                WHERE word <> ''
+            ) grams
+        $$
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE tils ADD COLUMN search_bigrams tsvector
+        GENERATED ALWAYS AS (
+            text_bigrams(title || ' ' || excerpt || ' ' || content)
+        ) STORED
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE book_notes ADD COLUMN search_bigrams tsvector
+        GENERATED ALWAYS AS (
+            text_bigrams(chapter_title || ' ' || content)
+        ) STORED
+        """
+    )
+
+    op.create_index(
+        "idx_tils_search_bigrams",
+        "tils",
+        ["search_bigrams"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "idx_book_notes_search_bigrams",
+        "book_notes",
+        ["search_bigrams"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_book_notes_search_bigrams", table_name="book_notes")
+    op.drop_index("idx_tils_search_bigrams", table_name="tils")
+    op.drop_column("book_notes", "search_bigrams")
+    op.drop_column("tils", "search_bigrams")
+    op.execute("DROP FUNCTION text_bigrams(text)")
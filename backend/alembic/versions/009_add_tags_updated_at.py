@@ -0,0 +1,38 @@
+"""Add updated_at to tags
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Tags are embedded in TIL and note responses, so renames must change
+    # their ETags (see app.api.conditional)
+    op.add_column(
+        "tags",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.execute("UPDATE tags SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    op.drop_column("tags", "updated_at")
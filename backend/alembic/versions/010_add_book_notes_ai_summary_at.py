@@ -0,0 +1,36 @@
+"""Add ai_summary_at to book_notes
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # A summary is stale once the note is edited after it was written
+    # (see app.crud.book.get_stale_summary_notes)
+    op.add_column(
+        "book_notes",
+        sa.Column("ai_summary_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Existing summaries count as current for the note as it is now
+    op.execute(
+        "UPDATE book_notes SET ai_summary_at = updated_at WHERE ai_summary IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("book_notes", "ai_summary_at")
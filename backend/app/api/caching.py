@@ -0,0 +1,198 @@
+"""Response caching for public read endpoints.
+
+Cached entries are keyed by path and query string and carry labels naming
+the rows they were rendered from. Write endpoints register the labels they
+touch with ``invalidate_after_commit``; ``get_db`` drops the matching
+entries once the transaction has committed.
+
+Labels:
+
+- ``tils`` / ``tils:tag:<slug>``: TIL list pages, unfiltered / by tag
+- ``til:<id>``: TIL detail
+- ``books``: book list pages and reading stats
+- ``book:<id>``: book detail (with notes) and its note details
+- ``book:<id>:notes``: note list pages of a book
+- ``note:<id>``: note detail
+- ``tags``: tag list
+- ``tag:<id>``: any response embedding the tag
+"""
+
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.conditional import Validators, check_not_modified
+from app.api.serialization import dump_json, row_dict
+from app.cache import CachedResponse, response_cache
+from app.models import TIL, BookNote
+
+TILS = "tils"
+BOOKS = "books"
+TAGS = "tags"
+
+_PENDING_KEY = "response_cache_labels"
+
+
+def til_tag_page(tag_slug: str) -> str:
+    return f"tils:tag:{tag_slug}"
+
+
+def loaded(obj: Any, relationship: str) -> list[Any]:
+    """Related objects of obj, or [] if the relationship was not loaded.
+
+    Sparse fieldset queries leave unrequested relationships unloaded (and
+    set to raise on access); those are not part of the response either.
+    """
+    if relationship in inspect(obj).unloaded:
+        return []
+    return list(getattr(obj, relationship))
+
+
+def til_labels(til: TIL) -> set[str]:
+    """Labels of a rendered TIL (the TIL and its embedded tags)."""
+    return {f"til:{til.id}", *(f"tag:{tag.id}" for tag in loaded(til, "tags"))}
+
+
+def note_labels(note: BookNote) -> set[str]:
+    """Labels of a rendered note (the note, its book and embedded tags)."""
+    return {
+        f"note:{note.id}",
+        f"book:{note.book_id}",
+        *(f"tag:{tag.id}" for tag in loaded(note, "tags")),
+    }
+
+
+def til_write_labels(til: TIL, tag_slugs: Iterable[str] = ()) -> set[str]:
+    """Labels invalidated by creating, updating or deleting a TIL.
+
+    Args:
+        til: The written TIL.
+        tag_slugs: Extra tag pages to drop, e.g. tags removed by an update.
+    """
+    slugs = {tag.slug for tag in til.tags} | set(tag_slugs)
+    return {f"til:{til.id}", TILS, *(til_tag_page(slug) for slug in slugs)}
+
+
+def book_write_labels(book_id: Any) -> set[str]:
+    """Labels invalidated by writing a book or any of its notes."""
+    return {BOOKS, f"book:{book_id}", f"book:{book_id}:notes"}
+
+
+def note_write_labels(note: BookNote) -> set[str]:
+    """Labels invalidated by updating or deleting a note."""
+    return {f"note:{note.id}", *book_write_labels(note.book_id)}
+
+
+def tag_write_labels(tag_id: Any, *tag_slugs: str) -> set[str]:
+    """Labels invalidated by creating, renaming or deleting a tag."""
+    return {TAGS, f"tag:{tag_id}", *(til_tag_page(slug) for slug in tag_slugs)}
+
+
+def json_entry(model: BaseModel, labels: Iterable[str]) -> CachedResponse:
+    """Build a cache entry whose body is rendered on first use."""
+    return CachedResponse(lambda: model.model_dump_json().encode(), labels=labels)
+
+
+def page_entry(
+    item_schema: type[BaseModel],
+    rows: Iterable[Any],
+    labels: Iterable[str],
+    **page: Any,
+) -> CachedResponse:
+    """Build a cache entry for a list page rendered straight from ORM rows.
+
+    Args:
+        item_schema: Schema whose fields each item carries.
+        rows: Loaded ORM objects, one per item.
+        labels: Cache labels of the page.
+        **page: Pagination fields following items (total, page, ...).
+    """
+    body = {"items": [row_dict(item_schema, row) for row in rows], **page}
+    return CachedResponse(lambda: dump_json(body), labels=labels)
+
+
+def cache_key(request: Request) -> str:
+    """Cache key for a request: path plus normalized query string."""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def _with_validators(
+    load: Callable[[], Awaitable[CachedResponse]], validators: Optional[Validators]
+) -> Callable[[], Awaitable[CachedResponse]]:
+    async def load_with_validators() -> CachedResponse:
+        entry = await load()
+        if validators is not None:
+            entry.etag = validators.etag
+            entry.last_modified = validators.last_modified
+        return entry
+
+    return load_with_validators
+
+
+async def cached_response(
+    request: Request,
+    load: Callable[[], Awaitable[CachedResponse]],
+    validate: Optional[Callable[[], Awaitable[Optional[Validators]]]] = None,
+) -> Response:
+    """Serve a GET from the response cache, loading it on a miss.
+
+    Entries with validators answer conditional requests with 304. On a miss
+    (always, when the cache is disabled), validate runs first. It reads only
+    the id/updated_at of the rows behind the response, so a current
+    conditional request is answered 304 without running load. Otherwise the
+    validators are attached to the loaded entry. Computing them before the
+    body means a concurrent write can only leave the ETag older than the
+    body, which costs one refetch, never a stale 304.
+
+    Args:
+        request: Incoming request (cache key and conditional headers).
+        load: Coroutine function rendering the response entry.
+        validate: Coroutine function returning the response's validators,
+            or None if the resource does not exist (load then raises 404).
+
+    Returns:
+        JSON response with validator headers when available.
+    """
+    key = cache_key(request)
+    if validate is None:
+        entry = await response_cache.get_or_load(key, load)
+    else:
+        cached = await response_cache.get(key)
+        if cached is None:
+            validators = await validate()
+            if validators is not None:
+                check_not_modified(request, validators)
+            cached = await response_cache.get_or_load(
+                key, _with_validators(load, validators)
+            )
+        entry = cached
+    headers: Optional[dict[str, str]] = None
+    if entry.etag is not None:
+        validators = Validators(etag=entry.etag, last_modified=entry.last_modified)
+        check_not_modified(request, validators)
+        headers = validators.headers
+    return Response(
+        content=entry.content, media_type="application/json", headers=headers
+    )
+
+
+def invalidate_after_commit(db: AsyncSession, labels: Iterable[str]) -> None:
+    """Schedule cache invalidation for when the session's transaction commits.
+
+    Invalidating earlier would let a concurrent read cache the old rows again
+    before the write becomes visible.
+    """
+    db.info.setdefault(_PENDING_KEY, set()).update(labels)
+
+
+async def apply_pending_invalidations(db: AsyncSession) -> None:
+    """Invalidate labels registered on a session that has just committed."""
+    labels = db.info.pop(_PENDING_KEY, None)
+    if labels:
+        await response_cache.invalidate(labels)
@@ -0,0 +1,113 @@
+"""Conditional GET support for public read endpoints.
+
+Validators are derived from the ``id`` and ``updated_at`` of every row that
+contributes to a representation (e.g. a TIL and its tags), so a 304 can be
+answered before the response body is built.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, Request, status
+
+# Stored copies must be revalidated, which is cheap once validators exist
+CACHE_CONTROL = "no-cache"
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive timestamps (SQLite) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class Validators:
+    """Strong ETag and Last-Modified date of one representation."""
+
+    etag: str
+    last_modified: Optional[datetime]
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified, usegmt=True
+            )
+        return headers
+
+
+def make_validators(rows: Iterable[Any]) -> Validators:
+    """Build validators from the rows a representation is rendered from.
+
+    Args:
+        rows: ORM objects with ``id`` and ``updated_at`` attributes.
+
+    Returns:
+        Validators whose ETag changes whenever any row is updated, added or
+        removed. Last-Modified is the newest ``updated_at``; removals are
+        only reflected by the ETag.
+    """
+    digest = hashlib.sha256()
+    last_modified: Optional[datetime] = None
+    for row in rows:
+        updated_at = _as_utc(row.updated_at)
+        digest.update(f"{row.id}:{updated_at.isoformat()}\n".encode())
+        if last_modified is None or updated_at > last_modified:
+            last_modified = updated_at
+    return Validators(etag=f'"{digest.hexdigest()[:32]}"', last_modified=last_modified)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison against an If-None-Match header (RFC 9110 13.1.2)."""
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in header.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _not_modified_since(header: str, last_modified: Optional[datetime]) -> bool:
+    if last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError, IndexError):
+        return False
+    # HTTP dates have one-second resolution
+    return last_modified.replace(microsecond=0) <= _as_utc(since)
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """Check whether the client's cached copy is still current.
+
+    If-None-Match takes precedence; If-Modified-Since is only evaluated
+    when it is absent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validators.etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        return _not_modified_since(if_modified_since, validators.last_modified)
+    return False
+
+
+def check_not_modified(request: Request, validators: Validators) -> None:
+    """Answer 304 when the client's cached copy is current.
+
+    Call this before serializing the response body.
+
+    Raises:
+        HTTPException: 304 Not Modified (without a body) carrying the
+            validator headers.
+    """
+    if is_not_modified(request, validators):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=validators.headers,
+        )
@@ -2,10 +2,13 @@ from collections.abc import AsyncGenerator
 from typing import Annotated, Optional
 
 from fastapi import Depends, Header, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.api.caching import apply_pending_invalidations
 from app.config import settings
-from app.db.session import async_session_maker
+from app.db.session import async_session_maker, get_read_db, get_session_maker
+from app.schemas.common import parse_fields
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -14,6 +17,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
+            await apply_pending_invalidations(session)
         except Exception:
             await session.rollback()
             raise
@@ -31,6 +35,23 @@ async def get_current_admin(
     return True
 
 
+def selected_fields(
+    schema: type[BaseModel], fields: Optional[str]
+) -> Optional[frozenset[str]]:
+    """Parse the fields query parameter against schema (400 if invalid)."""
+    try:
+        return parse_fields(schema, fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
 # Type aliases for dependency injection
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
+SessionMaker = Annotated[
+    async_sessionmaker[AsyncSession], Depends(get_session_maker)
+]
 AdminAuth = Annotated[bool, Depends(get_current_admin)]
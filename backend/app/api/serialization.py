@@ -0,0 +1,74 @@
+"""Direct ORM-row to JSON rendering for list responses.
+
+Rows loaded through typed columns already hold the values a response schema
+would produce, so validating each one into a Pydantic model only copies it.
+``row_dict`` reads the schema's fields straight off a row (recursing into
+nested schemas such as tags) and ``dump_json`` encodes the result with
+orjson. The output is byte-for-byte what ``model_dump_json`` produces.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional, get_args, get_origin
+
+import orjson
+from pydantic import BaseModel
+
+# Pydantic renders UTC datetimes with a "Z" suffix
+_JSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+@dataclass(frozen=True)
+class _Field:
+    """How to read one schema field off a row."""
+
+    name: str
+    nested: Optional[type[BaseModel]] = None
+    many: bool = False
+
+
+def _nested_schema(annotation: Any) -> Optional[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+@lru_cache(maxsize=256)
+def _field_plan(schema: type[BaseModel]) -> tuple[_Field, ...]:
+    """Fields of schema in declaration (= serialization) order."""
+    plan = []
+    for name, info in schema.model_fields.items():
+        annotation = info.annotation
+        if get_origin(annotation) is list:
+            nested = _nested_schema(get_args(annotation)[0])
+            plan.append(_Field(name, nested, many=nested is not None))
+        else:
+            plan.append(_Field(name, _nested_schema(annotation)))
+    return tuple(plan)
+
+
+def row_dict(schema: type[BaseModel], row: Any) -> dict[str, Any]:
+    """Read the fields of schema off an ORM object without validating them.
+
+    Args:
+        schema: Response schema whose fields to read.
+        row: Loaded ORM object (every field of schema must be loaded).
+
+    Returns:
+        Plain dict with the schema's fields, ready for dump_json.
+    """
+    data: dict[str, Any] = {}
+    for field in _field_plan(schema):
+        value = getattr(row, field.name)
+        if field.nested is not None and value is not None:
+            if field.many:
+                value = [row_dict(field.nested, item) for item in value]
+            else:
+                value = row_dict(field.nested, value)
+        data[field.name] = value
+    return data
+
+
+def dump_json(data: Any) -> bytes:
+    """Encode plain data (dicts, lists, UUIDs, datetimes) as JSON bytes."""
+    return orjson.dumps(data, option=_JSON_OPTIONS)
@@ -0,0 +1,103 @@
+"""Server-Sent Events responses."""
+
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable Nginx proxy buffering
+}
+
+# Comment line: ignored by clients, but keeps idle connections open
+HEARTBEAT = ": keep-alive\n\n"
+
+
+def sse_message(event: str, data: Any, id: Optional[int] = None) -> str:
+    """Format one SSE message with a JSON data line.
+
+    Args:
+        event: Event name.
+        data: JSON-serializable payload.
+        id: Event ID; clients send the last one they received back as the
+            Last-Event-ID header when reconnecting.
+    """
+    message = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    if id is not None:
+        message = f"id: {id}\n{message}"
+    return message
+
+
+def parse_last_event_id(value: Optional[str]) -> int:
+    """Sequence number from a Last-Event-ID header (0 when absent or invalid)."""
+    if not value:
+        return 0
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return 0
+
+
+async def with_heartbeat(
+    messages: AsyncIterator[str], interval: float
+) -> AsyncIterator[str]:
+    """Pass messages through, adding a heartbeat after interval idle seconds.
+
+    Proxies and load balancers close connections that stay silent too long,
+    e.g. while the model is thinking before its first token.
+    """
+    iterator = aiter(messages)
+    next_message: Optional[asyncio.Future[str]] = None
+    try:
+        while True:
+            if next_message is None:
+                next_message = asyncio.ensure_future(anext(iterator))
+            done, _ = await asyncio.wait({next_message}, timeout=interval)
+            if not done:
+                yield HEARTBEAT
+                continue
+            try:
+                message = next_message.result()
+            except StopAsyncIteration:
+                return
+            next_message = None
+            yield message
+    finally:
+        if next_message is not None and not next_message.done():
+            next_message.cancel()
+            with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                await next_message
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def sse_response(
+    messages: AsyncIterator[str],
+    headers: Optional[dict[str, str]] = None,
+    heartbeat: Optional[float] = None,
+) -> StreamingResponse:
+    """Stream formatted SSE messages without proxy buffering.
+
+    Args:
+        messages: Formatted messages (see sse_message).
+        headers: Extra response headers.
+        heartbeat: Idle seconds between heartbeats (default
+            SSE_HEARTBEAT_SECONDS; 0 disables them).
+    """
+    if heartbeat is None:
+        heartbeat = settings.SSE_HEARTBEAT_SECONDS
+    if heartbeat > 0:
+        messages = with_heartbeat(messages, heartbeat)
+    return StreamingResponse(
+        messages,
+        media_type="text/event-stream",
+        headers={**SSE_HEADERS, **(headers or {})},
+    )
@@ -1,11 +1,33 @@
 """Book and BookNote API endpoints."""
 
+from collections.abc import AsyncIterator
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
-
-from app.api.deps import AdminAuth, DbSession
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.api.caching import (
+    BOOKS,
+    book_write_labels,
+    cached_response,
+    invalidate_after_commit,
+    json_entry,
+    loaded,
+    note_labels,
+    note_write_labels,
+    page_entry,
+)
+from app.api.conditional import Validators, make_validators
+from app.api.deps import (
+    AdminAuth,
+    DbSession,
+    ReadDbSession,
+    SessionMaker,
+    selected_fields,
+)
+from app.api.sse import sse_message, sse_response
+from app.cache import CachedResponse
 from app.crud import book_crud
 from app.schemas import (
     BookCreate,
@@ -13,12 +35,15 @@ from app.schemas import (
     BookNoteCreate,
     BookNoteListResponse,
     BookNoteResponse,
+    BookNoteSummaryResponse,
     BookNoteUpdate,
     BookResponse,
     BookUpdate,
     BookWithNotesResponse,
+    ListView,
     ReadingStatsResponse,
 )
+from app.schemas.common import partial_schema
 
 router = APIRouter(prefix="/books", tags=["books"])
 
@@ -28,83 +53,122 @@ router = APIRouter(prefix="/books", tags=["books"])
 
 @router.get("", response_model=BookListResponse)
 async def list_books(
-    db: DbSession,
+    db: ReadDbSession,
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
     status_filter: Optional[str] = Query(
         None, alias="status", description="Filter by status: reading, completed, on_hold"
     ),
-) -> BookListResponse:
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from a previous page (overrides page)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated item fields to return"
+    ),
+) -> Response:
     """Get paginated book list.
 
     - Supports pagination with page and size parameters
+    - Supports keyset pagination with the cursor parameter (next_cursor)
     - Filter by status (reading, completed, on_hold)
+    - fields=slug,title returns items with only those fields
     - Ordered by updated_at descending
+    - Cached until any book or note is written
     """
-    skip = (page - 1) * size
-    books, total = await book_crud.get_books(
-        db,
-        skip=skip,
-        limit=size,
-        status=status_filter,
-    )
+    selected = selected_fields(BookResponse, fields)
+
+    async def load() -> CachedResponse:
+        skip = (page - 1) * size
+        try:
+            books, total = await book_crud.get_books(
+                db,
+                skip=skip,
+                limit=size,
+                status=status_filter,
+                cursor=cursor,
+                fields=selected,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
+
+        pages = (total + size - 1) // size if total > 0 else 0
+        next_cursor = (
+            book_crud.get_book_cursor(books[-1]) if len(books) == size else None
+        )
 
-    pages = (total + size - 1) // size if total > 0 else 0
-
-    # Add computed fields
-    items = []
-    for book in books:
-        book_dict = BookResponse.model_validate(book).model_dump()
-        notes_count = len(book.notes) if book.notes else 0
-        # Count published notes for progress
-        published_notes = len([n for n in (book.notes or []) if n.is_published])
-        progress = (
-            (published_notes / book.total_chapters * 100)
-            if book.total_chapters > 0
-            else 0.0
+        item_schema = (
+            partial_schema(BookResponse, selected) if selected else BookResponse
         )
-        book_dict["notes_count"] = notes_count
-        book_dict["progress"] = min(progress, 100.0)
-        items.append(BookResponse(**book_dict))
-
-    return BookListResponse(
-        items=items,
-        total=total,
-        page=page,
-        size=size,
-        pages=pages,
-    )
+        return page_entry(
+            item_schema,
+            books,
+            labels={BOOKS},
+            total=total,
+            page=page,
+            size=size,
+            pages=pages,
+            next_cursor=next_cursor,
+        )
+
+    return await cached_response(request, load)
 
 
 @router.get("/stats", response_model=ReadingStatsResponse)
-async def get_reading_stats(db: DbSession) -> ReadingStatsResponse:
+async def get_reading_stats(db: DbSession, request: Request) -> Response:
     """Get reading statistics."""
-    return await book_crud.get_reading_stats(db)
+
+    async def load() -> CachedResponse:
+        stats = await book_crud.get_reading_stats(db)
+        return json_entry(ReadingStatsResponse.model_validate(stats), labels={BOOKS})
+
+    return await cached_response(request, load)
 
 
 @router.get("/{slug}", response_model=BookWithNotesResponse)
-async def get_book(db: DbSession, slug: str) -> BookWithNotesResponse:
-    """Get book by slug with notes."""
-    book = await book_crud.get_book_by_slug(db, slug)
-    if not book:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Book not found",
-        )
+async def get_book(
+    db: ReadDbSession,
+    request: Request,
+    slug: str,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return"
+    ),
+) -> Response:
+    """Get book by slug with notes.
 
-    # Build response with computed fields
-    book_dict = BookWithNotesResponse.model_validate(book).model_dump()
-    notes_count = len(book.notes) if book.notes else 0
-    published_notes = len([n for n in (book.notes or []) if n.is_published])
-    progress = (
-        (published_notes / book.total_chapters * 100)
-        if book.total_chapters > 0
-        else 0.0
+    Supports conditional requests (If-None-Match / If-Modified-Since).
+    """
+    selected = selected_fields(BookWithNotesResponse, fields)
+    schema = (
+        partial_schema(BookWithNotesResponse, selected)
+        if selected
+        else BookWithNotesResponse
     )
-    book_dict["notes_count"] = notes_count
-    book_dict["progress"] = min(progress, 100.0)
 
-    return BookWithNotesResponse(**book_dict)
+    async def load() -> CachedResponse:
+        book = await book_crud.get_book_by_slug(
+            db, slug, with_notes=True, fields=selected
+        )
+        if not book:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Book not found",
+            )
+
+        notes = loaded(book, "notes")
+        labels = {f"book:{book.id}"}
+        for note in notes:
+            labels |= note_labels(note)
+        return json_entry(schema.model_validate(book), labels=labels)
+
+    async def validate() -> Optional[Validators]:
+        rows = await book_crud.get_book_versions(db, slug)
+        return make_validators(rows) if rows else None
+
+    return await cached_response(request, load, validate)
 
 
 @router.post("", response_model=BookResponse, status_code=status.HTTP_201_CREATED)
@@ -115,10 +179,8 @@ async def create_book(
 ) -> BookResponse:
     """Create a new book (admin only)."""
     book = await book_crud.create_book(db, book_in)
-    book_dict = BookResponse.model_validate(book).model_dump()
-    book_dict["notes_count"] = 0
-    book_dict["progress"] = 0.0
-    return BookResponse(**book_dict)
+    invalidate_after_commit(db, book_write_labels(book.id))
+    return BookResponse.model_validate(book)
 
 
 @router.put("/{book_id}", response_model=BookResponse)
@@ -136,18 +198,8 @@ async def update_book(
             detail="Book not found",
         )
     book = await book_crud.update_book(db, book, book_in)
-
-    book_dict = BookResponse.model_validate(book).model_dump()
-    notes_count = len(book.notes) if book.notes else 0
-    published_notes = len([n for n in (book.notes or []) if n.is_published])
-    progress = (
-        (published_notes / book.total_chapters * 100)
-        if book.total_chapters > 0
-        else 0.0
-    )
-    book_dict["notes_count"] = notes_count
-    book_dict["progress"] = min(progress, 100.0)
-    return BookResponse(**book_dict)
+    invalidate_after_commit(db, book_write_labels(book.id))
+    return BookResponse.model_validate(book)
 
 
 @router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -163,6 +215,7 @@ async def delete_book(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Book not found",
         )
+    invalidate_after_commit(db, book_write_labels(book.id))
     await book_crud.delete_book(db, book)
 
 
@@ -171,66 +224,126 @@ async def delete_book(
 
 @router.get("/{book_slug}/notes", response_model=BookNoteListResponse)
 async def list_book_notes(
-    db: DbSession,
+    db: ReadDbSession,
+    request: Request,
     book_slug: str,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
     published: Optional[bool] = Query(None, description="Filter by published status"),
     tag: Optional[str] = Query(None, description="Filter by tag slug"),
     q: Optional[str] = Query(None, description="Search query"),
-) -> BookNoteListResponse:
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from a previous page (overrides page)"
+    ),
+    view: ListView = Query(
+        "full",
+        description="full, or summary (items without content, key_takeaways "
+        "and questions)",
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated item fields to return (overrides view)"
+    ),
+) -> Response:
     """Get paginated notes for a book with search/filter."""
-    book = await book_crud.get_book_by_slug(db, book_slug)
-    if not book:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Book not found",
+    selected = selected_fields(BookNoteResponse, fields)
+
+    async def load() -> CachedResponse:
+        book = await book_crud.get_book_by_slug(db, book_slug)
+        if not book:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Book not found",
+            )
+
+        skip = (page - 1) * size
+        try:
+            notes, total = await book_crud.get_book_notes(
+                db,
+                book_id=book.id,
+                skip=skip,
+                limit=size,
+                is_published=published,
+                tag_slug=tag,
+                search_query=q,
+                cursor=cursor,
+                summary=view == "summary",
+                fields=selected,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
+
+        pages = (total + size - 1) // size if total > 0 else 0
+        next_cursor = (
+            book_crud.get_book_note_cursor(notes[-1]) if len(notes) == size else None
         )
 
-    skip = (page - 1) * size
-    notes, total = await book_crud.get_book_notes(
-        db,
-        book_id=book.id,
-        skip=skip,
-        limit=size,
-        is_published=published,
-        tag_slug=tag,
-        search_query=q,
-    )
+        labels = {f"book:{book.id}:notes"}
+        for note in notes:
+            labels |= note_labels(note)
+        if selected:
+            item_schema = partial_schema(BookNoteResponse, selected)
+        else:
+            item_schema = (
+                BookNoteSummaryResponse if view == "summary" else BookNoteResponse
+            )
+        return page_entry(
+            item_schema,
+            notes,
+            labels=labels,
+            total=total,
+            page=page,
+            size=size,
+            pages=pages,
+            next_cursor=next_cursor,
+        )
 
-    pages = (total + size - 1) // size if total > 0 else 0
-
-    return BookNoteListResponse(
-        items=[BookNoteResponse.model_validate(note) for note in notes],
-        total=total,
-        page=page,
-        size=size,
-        pages=pages,
-    )
+    return await cached_response(request, load)
 
 
 @router.get("/{book_slug}/notes/{note_slug}", response_model=BookNoteResponse)
 async def get_book_note(
-    db: DbSession,
+    db: ReadDbSession,
+    request: Request,
     book_slug: str,
     note_slug: str,
-) -> BookNoteResponse:
-    """Get a specific note by slug."""
-    book = await book_crud.get_book_by_slug(db, book_slug)
-    if not book:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Book not found",
-        )
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return"
+    ),
+) -> Response:
+    """Get a specific note by slug.
 
-    note = await book_crud.get_book_note_by_slug(db, note_slug)
-    if not note or note.book_id != book.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Note not found",
-        )
+    Supports conditional requests (If-None-Match / If-Modified-Since).
+    """
+    selected = selected_fields(BookNoteResponse, fields)
+    schema = (
+        partial_schema(BookNoteResponse, selected) if selected else BookNoteResponse
+    )
 
-    return BookNoteResponse.model_validate(note)
+    async def load() -> CachedResponse:
+        book = await book_crud.get_book_by_slug(db, book_slug)
+        if not book:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Book not found",
+            )
+
+        note = await book_crud.get_book_note_by_slug(db, note_slug, fields=selected)
+        if not note or note.book_id != book.id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Note not found",
+            )
+
+        return json_entry(schema.model_validate(note), labels=note_labels(note))
+
+    async def validate() -> Optional[Validators]:
+        rows = await book_crud.get_book_note_versions(db, book_slug, note_slug)
+        return make_validators(rows) if rows else None
+
+    return await cached_response(request, load, validate)
 
 
 @router.post(
@@ -253,6 +366,7 @@ async def create_book_note(
         )
 
     note = await book_crud.create_book_note(db, book, note_in)
+    invalidate_after_commit(db, book_write_labels(book.id))
     return BookNoteResponse.model_validate(note)
 
 
@@ -280,6 +394,7 @@ async def update_book_note(
         )
 
     note = await book_crud.update_book_note(db, note, note_in)
+    invalidate_after_commit(db, note_write_labels(note))
     return BookNoteResponse.model_validate(note)
 
 
@@ -305,10 +420,40 @@ async def delete_book_note(
             detail="Note not found",
         )
 
+    invalidate_after_commit(db, note_write_labels(note))
     await book_crud.delete_book_note(db, note)
 
 
-# ============ AI Summary Endpoint ============
+# ============ AI Summary Endpoints ============
+
+
+@router.post("/notes/summarize")
+async def summarize_stale_notes(
+    session_maker: SessionMaker,
+    _: AdminAuth,
+    concurrency: Optional[int] = Query(
+        None, ge=1, le=32, description="Concurrent LLM calls"
+    ),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Maximum number of notes to summarize"
+    ),
+) -> StreamingResponse:
+    """Summarize every note with a missing or stale AI summary (admin only).
+
+    Progress is streamed as SSE events (start, note, note_error, progress,
+    complete). Results are saved batch by batch, so an interrupted run can
+    be resumed by calling this endpoint again. Notes edited while their
+    summary was being generated are not saved and are reported as stale.
+    """
+    from app.services.ai.bulk_summary import summarize_stale_notes
+
+    async def event_generator() -> AsyncIterator[str]:
+        async for event in summarize_stale_notes(
+            session_maker, concurrency=concurrency, limit=limit
+        ):
+            yield sse_message(event["event"], event["data"])
+
+    return sse_response(event_generator())
 
 
 @router.post("/{book_slug}/notes/{note_id}/summarize", response_model=BookNoteResponse)
@@ -317,6 +462,7 @@ async def generate_ai_summary(
     _: AdminAuth,
     book_slug: str,
     note_id: UUID,
+    force: bool = Query(False, description="Bypass the LLM generation cache"),
 ) -> BookNoteResponse:
     """Generate AI summary for a book note (admin only)."""
     from app.schemas.book import BookNoteUpdate
@@ -340,12 +486,14 @@ async def generate_ai_summary(
     summary = await generate_book_note_summary(
         content=note.content,
         key_takeaways=note.key_takeaways or [],
+        force=force,
     )
 
     # Update the note with the summary
     note = await book_crud.update_book_note(
         db, note, BookNoteUpdate(ai_summary=summary)
     )
+    invalidate_after_commit(db, note_write_labels(note))
 
     return BookNoteResponse.model_validate(note)
 
@@ -1,20 +1,44 @@
 """AI TIL 생성 API 엔드포인트"""
 
-import json
-from typing import Optional
+from datetime import datetime
+from typing import Annotated, Any, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, HTTPException, Header, Query, Request, status
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, ConfigDict, Field
+from starlette.datastructures import UploadFile
 
 from app.api.deps import AdminAuth, DbSession
-from app.services.ai.generator import TILGenerator
+from app.api.sse import parse_last_event_id, sse_message, sse_response
+from app.jobs import job_queue
+from app.services.ai.generator import TILGenerator, generate_til_job
+from app.services.content.extractors.file import FileExtractor, FileTooLargeError
+from app.services.content.extractors.url import ContentProcessor
 from app.crud import til as til_crud
 
 
 router = APIRouter(prefix="/generate", tags=["generate"])
 
+# multipart 경계와 파트 헤더, 파일 외 필드에 허용하는 여유분
+UPLOAD_OVERHEAD = 64 * 1024
+
+# 폼을 핸들러에서 직접 파싱하므로 OpenAPI 문서에 요청 본문을 따로 명시
+_UPLOAD_OPENAPI: dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
 
 # ============================================================
 # Schemas
@@ -32,6 +56,10 @@ class GenerateRequest(BaseModel):
         description="텍스트 내용 또는 URL (input_type이 'file'이 아닐 때 필수)",
         min_length=1
     )
+    force: bool = Field(
+        False,
+        description="true면 생성 캐시를 무시하고 새로 생성",
+    )
 
 
 class GeneratePreviewResponse(BaseModel):
@@ -47,6 +75,91 @@ class NextDayResponse(BaseModel):
     next_day_number: int
 
 
+class JobResponse(BaseModel):
+    """생성 작업 상태"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    kind: str
+    status: str = Field(..., description="queued, running, succeeded, failed")
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+async def _read_upload(file: UploadFile) -> str:
+    """업로드 파일을 검증하고 텍스트로 변환"""
+    # 파일 확장자 검증
+    if not file.filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="파일명이 없습니다."
+        )
+    
+    ext = "." + file.filename.rsplit(".", 1)[-1].lower()
+    supported_extensions = {".md", ".markdown", ".txt", ".mdx"}
+    
+    if ext not in supported_extensions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(supported_extensions)}"
+        )
+    
+    # 파일 내용은 작업 파라미터로 저장할 수 있도록 요청 안에서 텍스트로 변환
+    # (청크 단위로 한 번만 읽으며 크기 제한을 넘는 즉시 디코딩 중단)
+    try:
+        text = await ContentProcessor().process(input_type="file", file=file)
+    except FileTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=str(e),
+        ) from e
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return text
+
+
+async def _submit_generation(
+    input_type: str, content: str, force: bool
+) -> UUID:
+    """TIL 생성 작업 제출 (같은 입력의 진행 중인 작업이 있으면 그 작업 ID)"""
+    try:
+        return await job_queue.submit(
+            "til_generate",
+            generate_til_job,
+            {"input_type": input_type, "content": content, "force": force},
+        )
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="작업 큐가 실행 중이 아닙니다.",
+        ) from e
+
+
+def _job_stream(job_id: UUID, after: int = 0) -> StreamingResponse:
+    """작업 이벤트를 SSE로 전송 (after번째 이후 이벤트부터)
+
+    각 이벤트에는 작업 안에서 1부터 증가하는 `id`가 붙어 있어, 재연결 시
+    `Last-Event-ID`로 이어받을 수 있습니다. 클라이언트 연결이 끊겨도 작업은
+    계속 실행됩니다.
+    """
+    async def event_generator():
+        yield sse_message("job", {"job_id": str(job_id)})
+        async for seq, event in job_queue.events(job_id, after):
+            yield sse_message(event["event"], event["data"], id=seq)
+
+    return sse_response(event_generator(), headers={"X-Job-Id": str(job_id)})
+
+
 # ============================================================
 # Endpoints
 # ============================================================
@@ -63,40 +176,81 @@ async def get_next_day_number(
 
 @router.post("/stream")
 async def generate_stream(
-    db: DbSession,
     _: AdminAuth,
     request: GenerateRequest,
-):
+) -> StreamingResponse:
     """SSE를 통해 실시간으로 TIL을 생성합니다.
 
+    생성은 백그라운드 작업으로 실행되므로 연결이 끊겨도 계속 진행되며,
+    `GET /generate/jobs/{job_id}/events`로 다시 연결할 수 있습니다.
+    같은 입력으로 진행 중인 작업이 있으면 새로 생성하지 않고 그 작업에 연결합니다.
+    `job` 외의 이벤트에는 `id`가 붙고, 응답이 없는 동안에는 주기적으로
+    `: keep-alive` 주석이 전송됩니다.
+
     ## SSE 이벤트
+    - `job`: { "job_id": "..." } (첫 이벤트, `X-Job-Id` 헤더와 동일, id 없음)
     - `day_number`: { "day_number": 15 }
     - `content_chunk`: { "chunk": "..." } (반복)
     - `title`: { "title": "생성된 제목" }
     - `excerpt`: { "excerpt": "생성된 요약" }
+      (제목과 요약은 동시에 생성되며 먼저 완료된 쪽이 먼저 전송됨)
     - `complete`: { "success": true, "day_number": 15, "title": "...", "excerpt": "...", "content": "..." }
     - `error`: { "error": "에러 메시지" }
+
+    같은 입력으로 이미 생성한 적이 있으면 캐시된 결과를 청크로 재생합니다
+    (`force: true`로 무시 가능).
     """
-    generator = TILGenerator(db)
+    if request.input_type == "file":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="파일은 /generate/upload로 업로드하세요.",
+        )
+    if not request.content:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="content가 필요합니다.",
+        )
 
-    async def event_generator():
-        async for event in generator.stream_generate(
-            input_type=request.input_type,
-            content=request.content,
-        ):
-            event_type = event["event"]
-            event_data = json.dumps(event["data"], ensure_ascii=False)
-            yield f"event: {event_type}\ndata: {event_data}\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Nginx 프록시 버퍼링 비활성화
-        }
+    job_id = await _submit_generation(
+        request.input_type, request.content, request.force
     )
+    return _job_stream(job_id)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(
+    _: AdminAuth,
+    job_id: UUID,
+) -> JobResponse:
+    """생성 작업의 상태와 결과를 반환합니다."""
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+    return JobResponse.model_validate(job)
+
+
+@router.get("/jobs/{job_id}/events")
+async def get_job_events(
+    _: AdminAuth,
+    job_id: UUID,
+    last_event_id: Annotated[Optional[str], Header()] = None,
+) -> StreamingResponse:
+    """생성 작업의 이벤트 스트림에 (다시) 연결합니다.
+
+    이 프로세스에서 실행 중이거나 최근 끝난 작업은 버퍼에 있는 이벤트를
+    재생한 뒤 이어서 전송합니다. `Last-Event-ID` 헤더가 있으면 그 id 이후의
+    이벤트부터, 없으면 처음부터 보냅니다. 그 밖의 작업은 끝날 때까지 기다린 뒤
+    최종 `complete` 또는 `error` 이벤트만 전송합니다.
+    """
+    if await job_queue.get(job_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+    return _job_stream(job_id, parse_last_event_id(last_event_id))
 
 
 @router.post("/preview", response_model=GeneratePreviewResponse)
@@ -105,8 +259,12 @@ async def generate_preview(
     _: AdminAuth,
     request: GenerateRequest,
 ) -> GeneratePreviewResponse:
-    """TIL을 생성하고 미리보기를 반환합니다 (비스트리밍)."""
-    generator = TILGenerator(db)
+    """TIL을 생성하고 미리보기를 반환합니다 (비스트리밍).
+
+    같은 입력으로 이미 생성한 적이 있으면 캐시된 결과를 바로 반환합니다
+    (`force: true`로 무시 가능).
+    """
+    generator = TILGenerator(db, force=request.force)
     
     try:
         result = await generator.generate(
@@ -121,62 +279,43 @@ async def generate_preview(
         )
 
 
-@router.post("/upload")
+@router.post("/upload", openapi_extra=_UPLOAD_OPENAPI)
 async def generate_from_file(
-    db: DbSession,
     _: AdminAuth,
-    file: UploadFile = File(...),
-):
+    request: Request,
+    force: bool = Query(False, description="true면 생성 캐시를 무시하고 새로 생성"),
+    content_length: Optional[int] = Header(None, include_in_schema=False),
+) -> StreamingResponse:
     """업로드된 마크다운 파일로부터 TIL을 생성합니다.
     
     지원 형식: .md, .markdown, .txt, .mdx
     최대 파일 크기: 10MB
+
+    `/generate/stream`과 같이 백그라운드 작업으로 실행되며 같은 SSE 이벤트를 보냅니다.
+
+    UploadFile 파라미터로 받으면 핸들러 실행 전에 업로드 전체가 스풀되므로,
+    Content-Length를 먼저 확인해 너무 큰 요청은 본문을 읽기 전에 413으로
+    거부하고 폼은 그 다음에 직접 파싱합니다. Content-Length가 없는 (chunked)
+    요청은 스풀된 뒤 디코딩 단계에서 거부됩니다.
     """
-    # 파일 확장자 검증
-    if not file.filename:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="파일명이 없습니다."
-        )
-    
-    ext = "." + file.filename.rsplit(".", 1)[-1].lower()
-    supported_extensions = {".md", ".markdown", ".txt", ".mdx"}
-    
-    if ext not in supported_extensions:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(supported_extensions)}"
-        )
-    
-    # 파일 크기 검증
-    MAX_SIZE = 10 * 1024 * 1024  # 10MB
-    content = await file.read()
-    if len(content) > MAX_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"파일 크기는 {MAX_SIZE // 1024 // 1024}MB를 초과할 수 없습니다",
-        )
-    
-    # 파일 포인터 되감기 (processor에서 다시 읽을 수 있도록)
-    await file.seek(0)
-    
-    generator = TILGenerator(db)
-    
-    async def event_generator():
-        async for event in generator.stream_generate(
-            input_type="file",
-            file=file,
-        ):
-            event_type = event["event"]
-            event_data = json.dumps(event["data"], ensure_ascii=False)
-            yield f"event: {event_type}\ndata: {event_data}\n\n"
-    
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Nginx 프록시 버퍼링 비활성화
-        }
-    )
+    if content_length is not None:
+        try:
+            FileExtractor().check_size(content_length - UPLOAD_OVERHEAD)
+        except FileTooLargeError as e:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=str(e),
+            ) from e
+
+    async with request.form(max_files=1, max_fields=1) as form:
+        file = form.get("file")
+        if not isinstance(file, UploadFile):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="file 필드가 필요합니다.",
+            )
+        text = await _read_upload(file)
+
+    job_id = await _submit_generation("text", text, force)
+    return _job_stream(job_id)
+
@@ -0,0 +1,48 @@
+"""Search API endpoints."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Query
+
+from app.api.deps import ReadDbSession
+from app.crud import search_crud
+from app.crud.search import SearchMode
+from app.schemas import SearchResponse, SearchResult
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    db: ReadDbSession,
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    type_filter: Optional[str] = Query(
+        None,
+        alias="type",
+        pattern="^(til|book_note)$",
+        description="Restrict to one content type: til, book_note",
+    ),
+    mode: SearchMode = Query(
+        "auto",
+        description="fulltext (word match), ngram (substring, Korean-friendly) "
+        "or auto (ngram when the query contains Hangul)",
+    ),
+    limit: int = Query(20, ge=1, le=50, description="Maximum number of results"),
+) -> SearchResponse:
+    """Full-text search across published TILs and book notes.
+
+    - Ranked by relevance (ts_rank on PostgreSQL)
+    - Korean queries use the character-bigram index by default
+    - Each result includes a highlighted snippet
+    """
+    results = await search_crud.search(
+        db,
+        q,
+        types=[type_filter] if type_filter else None,
+        mode=mode,
+        limit=limit,
+    )
+    return SearchResponse(
+        query=q,
+        items=[SearchResult.model_validate(result) for result in results],
+    )
@@ -1,26 +1,57 @@
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
-
-from app.api.deps import AdminAuth, DbSession
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+
+from app.api.caching import (
+    TAGS,
+    cached_response,
+    invalidate_after_commit,
+    tag_write_labels,
+)
+from app.api.conditional import Validators, make_validators
+from app.api.deps import AdminAuth, DbSession, ReadDbSession, selected_fields
+from app.api.serialization import dump_json, row_dict
+from app.cache import CachedResponse
 from app.crud import tag_crud
 from app.schemas import TagCreate, TagResponse, TagUpdate
+from app.schemas.common import partial_schema
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
 
 @router.get("", response_model=list[TagResponse])
-async def list_tags(db: DbSession) -> list[TagResponse]:
+async def list_tags(
+    db: ReadDbSession,
+    request: Request,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return"
+    ),
+) -> Response:
     """Get all tags.
 
+    Supports conditional requests (If-None-Match / If-Modified-Since).
+
     Args:
         db: Database session.
+        request: Incoming request (cache key and conditional headers).
+        fields: Comma-separated subset of tag fields to return.
 
     Returns:
         List of all tags sorted alphabetically.
     """
-    tags = await tag_crud.get_tags(db)
-    return [TagResponse.model_validate(tag) for tag in tags]
+    selected = selected_fields(TagResponse, fields)
+    item_schema = partial_schema(TagResponse, selected) if selected else TagResponse
+
+    async def load() -> CachedResponse:
+        tags = await tag_crud.get_tags(db, fields=selected)
+        body = [row_dict(item_schema, tag) for tag in tags]
+        return CachedResponse(lambda: dump_json(body), labels={TAGS})
+
+    async def validate() -> Optional[Validators]:
+        return make_validators(await tag_crud.get_tag_versions(db))
+
+    return await cached_response(request, load, validate)
 
 
 @router.post("", response_model=TagResponse, status_code=status.HTTP_201_CREATED)
@@ -36,6 +67,7 @@ async def create_tag(
     """
     try:
         tag = await tag_crud.create_tag(db, tag_in)
+        invalidate_after_commit(db, tag_write_labels(tag.id, tag.slug))
         return TagResponse.model_validate(tag)
     except ValueError as e:
         raise HTTPException(
@@ -63,8 +95,10 @@ async def update_tag(
             detail="Tag not found",
         )
 
+    old_slug = tag.slug
     try:
         tag = await tag_crud.update_tag(db, tag, tag_in)
+        invalidate_after_commit(db, tag_write_labels(tag.id, old_slug, tag.slug))
         return TagResponse.model_validate(tag)
     except ValueError as e:
         raise HTTPException(
@@ -90,4 +124,5 @@ async def delete_tag(
             detail="Tag not found",
         )
 
+    invalidate_after_commit(db, tag_write_labels(tag.id, tag.slug))
     await tag_crud.delete_tag(db, tag)
@@ -3,60 +3,152 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel
 
-from app.api.deps import AdminAuth, DbSession
+from app.api.caching import (
+    TILS,
+    cached_response,
+    invalidate_after_commit,
+    json_entry,
+    page_entry,
+    til_labels,
+    til_tag_page,
+    til_write_labels,
+)
+from app.api.conditional import Validators, make_validators
+from app.api.deps import AdminAuth, DbSession, ReadDbSession, selected_fields
+from app.cache import CachedResponse
 from app.crud import til_crud
-from app.schemas import TILCreate, TILListResponse, TILResponse, TILUpdate
+from app.models import TIL
+from app.schemas import (
+    ListView,
+    TILCreate,
+    TILListResponse,
+    TILResponse,
+    TILSummaryResponse,
+    TILUpdate,
+)
+from app.schemas.common import partial_schema
 
 router = APIRouter(prefix="/tils", tags=["tils"])
 
 
+def _til_schema(selected: Optional[frozenset[str]]) -> type[BaseModel]:
+    """Response schema for a TIL, narrowed to the selected fields."""
+    return partial_schema(TILResponse, selected) if selected else TILResponse
+
+
+def _til_entry(til: TIL, selected: Optional[frozenset[str]]) -> CachedResponse:
+    """Cache entry for a TIL detail response."""
+    return json_entry(_til_schema(selected).model_validate(til), labels=til_labels(til))
+
+
 @router.get("", response_model=TILListResponse)
 async def list_tils(
-    db: DbSession,
+    db: ReadDbSession,
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
     tag: Optional[str] = Query(None, description="Filter by tag slug"),
     published: Optional[bool] = Query(None, description="Filter by published status"),
-) -> TILListResponse:
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from a previous page (overrides page)"
+    ),
+    view: ListView = Query(
+        "full", description="full, or summary (items without Markdown content)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated item fields to return (overrides view)"
+    ),
+) -> Response:
     """Get paginated TIL list.
 
     - Supports pagination with page and size parameters
+    - Supports keyset pagination with the cursor parameter (next_cursor)
     - Filter by tag slug
     - Filter by published status
+    - view=summary returns slim items without content
+    - fields=slug,title returns items with only those fields
     - Ordered by day_number descending (latest first)
+    - Cached until a TIL on the list (or its tag page) is written
     """
-    skip = (page - 1) * size
-    tils, total = await til_crud.get_tils(
-        db,
-        skip=skip,
-        limit=size,
-        tag_slug=tag,
-        is_published=published,
-    )
-
-    pages = (total + size - 1) // size if total > 0 else 0
-
-    return TILListResponse(
-        items=[TILResponse.model_validate(til) for til in tils],
-        total=total,
-        page=page,
-        size=size,
-        pages=pages,
-    )
+    selected = selected_fields(TILResponse, fields)
 
+    async def load() -> CachedResponse:
+        skip = (page - 1) * size
+        try:
+            tils, total = await til_crud.get_tils(
+                db,
+                skip=skip,
+                limit=size,
+                tag_slug=tag,
+                is_published=published,
+                cursor=cursor,
+                summary=view == "summary",
+                fields=selected,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
 
-@router.get("/day/{day_number}", response_model=TILResponse)
-async def get_til_by_day(db: DbSession, day_number: int) -> TILResponse:
-    """Get TIL by day number."""
-    til = await til_crud.get_til_by_day_number(db, day_number)
-    if not til:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"TIL for day {day_number} not found",
+        pages = (total + size - 1) // size if total > 0 else 0
+        next_cursor = (
+            til_crud.get_til_cursor(tils[-1]) if len(tils) == size else None
+        )
+
+        labels = {til_tag_page(tag) if tag else TILS}
+        for til in tils:
+            labels |= til_labels(til)
+        if selected:
+            item_schema = _til_schema(selected)
+        else:
+            item_schema = TILSummaryResponse if view == "summary" else TILResponse
+        return page_entry(
+            item_schema,
+            tils,
+            labels=labels,
+            total=total,
+            page=page,
+            size=size,
+            pages=pages,
+            next_cursor=next_cursor,
         )
-    return TILResponse.model_validate(til)
+
+    return await cached_response(request, load)
+
+
+@router.get("/day/{day_number}", response_model=TILResponse)
+async def get_til_by_day(
+    db: ReadDbSession,
+    request: Request,
+    day_number: int,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return"
+    ),
+) -> Response:
+    """Get TIL by day number.
+
+    Supports conditional requests (If-None-Match / If-Modified-Since).
+    """
+    selected = selected_fields(TILResponse, fields)
+
+    async def load() -> CachedResponse:
+        til = await til_crud.get_til_by_day_number(db, day_number, fields=selected)
+        if not til:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"TIL for day {day_number} not found",
+            )
+        return _til_entry(til, selected)
+
+    async def validate() -> Optional[Validators]:
+        rows = await til_crud.get_til_versions(db, day_number=day_number)
+        return make_validators(rows) if rows else None
+
+    return await cached_response(request, load, validate)
 
 
 @router.get("/id/{til_id}", response_model=TILResponse)
@@ -76,15 +168,34 @@ async def get_til_by_id(
 
 
 @router.get("/{slug}", response_model=TILResponse)
-async def get_til(db: DbSession, slug: str) -> TILResponse:
-    """Get TIL by slug."""
-    til = await til_crud.get_til_by_slug(db, slug)
-    if not til:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="TIL not found",
-        )
-    return TILResponse.model_validate(til)
+async def get_til(
+    db: ReadDbSession,
+    request: Request,
+    slug: str,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return"
+    ),
+) -> Response:
+    """Get TIL by slug.
+
+    Supports conditional requests (If-None-Match / If-Modified-Since).
+    """
+    selected = selected_fields(TILResponse, fields)
+
+    async def load() -> CachedResponse:
+        til = await til_crud.get_til_by_slug(db, slug, fields=selected)
+        if not til:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="TIL not found",
+            )
+        return _til_entry(til, selected)
+
+    async def validate() -> Optional[Validators]:
+        rows = await til_crud.get_til_versions(db, slug=slug)
+        return make_validators(rows) if rows else None
+
+    return await cached_response(request, load, validate)
 
 
 @router.post("", response_model=TILResponse, status_code=status.HTTP_201_CREATED)
@@ -107,6 +218,7 @@ async def create_til(
         )
 
     til = await til_crud.create_til(db, til_in)
+    invalidate_after_commit(db, til_write_labels(til))
     return TILResponse.model_validate(til)
 
 
@@ -138,7 +250,9 @@ async def update_til(
                 detail=f"TIL for day {til_in.day_number} already exists",
             )
 
+    old_tag_slugs = [tag.slug for tag in til.tags]
     til = await til_crud.update_til(db, til, til_in)
+    invalidate_after_commit(db, til_write_labels(til, old_tag_slugs))
     return TILResponse.model_validate(til)
 
 
@@ -155,4 +269,5 @@ async def delete_til(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="TIL not found",
         )
+    invalidate_after_commit(db, til_write_labels(til))
     await til_crud.delete_til(db, til)
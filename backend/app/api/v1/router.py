@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import books, generate, tags, tils
+from app.api.v1.endpoints import books, generate, search, tags, tils
 
 api_router = APIRouter()
 
@@ -8,3 +8,4 @@ api_router.include_router(books.router)
 api_router.include_router(tags.router)
 api_router.include_router(tils.router)
 api_router.include_router(generate.router)
+api_router.include_router(search.router)
@@ -0,0 +1,58 @@
+"""Response cache for public read endpoints, plus the on-disk LRU store."""
+
+from typing import Optional
+
+from app.cache.base import BaseCacheBackend, CachedResponse
+from app.cache.disk import DiskLRUStore
+from app.cache.memory import MemoryCacheBackend
+from app.cache.response import ResponseCache
+from app.config import settings
+
+
+def get_cache_backend(backend_type: str) -> Optional[BaseCacheBackend]:
+    """Create the cache backend named by RESPONSE_CACHE_BACKEND.
+
+    "auto" resolves to "redis" when RESPONSE_CACHE_REDIS_URL is set and to
+    "none" otherwise, so a multi-worker deploy never gets a per-process cache
+    by default.
+
+    Returns:
+        Backend instance, or None when caching is disabled ("none").
+
+    Raises:
+        ValueError: If the backend type is unknown, or "redis" is selected
+            without RESPONSE_CACHE_REDIS_URL.
+    """
+    if backend_type == "auto":
+        backend_type = "redis" if settings.RESPONSE_CACHE_REDIS_URL else "none"
+    if backend_type == "none":
+        return None
+    if backend_type == "memory":
+        return MemoryCacheBackend(
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            ttl=settings.RESPONSE_CACHE_TTL,
+        )
+    if backend_type == "redis":
+        if not settings.RESPONSE_CACHE_REDIS_URL:
+            raise ValueError(
+                "RESPONSE_CACHE_BACKEND=redis needs RESPONSE_CACHE_REDIS_URL"
+            )
+        from app.cache.redis import RedisCacheBackend
+
+        return RedisCacheBackend(
+            settings.RESPONSE_CACHE_REDIS_URL, ttl=settings.RESPONSE_CACHE_TTL
+        )
+    raise ValueError(f"Unsupported response cache backend: {backend_type}")
+
+
+response_cache = ResponseCache(get_cache_backend(settings.RESPONSE_CACHE_BACKEND))
+
+__all__ = [
+    "BaseCacheBackend",
+    "CachedResponse",
+    "DiskLRUStore",
+    "MemoryCacheBackend",
+    "ResponseCache",
+    "get_cache_backend",
+    "response_cache",
+]
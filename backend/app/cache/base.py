@@ -0,0 +1,60 @@
+"""Response cache entry and backend interface."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Optional, Union
+
+
+class CachedResponse:
+    """A rendered JSON response plus what is needed to revalidate/invalidate it.
+
+    The body may be given as a render callable; it is rendered on first
+    access, so a conditional request answered with 304 never serializes it.
+    """
+
+    def __init__(
+        self,
+        content: Union[bytes, Callable[[], bytes]],
+        *,
+        labels: Iterable[str] = (),
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+    ) -> None:
+        self._content = content
+        self.labels = frozenset(labels)
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def content(self) -> bytes:
+        if callable(self._content):
+            self._content = self._content()
+        return self._content
+
+
+class BaseCacheBackend(ABC):
+    """Storage for cached responses, indexed by key and by label.
+
+    Labels name the data an entry was rendered from (e.g. "til:<id>"), so a
+    write can drop exactly the entries that embed it.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the live entry for key, or None."""
+
+    @abstractmethod
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        """Store entry under key, replacing any previous entry."""
+
+    @abstractmethod
+    async def invalidate(self, labels: Iterable[str]) -> int:
+        """Drop every entry carrying any of labels; return how many."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop all entries."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release backend resources (nothing to release by default)."""
@@ -0,0 +1,115 @@
+"""Size-bounded LRU store of byte blobs on the local disk.
+
+Shared by the on-disk caches (LLM generations, fetched URL pages). Entries
+live at <directory>/<first 2 key chars>/<key>.json; reads bump the file
+mtime, and once the total size passes max_bytes the least recently used
+files are deleted. The store is synchronous and thread-safe, so callers on
+the event loop run it through asyncio.to_thread.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskLRUStore:
+    """Byte blobs keyed by hex digest, evicted least recently used first."""
+
+    def __init__(self, directory: str, max_bytes: int, name: str = "disk cache"):
+        """
+        Args:
+            directory: Root directory of the entries.
+            max_bytes: Total size above which old entries are deleted.
+            name: Cache name used in log messages.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.name = name
+        self._size: Optional[int] = None  # computed from disk on first write
+        self._lock = threading.Lock()
+
+    def path(self, key: str) -> Path:
+        """File holding the entry for key."""
+        return self.directory / key[:2] / f"{key}.json"
+
+    def read(self, key: str) -> Optional[bytes]:
+        """Return the stored bytes and mark them recently used (None if missing)."""
+        path = self.path(key)
+        try:
+            body = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError:
+            logger.warning("Unreadable %s entry %s", self.name, path, exc_info=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return body
+
+    def write(self, key: str, body: bytes) -> None:
+        """Store body under key, then evict if over max_bytes.
+
+        Entries larger than max_bytes on their own are not stored. Write
+        failures are logged, never raised.
+        """
+        if len(body) > self.max_bytes:
+            return
+        path = self.path(key)
+        try:
+            previous = path.stat().st_size  # overwriting replaces, not adds
+        except OSError:
+            previous = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so readers never see a half-written file
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning(
+                "Failed to write %s entry %s", self.name, path, exc_info=True
+            )
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += len(body) - previous
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every entry."""
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            total -= size
+        self._size = total
@@ -0,0 +1,72 @@
+"""In-process LRU response cache with TTL."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Optional
+
+from app.cache.base import BaseCacheBackend, CachedResponse
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """Bounded LRU of cached responses, local to the current process."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (expires_at, entry), least recently used first
+        self._entries: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+        # label -> keys of entries carrying it
+        self._labels: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at <= self._clock():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        self._remove(key)
+        self._entries[key] = (self._clock() + self.ttl, entry)
+        for label in entry.labels:
+            self._labels.setdefault(label, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    async def invalidate(self, labels: Iterable[str]) -> int:
+        keys: set[str] = set()
+        for label in labels:
+            keys |= self._labels.get(label, set())
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._labels.clear()
+
+    def _remove(self, key: str) -> None:
+        item = self._entries.pop(key, None)
+        if item is None:
+            return
+        for label in item[1].labels:
+            keys = self._labels.get(label)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._labels[label]
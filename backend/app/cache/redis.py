@@ -0,0 +1,107 @@
+"""Redis-backed response cache, shared by all worker processes.
+
+Requires the optional ``redis`` package (``pip install redis``).
+"""
+
+import json
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, Optional
+
+from app.cache.base import BaseCacheBackend, CachedResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _dump(entry: CachedResponse) -> bytes:
+    meta = {
+        "labels": sorted(entry.labels),
+        "etag": entry.etag,
+        "last_modified": (
+            entry.last_modified.isoformat() if entry.last_modified else None
+        ),
+    }
+    return json.dumps(meta).encode() + b"\n" + entry.content
+
+
+def _load(payload: bytes) -> CachedResponse:
+    meta_line, content = payload.split(b"\n", 1)
+    meta = json.loads(meta_line)
+    last_modified = meta["last_modified"]
+    return CachedResponse(
+        content,
+        labels=meta["labels"],
+        etag=meta["etag"],
+        last_modified=datetime.fromisoformat(last_modified) if last_modified else None,
+    )
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """Cached responses in Redis with per-label key sets.
+
+    Redis errors are logged and treated as cache misses, so an unavailable
+    server degrades to uncached responses instead of failing requests.
+    """
+
+    def __init__(self, url: str, ttl: int, prefix: str = "blog:response:") -> None:
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis requires the 'redis' package"
+            ) from e
+
+        self._redis: Any = redis.from_url(url)
+        self._error: type[Exception] = redis.RedisError
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.prefix}entry:{key}"
+
+    def _label_key(self, label: str) -> str:
+        return f"{self.prefix}label:{label}"
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            payload = await self._redis.get(self._entry_key(key))
+        except self._error:
+            logger.warning("Response cache read failed", exc_info=True)
+            return None
+        return _load(payload) if payload is not None else None
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        entry_key = self._entry_key(key)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(entry_key, _dump(entry), ex=self.ttl)
+                for label in entry.labels:
+                    # Label sets outlive their entries by at most one TTL
+                    pipe.sadd(self._label_key(label), entry_key)
+                    pipe.expire(self._label_key(label), self.ttl)
+                await pipe.execute()
+        except self._error:
+            logger.warning("Response cache write failed", exc_info=True)
+
+    async def invalidate(self, labels: Iterable[str]) -> int:
+        label_keys = [self._label_key(label) for label in labels]
+        if not label_keys:
+            return 0
+        try:
+            entry_keys: set[bytes] = set()
+            for label_key in label_keys:
+                entry_keys |= await self._redis.smembers(label_key)
+            await self._redis.delete(*entry_keys, *label_keys)
+        except self._error:
+            logger.error("Response cache invalidation failed", exc_info=True)
+            return 0
+        return len(entry_keys)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._redis.scan_iter(f"{self.prefix}*")]
+        if keys:
+            await self._redis.delete(*keys)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
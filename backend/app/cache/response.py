@@ -0,0 +1,95 @@
+"""Response cache front-end with request coalescing."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Optional
+
+from app.cache.base import BaseCacheBackend, CachedResponse
+
+
+class ResponseCache:
+    """Read-through cache for rendered responses.
+
+    Concurrent misses for the same key share a single load, so a cold key
+    under load costs one database query per process. Entries loaded while an
+    invalidation happened are returned but not stored, since they may have
+    been read before the write committed.
+    """
+
+    def __init__(self, backend: Optional[BaseCacheBackend]) -> None:
+        self.backend = backend
+        self._inflight: dict[str, asyncio.Future[CachedResponse]] = {}
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached entry for key without loading it on a miss."""
+        if self.backend is None:
+            return None
+        return await self.backend.get(key)
+
+    async def get_or_load(
+        self, key: str, load: Callable[[], Awaitable[CachedResponse]]
+    ) -> CachedResponse:
+        """Return the cached entry for key, loading and storing it on a miss.
+
+        Args:
+            key: Cache key.
+            load: Coroutine function producing the entry. Exceptions (e.g. a
+                404 HTTPException) are shared with coalesced callers and
+                never cached.
+
+        Returns:
+            Cached or freshly loaded entry.
+        """
+        if self.backend is None:
+            return await load()
+
+        entry = await self.backend.get(key)
+        if entry is not None:
+            return entry
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[CachedResponse] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            entry = await load()
+            if generation == self._generation:
+                await self.backend.set(key, entry)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here when nobody else was waiting
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(entry)
+            return entry
+        finally:
+            del self._inflight[key]
+
+    async def invalidate(self, labels: Iterable[str]) -> int:
+        """Drop cached entries carrying any of labels."""
+        self._generation += 1
+        if self.backend is None:
+            return 0
+        return await self.backend.invalidate(labels)
+
+    async def clear(self) -> None:
+        self._generation += 1
+        if self.backend is not None:
+            await self.backend.clear()
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
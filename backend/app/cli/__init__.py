@@ -0,0 +1 @@
+"""Command-line maintenance tasks (run with ``python -m app.cli.<task>``)."""
@@ -0,0 +1,62 @@
+"""Summarize every book note with a missing or stale AI summary.
+
+Usage: python -m app.cli.summarize_notes [--concurrency 4] [--limit N]
+
+Summaries are saved batch by batch; if the run is interrupted, running the
+command again continues with the notes that are still unsummarized.
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import Optional
+
+from app.db.session import async_session_maker, dispose_engines
+from app.services.ai.bulk_summary import summarize_stale_notes
+from app.services.ai.providers import close_llm_providers
+
+
+async def main(
+    concurrency: Optional[int],
+    tokens_per_minute: Optional[int],
+    batch_size: Optional[int],
+    limit: Optional[int],
+) -> None:
+    """Run the bulk summarization and print its progress."""
+    try:
+        async for event in summarize_stale_notes(
+            async_session_maker,
+            concurrency=concurrency,
+            tokens_per_minute=tokens_per_minute,
+            batch_size=batch_size,
+            limit=limit,
+        ):
+            data = event["data"]
+            if event["event"] == "start":
+                print(f"{data['total']} notes to summarize")
+            elif event["event"] == "note_error":
+                print(f"  failed {data['id']}: {data['error']}")
+            elif event["event"] in ("progress", "complete"):
+                print(
+                    f"{event['event']}: {data['saved']} saved, "
+                    f"{data['failed']} failed, {data['stale']} stale "
+                    f"of {data['total']}"
+                )
+    finally:
+        await close_llm_providers()
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, help="Concurrent LLM calls")
+    parser.add_argument(
+        "--tokens-per-minute", type=int, help="Estimated LLM token budget"
+    )
+    parser.add_argument("--batch-size", type=int, help="Notes saved per UPDATE")
+    parser.add_argument("--limit", type=int, help="Maximum notes to summarize")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(
+        main(args.concurrency, args.tokens_per_minute, args.batch_size, args.limit)
+    )
@@ -1,9 +1,11 @@
 from app.crud import book as book_crud
+from app.crud import search as search_crud
 from app.crud import tag as tag_crud
 from app.crud import til as til_crud
 
 __all__ = [
     "book_crud",
+    "search_crud",
     "tag_crud",
     "til_crud",
 ]
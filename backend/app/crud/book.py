@@ -1,15 +1,45 @@
 """CRUD operations for Book and BookNote models."""
 
+from collections.abc import Collection
 from datetime import date, datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Row,
+    Select,
+    Table,
+    bindparam,
+    case,
+    cast,
+    func,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    defer,
+    raiseload,
+    selectinload,
+    with_expression,
+)
+from sqlalchemy.sql.base import ExecutableOption
 
+from app.config import settings
+from app.crud.fields import field_load_options
+from app.crud.search import note_search_filter
+from app.crud.slug import add_with_unique_slug
+from app.crud.versions import get_versions
 from app.models import Tag
-from app.models.book import Book, BookNote
+from app.models.book import Book, BookNote, book_note_tag_association
+from app.models.stats import READING_STATS_ID, ReadingStats
 from app.schemas.book import (
     BookCreate,
     BookNoteCreate,
@@ -17,15 +47,62 @@ from app.schemas.book import (
     BookUpdate,
     ReadingStatsResponse,
 )
-from app.utils.slug import generate_slug
+from app.utils.cursor import decode_cursor, encode_cursor
+
+# Sort keys used for keyset pagination
+# Book: (updated_at, id), BookNote: (reading_date, created_at, id)
+_BOOK_CURSOR_TYPES = (datetime.fromisoformat, UUID)
+_NOTE_CURSOR_TYPES = (date.fromisoformat, datetime.fromisoformat, UUID)
+
+# Computed Book fields filled in by _with_note_counts
+_BOOK_COUNT_FIELDS = frozenset({"notes_count", "progress"})
 
 # ============ Book CRUD ============
 
 
-async def get_existing_book_slugs(db: AsyncSession) -> list[str]:
-    """Get all existing Book slugs."""
-    result = await db.execute(select(Book.slug))
-    return list(result.scalars().all())
+def _with_note_counts(query: Select[Book]) -> Select[Book]:
+    """Attach notes_count and progress as correlated aggregate subqueries.
+
+    Each count only visits the notes of the book on its row (through
+    idx_book_notes_book_id), so a page of books never aggregates the whole
+    book_notes table. Only book_id and is_published are read from
+    book_notes, so note bodies are never fetched.
+    """
+    def per_book(column: ColumnElement[Any]) -> ColumnElement[Any]:
+        return (
+            select(column)
+            .where(BookNote.book_id == Book.id)
+            .correlate(Book)
+            .scalar_subquery()
+        )
+
+    published_count = func.count(BookNote.id).filter(BookNote.is_published.is_(True))
+    percent = cast(published_count * 100.0 / Book.total_chapters, Float)
+    progress = case(
+        (Book.total_chapters <= 0, 0.0),
+        (percent > 100.0, 100.0),
+        else_=percent,
+    )
+
+    return query.options(
+        with_expression(Book.notes_count, per_book(func.count(BookNote.id))),
+        with_expression(Book.progress, per_book(progress)),
+    )
+
+
+def _book_query(fields: Optional[Collection[str]]) -> Select[Book]:
+    """Select books without notes, narrowed to a sparse fieldset if given.
+
+    The note-count subqueries are only added when their fields are wanted.
+    """
+    if fields is None:
+        return _with_note_counts(select(Book).options(raiseload(Book.notes)))
+    query = select(Book).options(
+        *field_load_options(Book, fields, always=[Book.updated_at])
+    )
+    if _BOOK_COUNT_FIELDS.isdisjoint(fields):
+        return query
+    return _with_note_counts(query)
 
 
 async def get_books(
@@ -34,45 +111,93 @@ async def get_books(
     skip: int = 0,
     limit: int = 10,
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Collection[str]] = None,
 ) -> tuple[list[Book], int]:
-    """Get Book list with pagination and filtering."""
-    query = select(Book).options(selectinload(Book.notes))
+    """Get Book list with pagination and filtering.
+
+    When a cursor is given, skip is ignored and the page starts right after
+    the item the cursor points to. Raises ValueError for a malformed cursor.
+    With fields, only those response fields (plus updated_at) are loaded.
+    """
+    query = _book_query(fields)
     count_query = select(func.count(Book.id))
 
     if status:
         query = query.where(Book.status == status)
         count_query = count_query.where(Book.status == status)
 
-    query = query.order_by(Book.updated_at.desc())
-    query = query.offset(skip).limit(limit)
+    query = query.order_by(Book.updated_at.desc(), Book.id.desc())
+
+    if cursor:
+        after = decode_cursor(cursor, _BOOK_CURSOR_TYPES)
+        query = query.where(tuple_(Book.updated_at, Book.id) < after)
+    else:
+        query = query.offset(skip)
+    query = query.limit(limit)
 
     result = await db.execute(query)
     count_result = await db.execute(count_query)
 
-    return list(result.scalars().unique().all()), count_result.scalar() or 0
+    return list(result.scalars().all()), count_result.scalar() or 0
 
 
-async def get_book_by_id(db: AsyncSession, book_id: UUID) -> Optional[Book]:
-    """Get Book by ID."""
-    result = await db.execute(
-        select(Book).options(selectinload(Book.notes)).where(Book.id == book_id)
+def get_book_cursor(book: Book) -> str:
+    """Build the keyset cursor pointing just after the given Book."""
+    return encode_cursor(book.updated_at, book.id)
+
+
+async def get_book_versions(db: AsyncSession, slug: str) -> list[Row[UUID, datetime]]:
+    """Get id and updated_at of a book, its notes and their tags.
+
+    Nothing else is loaded. Returns [] if the book does not exist.
+    """
+    book_id = select(Book.id).where(Book.slug == slug).scalar_subquery()
+    note_ids = select(BookNote.id).where(BookNote.book_id == book_id)
+    tag_ids = select(book_note_tag_association.c.tag_id).where(
+        book_note_tag_association.c.book_note_id.in_(note_ids)
     )
+    return await get_versions(
+        db,
+        select(Book.id, Book.updated_at).where(Book.id == book_id),
+        select(BookNote.id, BookNote.updated_at).where(BookNote.book_id == book_id),
+        select(Tag.id, Tag.updated_at).where(Tag.id.in_(tag_ids)),
+    )
+
+
+async def get_book_by_id(db: AsyncSession, book_id: UUID) -> Optional[Book]:
+    """Get Book by ID with note counts (notes are not loaded)."""
+    query = select(Book).options(raiseload(Book.notes)).where(Book.id == book_id)
+    result = await db.execute(_with_note_counts(query))
     return result.scalar_one_or_none()
 
 
-async def get_book_by_slug(db: AsyncSession, slug: str) -> Optional[Book]:
-    """Get Book by slug."""
-    result = await db.execute(
-        select(Book).options(selectinload(Book.notes)).where(Book.slug == slug)
-    )
+async def get_book_by_slug(
+    db: AsyncSession,
+    slug: str,
+    *,
+    with_notes: bool = False,
+    fields: Optional[Collection[str]] = None,
+) -> Optional[Book]:
+    """Get Book by slug with note counts.
+
+    Notes are only loaded when with_notes is True. With fields, only those
+    response fields (plus updated_at) are loaded and with_notes is ignored:
+    notes are loaded if "notes" is one of the fields.
+    """
+    if fields is None:
+        notes_option = (
+            selectinload(Book.notes) if with_notes else raiseload(Book.notes)
+        )
+        query = _with_note_counts(select(Book).options(notes_option))
+    else:
+        query = _book_query(fields)
+    result = await db.execute(query.where(Book.slug == slug))
     return result.scalar_one_or_none()
 
 
 async def create_book(db: AsyncSession, book_in: BookCreate) -> Book:
     """Create a new Book."""
-    existing_slugs = await get_existing_book_slugs(db)
-    slug = generate_slug(book_in.title, existing_slugs)
-
     book = Book(
         title=book_in.title,
         author=book_in.author,
@@ -80,18 +205,20 @@ async def create_book(db: AsyncSession, book_in: BookCreate) -> Book:
         total_chapters=book_in.total_chapters,
         status=book_in.status,
         start_date=book_in.start_date or date.today(),
-        slug=slug,
     )
 
-    db.add(book)
-    await db.flush()
-    await db.refresh(book, ["notes"])
+    await add_with_unique_slug(db, book, book_in.title)
+    await _bump_reading_stats(db, total_books=1, **_status_deltas(None, book.status))
+    await db.refresh(book)
+    book.notes_count = 0
+    book.progress = 0.0
     return book
 
 
 async def update_book(db: AsyncSession, book: Book, book_in: BookUpdate) -> Book:
     """Update an existing Book."""
     update_data = book_in.model_dump(exclude_unset=True)
+    old_status = book.status
 
     # Auto-set end_date when completing
     if update_data.get("status") == "completed" and not book.end_date:
@@ -101,12 +228,31 @@ async def update_book(db: AsyncSession, book: Book, book_in: BookUpdate) -> Book
         setattr(book, field, value)
 
     await db.flush()
-    await db.refresh(book, ["notes"])
-    return book
+    if book.status != old_status:
+        await _bump_reading_stats(db, **_status_deltas(old_status, book.status))
+
+    # Reload so notes_count/progress reflect the new total_chapters
+    query = (
+        select(Book)
+        .options(raiseload(Book.notes))
+        .where(Book.id == book.id)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(_with_note_counts(query))
+    return result.scalar_one()
 
 
 async def delete_book(db: AsyncSession, book: Book) -> None:
     """Delete a Book (cascades to notes)."""
+    book_notes = select(func.count(BookNote.id)).where(BookNote.book_id == book.id)
+    month_notes = book_notes.where(BookNote.reading_date >= ReadingStats.month_start)
+    await _bump_reading_stats(
+        db,
+        total_books=-1,
+        total_notes=-book_notes.scalar_subquery(),
+        notes_this_month=-month_notes.scalar_subquery(),
+        **_status_deltas(book.status, None),
+    )
     await db.delete(book)
     await db.flush()
 
@@ -114,10 +260,13 @@ async def delete_book(db: AsyncSession, book: Book) -> None:
 # ============ BookNote CRUD ============
 
 
-async def get_existing_book_note_slugs(db: AsyncSession) -> list[str]:
-    """Get all existing BookNote slugs."""
-    result = await db.execute(select(BookNote.slug))
-    return list(result.scalars().all())
+def _note_load_options(
+    fields: Optional[Collection[str]], *always: InstrumentedAttribute[Any]
+) -> list[ExecutableOption]:
+    """Loader options for a BookNote query, narrowed to a sparse fieldset."""
+    if fields is None:
+        return [selectinload(BookNote.tags)]
+    return field_load_options(BookNote, fields, always=always)
 
 
 async def get_book_notes(
@@ -129,11 +278,32 @@ async def get_book_notes(
     is_published: Optional[bool] = None,
     tag_slug: Optional[str] = None,
     search_query: Optional[str] = None,
+    cursor: Optional[str] = None,
+    summary: bool = False,
+    fields: Optional[Collection[str]] = None,
 ) -> tuple[list[BookNote], int]:
-    """Get BookNote list with pagination and filtering."""
-    query = select(BookNote).options(selectinload(BookNote.tags))
+    """Get BookNote list with pagination and filtering.
+
+    When a cursor is given, skip is ignored and the page starts right after
+    the item the cursor points to. Raises ValueError for a malformed cursor.
+    With summary, the large text columns (content, key_takeaways, questions)
+    are not loaded. With fields, only those response fields (plus the sort
+    keys and book_id) are loaded and summary is ignored.
+    """
+    query = select(BookNote).options(
+        *_note_load_options(
+            fields, BookNote.reading_date, BookNote.created_at, BookNote.book_id
+        )
+    )
     count_query = select(func.count(BookNote.id))
 
+    if summary and fields is None:
+        query = query.options(
+            defer(BookNote.content, raiseload=True),
+            defer(BookNote.key_takeaways, raiseload=True),
+            defer(BookNote.questions, raiseload=True),
+        )
+
     if book_id:
         query = query.where(BookNote.book_id == book_id)
         count_query = count_query.where(BookNote.book_id == book_id)
@@ -146,19 +316,26 @@ async def get_book_notes(
         query = query.join(BookNote.tags).where(Tag.slug == tag_slug)
         count_query = count_query.join(BookNote.tags).where(Tag.slug == tag_slug)
 
-    if search_query:
-        search_pattern = f"%{search_query}%"
+    if search_query and search_query.strip():
+        # Full-text index match instead of a sequential ILIKE scan
+        search_filter = note_search_filter(db, search_query)
+        query = query.where(search_filter)
+        count_query = count_query.where(search_filter)
+
+    query = query.order_by(
+        BookNote.reading_date.desc(),
+        BookNote.created_at.desc(),
+        BookNote.id.desc(),
+    )
+
+    if cursor:
+        after = decode_cursor(cursor, _NOTE_CURSOR_TYPES)
         query = query.where(
-            BookNote.chapter_title.ilike(search_pattern)
-            | BookNote.content.ilike(search_pattern)
-        )
-        count_query = count_query.where(
-            BookNote.chapter_title.ilike(search_pattern)
-            | BookNote.content.ilike(search_pattern)
+            tuple_(BookNote.reading_date, BookNote.created_at, BookNote.id) < after
         )
-
-    query = query.order_by(BookNote.reading_date.desc(), BookNote.created_at.desc())
-    query = query.offset(skip).limit(limit)
+    else:
+        query = query.offset(skip)
+    query = query.limit(limit)
 
     result = await db.execute(query)
     count_result = await db.execute(count_query)
@@ -166,6 +343,11 @@ async def get_book_notes(
     return list(result.scalars().unique().all()), count_result.scalar() or 0
 
 
+def get_book_note_cursor(note: BookNote) -> str:
+    """Build the keyset cursor pointing just after the given BookNote."""
+    return encode_cursor(note.reading_date, note.created_at, note.id)
+
+
 async def get_book_note_by_id(db: AsyncSession, note_id: UUID) -> Optional[BookNote]:
     """Get BookNote by ID."""
     result = await db.execute(
@@ -176,23 +358,53 @@ async def get_book_note_by_id(db: AsyncSession, note_id: UUID) -> Optional[BookN
     return result.scalar_one_or_none()
 
 
-async def get_book_note_by_slug(db: AsyncSession, slug: str) -> Optional[BookNote]:
-    """Get BookNote by slug."""
+async def get_book_note_by_slug(
+    db: AsyncSession, slug: str, *, fields: Optional[Collection[str]] = None
+) -> Optional[BookNote]:
+    """Get BookNote by slug.
+
+    With fields, only those response fields (plus updated_at and book_id)
+    are loaded.
+    """
     result = await db.execute(
         select(BookNote)
-        .options(selectinload(BookNote.tags))
+        .options(
+            *_note_load_options(fields, BookNote.updated_at, BookNote.book_id)
+        )
         .where(BookNote.slug == slug)
     )
     return result.scalar_one_or_none()
 
 
+async def get_book_note_versions(
+    db: AsyncSession, book_slug: str, slug: str
+) -> list[Row[UUID, datetime]]:
+    """Get id and updated_at of a book's note and its tags without loading them.
+
+    Returns [] if the note does not exist or belongs to another book.
+    """
+    note_id = (
+        select(BookNote.id)
+        .join(Book, Book.id == BookNote.book_id)
+        .where(Book.slug == book_slug, BookNote.slug == slug)
+        .scalar_subquery()
+    )
+    return await get_versions(
+        db,
+        select(BookNote.id, BookNote.updated_at).where(BookNote.id == note_id),
+        select(Tag.id, Tag.updated_at)
+        .join(
+            book_note_tag_association,
+            book_note_tag_association.c.tag_id == Tag.id,
+        )
+        .where(book_note_tag_association.c.book_note_id == note_id),
+    )
+
+
 async def create_book_note(
     db: AsyncSession, book: Book, note_in: BookNoteCreate
 ) -> BookNote:
     """Create a new BookNote."""
-    existing_slugs = await get_existing_book_note_slugs(db)
-    slug = generate_slug(note_in.chapter_title, existing_slugs)
-
     # Get tags
     tags: list[Tag] = []
     if note_in.tag_ids:
@@ -210,12 +422,17 @@ async def create_book_note(
         reading_date=note_in.reading_date or date.today(),
         is_published=note_in.is_published,
         published_at=datetime.now(timezone.utc) if note_in.is_published else None,
-        slug=slug,
-        tags=tags,
+        tags=[],
     )
 
-    db.add(note)
+    # Insert with a unique slug generated from the chapter title, then link
+    # tags (same order as create_til, so a retried insert only redoes the note)
+    await add_with_unique_slug(db, note, note_in.chapter_title)
+    note.tags = tags
     await db.flush()
+    await _bump_reading_stats(
+        db, total_notes=1, notes_this_month=_in_stats_month(note.reading_date)
+    )
     await db.refresh(note, ["tags"])
     return note
 
@@ -225,6 +442,7 @@ async def update_book_note(
 ) -> BookNote:
     """Update an existing BookNote."""
     update_data = note_in.model_dump(exclude_unset=True)
+    old_reading_date = note.reading_date
 
     # Handle tag update
     if "tag_ids" in update_data:
@@ -233,6 +451,10 @@ async def update_book_note(
             result = await db.execute(select(Tag).where(Tag.id.in_(tag_ids)))
             note.tags = list(result.scalars().all())
 
+    # A summary written now is current for the note as updated here
+    if "ai_summary" in update_data:
+        note.ai_summary_at = note.updated_at = datetime.now(timezone.utc)
+
     # Handle publish status change
     if "is_published" in update_data:
         if update_data["is_published"] and not note.is_published:
@@ -244,12 +466,122 @@ async def update_book_note(
         setattr(note, field, value)
 
     await db.flush()
+    if note.reading_date != old_reading_date:
+        await _bump_reading_stats(
+            db,
+            notes_this_month=_in_stats_month(note.reading_date)
+            - _in_stats_month(old_reading_date),
+        )
     await db.refresh(note, ["tags"])
     return note
 
 
+def _stale_summary_filter() -> ColumnElement[bool]:
+    """Notes without an AI summary, or edited since it was written."""
+    return or_(
+        BookNote.ai_summary.is_(None),
+        BookNote.ai_summary_at.is_(None),
+        BookNote.updated_at > BookNote.ai_summary_at,
+    )
+
+
+async def count_stale_summary_notes(db: AsyncSession) -> int:
+    """Count notes whose AI summary is missing or stale."""
+    result = await db.execute(
+        select(func.count(BookNote.id)).where(_stale_summary_filter())
+    )
+    return result.scalar() or 0
+
+
+async def get_stale_summary_notes(
+    db: AsyncSession, *, after_id: Optional[UUID] = None, limit: int = 20
+) -> list[BookNote]:
+    """Get the next notes (by id) whose AI summary is missing or stale.
+
+    Only the columns needed to summarize a note and invalidate its cached
+    responses are loaded. Paging by id lets a batch job move past notes that
+    failed without retrying them in the same run.
+    """
+    query = (
+        select(BookNote)
+        .options(
+            *field_load_options(
+                BookNote,
+                {"content", "key_takeaways"},
+                always=[BookNote.book_id, BookNote.updated_at],
+            )
+        )
+        .where(_stale_summary_filter())
+        .order_by(BookNote.id)
+        .limit(limit)
+    )
+    if after_id is not None:
+        query = query.where(BookNote.id > after_id)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+async def bulk_update_summaries(
+    db: AsyncSession, notes: Collection[BookNote], summaries: dict[UUID, str]
+) -> set[UUID]:
+    """Write AI summaries for many notes in one executemany UPDATE.
+
+    A summary is only written if the note's updated_at still equals the
+    value loaded with it, so a note edited while its summary was being
+    generated is skipped and stays stale. updated_at is kept as is, so the
+    note stays ordered where it was and the new summary is not itself
+    considered stale.
+
+    Args:
+        db: Database session.
+        notes: Notes the summaries were generated from (updated_at loaded).
+        summaries: Summary text by note id.
+
+    Returns:
+        Ids of the notes whose summary was written.
+    """
+    params = [
+        {
+            "note_id": note.id,
+            "read_at": note.updated_at,
+            "summary": summaries[note.id],
+        }
+        for note in notes
+        if note.id in summaries
+    ]
+    if not params:
+        return set()
+    table = BookNote.__table__
+    assert isinstance(table, Table)
+    now = datetime.now(timezone.utc)
+    await db.execute(
+        update(table)
+        .where(
+            table.c.id == bindparam("note_id"),
+            table.c.updated_at == bindparam("read_at"),
+        )
+        .values(
+            ai_summary=bindparam("summary"),
+            ai_summary_at=now,
+            updated_at=table.c.updated_at,
+        ),
+        params,
+    )
+    # executemany does not report per-row counts; the written rows carry now
+    result = await db.execute(
+        select(table.c.id).where(
+            table.c.id.in_([param["note_id"] for param in params]),
+            table.c.ai_summary_at == now,
+        )
+    )
+    return set(result.scalars().all())
+
+
 async def delete_book_note(db: AsyncSession, note: BookNote) -> None:
     """Delete a BookNote."""
+    await _bump_reading_stats(
+        db, total_notes=-1, notes_this_month=-_in_stats_month(note.reading_date)
+    )
     await db.delete(note)
     await db.flush()
 
@@ -257,40 +589,107 @@ async def delete_book_note(db: AsyncSession, note: BookNote) -> None:
 # ============ Statistics ============
 
 
-async def get_reading_stats(db: AsyncSession) -> ReadingStatsResponse:
-    """Get reading statistics."""
-    # Total books count
-    total_result = await db.execute(select(func.count(Book.id)))
-    total_books = total_result.scalar() or 0
-
-    # Reading books count
-    reading_result = await db.execute(
-        select(func.count(Book.id)).where(Book.status == "reading")
-    )
-    reading_books = reading_result.scalar() or 0
-
-    # Completed books count
-    completed_result = await db.execute(
-        select(func.count(Book.id)).where(Book.status == "completed")
+def _reading_stats_query() -> Select:
+    """Build a single-round-trip conditional aggregate over books and notes."""
+    first_of_month = date.today().replace(day=1)
+    book_counts = select(
+        func.count(Book.id).label("total_books"),
+        func.count(Book.id).filter(Book.status == "reading").label("reading_books"),
+        func.count(Book.id)
+        .filter(Book.status == "completed")
+        .label("completed_books"),
+    ).subquery()
+    note_counts = select(
+        func.count(BookNote.id).label("total_notes"),
+        func.count(BookNote.id)
+        .filter(BookNote.reading_date >= first_of_month)
+        .label("notes_this_month"),
+    ).subquery()
+    return select(book_counts, note_counts).join_from(
+        book_counts, note_counts, true()
     )
-    completed_books = completed_result.scalar() or 0
 
-    # Total notes count
-    notes_result = await db.execute(select(func.count(BookNote.id)))
-    total_notes = notes_result.scalar() or 0
 
-    # Notes this month
-    today = date.today()
-    first_of_month = today.replace(day=1)
-    month_notes_result = await db.execute(
-        select(func.count(BookNote.id)).where(BookNote.reading_date >= first_of_month)
+async def _aggregate_reading_stats(db: AsyncSession) -> ReadingStatsResponse:
+    """Compute reading statistics from the books and book_notes tables."""
+    result = await db.execute(_reading_stats_query())
+    return ReadingStatsResponse.model_validate(result.mappings().one())
+
+
+async def rebuild_reading_stats(db: AsyncSession) -> ReadingStats:
+    """Recompute the reading_stats summary row from scratch.
+
+    The row is written with one INSERT ... ON CONFLICT (id) DO UPDATE, so
+    concurrent rebuilds of a missing row overwrite each other instead of
+    failing on the primary key.
+    """
+    stats = await _aggregate_reading_stats(db)
+    values = {
+        **stats.model_dump(),
+        "month_start": date.today().replace(day=1),
+        "updated_at": datetime.now(timezone.utc),
+    }
+    insert = (
+        postgresql.insert
+        if db.get_bind().dialect.name == "postgresql"
+        else sqlite.insert
+    )
+    await db.execute(
+        insert(ReadingStats)
+        .values(id=READING_STATS_ID, **values)
+        .on_conflict_do_update(index_elements=[ReadingStats.id], set_=values)
     )
-    notes_this_month = month_notes_result.scalar() or 0
-
-    return ReadingStatsResponse(
-        total_books=total_books,
-        reading_books=reading_books,
-        completed_books=completed_books,
-        total_notes=total_notes,
-        notes_this_month=notes_this_month,
+    result = await db.execute(
+        select(ReadingStats)
+        .where(ReadingStats.id == READING_STATS_ID)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def _bump_reading_stats(db: AsyncSession, **deltas: Any) -> None:
+    """Apply counter deltas to the reading_stats row in the current transaction.
+
+    Values are added to the matching columns with a single UPDATE, so
+    concurrent writers serialize on the row lock instead of losing updates.
+    A missing row is left alone; it is rebuilt on the next read.
+    """
+    if not settings.READING_STATS_SUMMARY:
+        return
+    values = {
+        field: getattr(ReadingStats, field) + delta for field, delta in deltas.items()
+    }
+    await db.execute(
+        update(ReadingStats)
+        .where(ReadingStats.id == READING_STATS_ID)
+        .values(**values)
     )
+
+
+def _status_deltas(old: Optional[str], new: Optional[str]) -> dict[str, int]:
+    """Counter deltas for a book moving from old to new status (None = absent)."""
+    return {
+        "reading_books": int(new == "reading") - int(old == "reading"),
+        "completed_books": int(new == "completed") - int(old == "completed"),
+    }
+
+
+def _in_stats_month(reading_date: date) -> ColumnElement[int]:
+    """1 if the date falls in the summary row's month window, else 0."""
+    return case((ReadingStats.month_start <= reading_date, 1), else_=0)
+
+
+async def get_reading_stats(db: AsyncSession) -> ReadingStatsResponse:
+    """Get reading statistics.
+
+    Reads the reading_stats summary row when READING_STATS_SUMMARY is
+    enabled, rebuilding it if missing or from a previous month; otherwise
+    runs one conditional-aggregate query.
+    """
+    if not settings.READING_STATS_SUMMARY:
+        return await _aggregate_reading_stats(db)
+
+    row = await db.get(ReadingStats, READING_STATS_ID)
+    if row is None or row.month_start != date.today().replace(day=1):
+        row = await rebuild_reading_stats(db)
+    return ReadingStatsResponse.model_validate(row)
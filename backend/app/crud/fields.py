@@ -0,0 +1,45 @@
+"""Loader options for sparse fieldsets (``fields=`` query parameter)."""
+
+from collections.abc import Collection, Iterable
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstrumentedAttribute, load_only, raiseload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
+
+
+def field_load_options(
+    model: Any,
+    fields: Collection[str],
+    *,
+    always: Iterable[InstrumentedAttribute[Any]] = (),
+) -> list[ExecutableOption]:
+    """Restrict a query on model to the columns and relationships in fields.
+
+    Field names that are neither table columns nor relationships (e.g.
+    computed values) are ignored here.
+
+    Args:
+        model: Mapped class being queried.
+        fields: Requested response field names.
+        always: Columns loaded regardless of fields, e.g. sort keys needed
+            for pagination cursors or validators.
+
+    Returns:
+        Loader options: load_only for the columns, selectinload for requested
+        relationships and raiseload for every other relationship, so skipped
+        data can never be fetched by accident.
+    """
+    mapper = inspect(model)
+    table_columns = set(model.__table__.c.keys())
+    columns = [*always]
+    columns += [getattr(model, name) for name in fields if name in table_columns]
+
+    options: list[ExecutableOption] = [load_only(*columns, raiseload=True)]
+    for relationship in mapper.relationships:
+        attribute = getattr(model, relationship.key)
+        if relationship.key in fields:
+            options.append(selectinload(attribute))
+        else:
+            options.append(raiseload(attribute))
+    return options
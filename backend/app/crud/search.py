@@ -0,0 +1,355 @@
+"""Search over TILs and book notes.
+
+Two query paths are available:
+
+- ``fulltext``: word-level matching on the generated tsvector columns
+  (PostgreSQL) or FTS5 fallback tables (SQLite), ranked with ts_rank/bm25.
+- ``ngram``: substring matching backed by character-bigram tsvector columns
+  (PostgreSQL), which handles Korean words with attached particles that the
+  word-level index misses. SQLite falls back to a plain LIKE scan.
+
+``auto`` picks ``ngram`` for queries containing Hangul and ``fulltext``
+otherwise. See app.models.search for the index definitions.
+"""
+
+import html
+import re
+from dataclasses import dataclass
+from typing import Any, Literal, Optional
+
+from sqlalchemy import (
+    ColumnClause,
+    ColumnElement,
+    Float,
+    Select,
+    String,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import TSQUERY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.models import TIL, Book, BookNote
+from app.models.search import SEARCH_TS_CONFIG, book_notes_fts, tils_fts
+
+SEARCH_TYPES = ("til", "book_note")
+
+SearchMode = Literal["auto", "fulltext", "ngram"]
+
+# Match markers emitted by ts_headline / snippet. The raw excerpt is
+# HTML-escaped in Python first, then the markers become <mark> tags, so
+# fulltext snippets come back in the same format as n-gram ones.
+_MARK_START = "\x02"
+_MARK_STOP = "\x03"
+
+# ts_headline options
+_HEADLINE_OPTIONS = (
+    f"StartSel={_MARK_START}, StopSel={_MARK_STOP}, MaxWords=30, MinWords=10"
+)
+
+# Characters of context kept on each side of an n-gram match in snippets
+_SNIPPET_CONTEXT = 60
+
+# Hangul syllables and jamo
+_HANGUL_RE = re.compile("[ᄀ-ᇿ㄰-㆏가-힣]")
+
+# Word separators; must match the split in the text_bigrams SQL function
+_WORD_SPLIT_RE = re.compile(r"[\s!-/:-@\[-`{-~]+")
+
+
+@dataclass(frozen=True)
+class _SearchTarget:
+    """Columns and indexes searched for one content type."""
+
+    type: str
+    model: Any
+    title: InstrumentedAttribute[str]
+    text_columns: tuple[InstrumentedAttribute[str], ...]
+    content: InstrumentedAttribute[str]
+    fts_table: Any
+    fts_content_index: int  # column index of content in the FTS5 table
+
+
+_TARGETS = {
+    "til": _SearchTarget(
+        type="til",
+        model=TIL,
+        title=TIL.title,
+        text_columns=(TIL.title, TIL.excerpt, TIL.content),
+        content=TIL.content,
+        fts_table=tils_fts,
+        fts_content_index=3,
+    ),
+    "book_note": _SearchTarget(
+        type="book_note",
+        model=BookNote,
+        title=BookNote.chapter_title,
+        text_columns=(BookNote.chapter_title, BookNote.content),
+        content=BookNote.content,
+        fts_table=book_notes_fts,
+        fts_content_index=2,
+    ),
+}
+
+
+def _is_postgres(db: AsyncSession) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _resolve_mode(q: str, mode: SearchMode) -> SearchMode:
+    """Pick the query path for auto mode."""
+    if mode != "auto":
+        return mode
+    return "ngram" if _HANGUL_RE.search(q) else "fulltext"
+
+
+def _fts5_query(q: str) -> str:
+    """Quote each term as an FTS5 prefix phrase so user input is never syntax."""
+    terms = [term.replace('"', '""') for term in q.split()]
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _tsquery(q: str) -> ColumnElement[Any]:
+    return func.websearch_to_tsquery(SEARCH_TS_CONFIG, q)
+
+
+def bigram_tsquery(q: str) -> str:
+    """Build a tsquery string requiring every character bigram of q.
+
+    Single-character words become prefix matches. Lexemes are quoted, so the
+    result is safe to cast to tsquery without further parsing.
+
+    Args:
+        q: User search query.
+
+    Returns:
+        tsquery source text, e.g. "'비동' & '동기'"; empty if q has no words.
+    """
+    lexemes: list[str] = []
+    for word in _WORD_SPLIT_RE.split(q.lower()):
+        if not word:
+            continue
+        if len(word) == 1:
+            lexemes.append(_quote_lexeme(word) + ":*")
+            continue
+        for i in range(len(word) - 1):
+            lexeme = _quote_lexeme(word[i : i + 2])
+            if lexeme not in lexemes:
+                lexemes.append(lexeme)
+    return " & ".join(lexemes)
+
+
+def _as_tsquery(source: str) -> ColumnElement[Any]:
+    """Cast prebuilt tsquery text without re-parsing it through a config."""
+    return cast(literal(source, String), TSQUERY)
+
+
+def _quote_lexeme(lexeme: str) -> str:
+    escaped = lexeme.replace("\\", "\\\\").replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _contains(column: InstrumentedAttribute[str], q: str) -> ColumnElement[bool]:
+    return column.ilike(f"%{_escape_like(q)}%", escape="\\")
+
+
+def _ngram_filter(
+    db: AsyncSession, target: _SearchTarget, q: str
+) -> ColumnElement[bool]:
+    """Substring match, narrowed by the bigram GIN index on PostgreSQL."""
+    substring = or_(*(_contains(column, q) for column in target.text_columns))
+    tsquery = bigram_tsquery(q)
+    if not _is_postgres(db) or not tsquery:
+        return substring
+    bigrams: ColumnClause[Any] = literal_column(
+        f"{target.model.__tablename__}.search_bigrams"
+    )
+    return and_(bigrams.op("@@")(_as_tsquery(tsquery)), substring)
+
+
+def _fulltext_filter(
+    db: AsyncSession, target: _SearchTarget, q: str
+) -> ColumnElement[bool]:
+    """Word-level full-text match."""
+    if _is_postgres(db):
+        vector: ColumnClause[Any] = literal_column(
+            f"{target.model.__tablename__}.search_vector"
+        )
+        return vector.op("@@")(_tsquery(q))
+    fts_name = target.fts_table.name
+    matches = select(target.fts_table.c.id).where(
+        literal_column(fts_name).match(_fts5_query(q))
+    )
+    in_matches: ColumnElement[bool] = target.model.id.in_(matches)
+    return in_matches
+
+
+def _search_filter(
+    db: AsyncSession, target: _SearchTarget, q: str, mode: SearchMode
+) -> ColumnElement[bool]:
+    if _resolve_mode(q, mode) == "ngram":
+        return _ngram_filter(db, target, q)
+    return _fulltext_filter(db, target, q)
+
+
+def note_search_filter(
+    db: AsyncSession, q: str, mode: SearchMode = "auto"
+) -> ColumnElement[bool]:
+    """Build a BookNote filter matching q against chapter title and content."""
+    return _search_filter(db, _TARGETS["book_note"], q, mode)
+
+
+def _substring_snippet(
+    db: AsyncSession, column: InstrumentedAttribute[str], q: str
+) -> ColumnElement[str]:
+    """Cut a window of raw text around the first occurrence of q.
+
+    The window is escaped and marked by _highlight once the rows are loaded.
+    """
+    if _is_postgres(db):
+        position = func.strpos(func.lower(column), q.lower())
+    else:
+        position = func.instr(func.lower(column), q.lower())
+    start = case(
+        (position > _SNIPPET_CONTEXT, position - _SNIPPET_CONTEXT), else_=1
+    )
+    return func.substr(column, start, 2 * _SNIPPET_CONTEXT + len(q))
+
+
+def _highlight(text: Optional[str], q: str) -> Optional[str]:
+    """HTML-escape a snippet window and mark every case-insensitive match of q."""
+    if text is None:
+        return None
+    parts = re.split(f"({re.escape(q)})", text, flags=re.IGNORECASE)
+    # Odd positions are the captured matches
+    return "".join(
+        f"<mark>{html.escape(part)}</mark>" if i % 2 else html.escape(part)
+        for i, part in enumerate(parts)
+    )
+
+
+def _mark_headline(text: Optional[str]) -> Optional[str]:
+    """HTML-escape a fulltext excerpt and turn its match markers into <mark>."""
+    if text is None:
+        return None
+    return (
+        html.escape(text)
+        .replace(_MARK_START, "<mark>")
+        .replace(_MARK_STOP, "</mark>")
+    )
+
+
+def _ranked_query(
+    db: AsyncSession, target: _SearchTarget, q: str, mode: SearchMode, limit: int
+) -> Select:
+    """Ranked published matches of one content type."""
+    model = target.model
+    query = select(model)
+    if _resolve_mode(q, mode) == "ngram":
+        # Title hits first, then bigram density
+        rank: ColumnElement[Any] = case((_contains(target.title, q), 1.0), else_=0.0)
+        if _is_postgres(db) and bigram_tsquery(q):
+            bigrams: ColumnClause[Any] = literal_column(
+                f"{model.__tablename__}.search_bigrams"
+            )
+            rank = rank + func.ts_rank(bigrams, _as_tsquery(bigram_tsquery(q)))
+        snippet = _substring_snippet(db, target.content, q)
+        query = query.where(_ngram_filter(db, target, q))
+    elif _is_postgres(db):
+        vector: ColumnClause[Any] = literal_column(
+            f"{model.__tablename__}.search_vector"
+        )
+        rank = func.ts_rank(vector, _tsquery(q))
+        snippet = func.ts_headline(
+            SEARCH_TS_CONFIG, target.content, _tsquery(q), _HEADLINE_OPTIONS
+        )
+        query = query.where(vector.op("@@")(_tsquery(q)))
+    else:
+        fts: ColumnClause[Any] = literal_column(target.fts_table.name)
+        rank = -func.bm25(fts)
+        snippet = func.snippet(
+            fts, target.fts_content_index, _MARK_START, _MARK_STOP, "…", 30
+        )
+        query = query.join(target.fts_table, target.fts_table.c.id == model.id)
+        query = query.where(fts.match(_fts5_query(q)))
+
+    if target.type == "book_note":
+        book_slug = Book.slug.label("book_slug")
+        query = query.join(Book, Book.id == BookNote.book_id)
+    else:
+        book_slug = cast(null(), String).label("book_slug")
+
+    return (
+        query.with_only_columns(
+            literal(target.type, String).label("type"),
+            model.id.label("id"),
+            model.slug.label("slug"),
+            target.title.label("title"),
+            snippet.label("snippet"),
+            cast(rank, Float).label("rank"),
+            book_slug,
+        )
+        .where(model.is_published.is_(True))
+        .order_by(rank.desc())
+        .limit(limit)
+    )
+
+
+async def search(
+    db: AsyncSession,
+    q: str,
+    *,
+    types: Optional[list[str]] = None,
+    mode: SearchMode = "auto",
+    limit: int = 20,
+) -> list[dict[str, Any]]:
+    """Search published TILs and book notes, best matches first.
+
+    Args:
+        db: Database session.
+        q: Search query (web-search style in fulltext mode).
+        types: Content types to include ("til", "book_note"); all when None.
+        mode: "fulltext", "ngram", or "auto" (ngram for Hangul queries).
+        limit: Maximum number of results.
+
+    Returns:
+        List of result mappings with type, id, slug, title, snippet, rank
+        and book_slug (book notes only).
+    """
+    q = q.strip()
+    if not q:
+        return []
+
+    types = types or list(SEARCH_TYPES)
+    # Each branch is ranked and limited on its own so snippets are only
+    # built for candidates that can make the final page.
+    branches = [
+        _ranked_query(db, _TARGETS[t], q, mode, limit).subquery().select()
+        for t in types
+    ]
+    combined = union_all(*branches).subquery()
+    query = select(combined).order_by(combined.c.rank.desc()).limit(limit)
+
+    result = await db.execute(query)
+    rows = [dict(row) for row in result.mappings().all()]
+    # Snippets are raw text until here; every mode returns them escaped
+    ngram = _resolve_mode(q, mode) == "ngram"
+    for row in rows:
+        if ngram:
+            row["snippet"] = _highlight(row["snippet"], q)
+        else:
+            row["snippet"] = _mark_headline(row["snippet"])
+    return rows
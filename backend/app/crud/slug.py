@@ -0,0 +1,136 @@
+"""Unique slug allocation shared by the CRUD modules."""
+
+import re
+from typing import Any
+
+from sqlalchemy import Integer, and_, case, cast, func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.utils.slug import slugify_title
+
+# Attempts before giving up when concurrent writers keep taking the same slug
+MAX_SLUG_ATTEMPTS = 5
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so the slug is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def matches_base_slug(slug: str, base_slug: str) -> bool:
+    """Check whether slug is base_slug itself or base_slug-N."""
+    return re.fullmatch(rf"{re.escape(base_slug)}(-[0-9]+)?", slug) is not None
+
+
+async def next_available_slug(
+    db: AsyncSession, column: InstrumentedAttribute[str], base_slug: str
+) -> str:
+    """Pick the next free slug for base_slug.
+
+    Only rows equal to base_slug or shaped like base_slug-N are read, and the
+    highest N is computed in SQL, so the cost does not grow with table size.
+    Suffixes longer than 9 digits are not counted, so casting N never
+    overflows an INTEGER (e.g. a title like "top-10000000000").
+
+    Args:
+        db: Database session.
+        column: Slug column of the target model (e.g. TIL.slug).
+        base_slug: Slug without a numeric suffix.
+
+    Returns:
+        base_slug if free, otherwise base_slug-(max N + 1).
+    """
+    suffix = func.substr(column, len(base_slug) + 2)
+    is_suffixed = and_(
+        column.like(f"{_escape_like(base_slug)}-%", escape="\\"),
+        suffix.regexp_match("^[0-9]{1,9}$"),
+    )
+    result = await db.execute(
+        select(
+            func.count().filter(column == base_slug),
+            func.max(case((column == base_slug, 0), else_=cast(suffix, Integer))),
+        ).where(or_(column == base_slug, is_suffixed))
+    )
+    base_taken, max_suffix = result.one()
+
+    if not base_taken:
+        return base_slug
+    return f"{base_slug}-{(max_suffix or 0) + 1}"
+
+
+async def _claim_unique_slug(
+    db: AsyncSession, obj: Any, base_slug: str, *, add: bool
+) -> None:
+    """Set the next free slug for base_slug on obj and flush it in a SAVEPOINT.
+
+    If a concurrent writer claimed the same slug first, the savepoint is
+    rolled back and the next slug is tried.
+    """
+    column = type(obj).slug
+
+    for attempt in range(1, MAX_SLUG_ATTEMPTS + 1):
+        # A new obj is not in the session yet; don't let autoflush cascade into it
+        with db.no_autoflush:
+            slug = await next_available_slug(db, column, base_slug)
+        try:
+            async with db.begin_nested():
+                obj.slug = slug
+                if add:
+                    db.add(obj)
+                await db.flush()
+            return
+        except IntegrityError:
+            taken = await db.scalar(select(func.count()).where(column == slug))
+            if not taken or attempt == MAX_SLUG_ATTEMPTS:
+                raise
+
+
+async def add_with_unique_slug(
+    db: AsyncSession, obj: Any, title: str, *, max_length: int = 100
+) -> None:
+    """Add a new object with a unique slug derived from title and flush it.
+
+    The insert runs inside a SAVEPOINT; if a concurrent writer claimed the
+    same slug first, the savepoint is rolled back and the next slug is tried.
+
+    Args:
+        db: Database session.
+        obj: New model instance with a ``slug`` column.
+        title: Title to derive the slug from.
+        max_length: Maximum length of the base slug (before any suffix).
+
+    Raises:
+        IntegrityError: If the insert violates another constraint, or the
+            slug is still taken after MAX_SLUG_ATTEMPTS.
+    """
+    base_slug = slugify_title(title, max_length=max_length)
+    await _claim_unique_slug(db, obj, base_slug, add=True)
+
+
+async def update_with_unique_slug(
+    db: AsyncSession, obj: Any, title: str, *, max_length: int = 100
+) -> None:
+    """Flush pending changes to obj and move it to a slug derived from title.
+
+    The current slug is kept if it already is base_slug or base_slug-N.
+    Otherwise the slug change is flushed with the same SAVEPOINT retry as
+    add_with_unique_slug.
+
+    Args:
+        db: Database session.
+        obj: Persistent model instance with a ``slug`` column.
+        title: New title to derive the slug from.
+        max_length: Maximum length of the base slug (before any suffix).
+
+    Raises:
+        IntegrityError: If the update violates another constraint, or the
+            slug is still taken after MAX_SLUG_ATTEMPTS.
+    """
+    # Flush the other changes first so a retried savepoint only redoes the slug
+    await db.flush()
+    base_slug = slugify_title(title, max_length=max_length)
+    if matches_base_slug(obj.slug, base_slug):
+        return
+    await _claim_unique_slug(db, obj, base_slug, add=False)
@@ -1,40 +1,47 @@
+from collections.abc import Collection
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.fields import field_load_options
+from app.crud.slug import add_with_unique_slug, update_with_unique_slug
+from app.crud.versions import get_versions
 from app.models import Tag
 from app.schemas.tag import TagCreate, TagUpdate
-from app.utils.slug import generate_slug
 
+# Tag.slug is limited to 60 characters; leave room for a "-N" suffix
+TAG_BASE_SLUG_LENGTH = 54
 
-async def get_existing_tag_slugs(db: AsyncSession) -> list[str]:
-    """Get all existing tag slugs.
 
-    Args:
-        db: Database session.
-
-    Returns:
-        List of existing tag slugs.
-    """
-    result = await db.execute(select(Tag.slug))
-    return list(result.scalars().all())
-
-
-async def get_tags(db: AsyncSession) -> list[Tag]:
+async def get_tags(
+    db: AsyncSession, *, fields: Optional[Collection[str]] = None
+) -> list[Tag]:
     """Get all tags sorted by name.
 
     Args:
         db: Database session.
+        fields: Load only these response fields (plus updated_at).
 
     Returns:
         List of all tags.
     """
-    result = await db.execute(select(Tag).order_by(Tag.name))
+    query = select(Tag).order_by(Tag.name)
+    if fields is not None:
+        query = query.options(
+            *field_load_options(Tag, fields, always=[Tag.updated_at])
+        )
+    result = await db.execute(query)
     return list(result.scalars().all())
 
 
+async def get_tag_versions(db: AsyncSession) -> list[Row[UUID, datetime]]:
+    """Get id and updated_at of every tag without loading the tags."""
+    return await get_versions(db, select(Tag.id, Tag.updated_at))
+
+
 async def get_tag_by_id(db: AsyncSession, tag_id: UUID) -> Optional[Tag]:
     """Get tag by ID.
 
@@ -81,18 +88,11 @@ async def create_tag(db: AsyncSession, tag_in: TagCreate) -> Tag:
     if existing_by_name.scalar_one_or_none():
         raise ValueError(f"Tag with name '{tag_in.name}' already exists")
 
-    # Generate unique slug
-    existing_slugs = await get_existing_tag_slugs(db)
-    slug = generate_slug(tag_in.name, existing_slugs)
-    # Ensure slug doesn't exceed 60 characters (Tag model constraint)
-    if len(slug) > 60:
-        slug = slug[:60]
-
-    # Create tag
-    tag = Tag(name=tag_in.name, slug=slug)
-
-    db.add(tag)
-    await db.flush()
+    # Create tag with a unique slug
+    tag = Tag(name=tag_in.name)
+    await add_with_unique_slug(
+        db, tag, tag_in.name, max_length=TAG_BASE_SLUG_LENGTH
+    )
     await db.refresh(tag)
     return tag
 
@@ -124,15 +124,10 @@ async def update_tag(db: AsyncSession, tag: Tag, tag_in: TagUpdate) -> Tag:
             raise ValueError(f"Tag with name '{new_name}' already exists")
 
         tag.name = new_name
-        # Regenerate slug if name changed
-        existing_slugs = await get_existing_tag_slugs(db)
-        # Exclude current tag's slug from existing slugs
-        existing_slugs = [s for s in existing_slugs if s != tag.slug]
-        new_slug = generate_slug(new_name, existing_slugs)
-        # Ensure slug doesn't exceed 60 characters
-        if len(new_slug) > 60:
-            new_slug = new_slug[:60]
-        tag.slug = new_slug
+        # Regenerate slug if name changed (keep it when the base is unchanged)
+        await update_with_unique_slug(
+            db, tag, new_name, max_length=TAG_BASE_SLUG_LENGTH
+        )
 
     await db.flush()
     await db.refresh(tag)
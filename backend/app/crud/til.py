@@ -1,29 +1,33 @@
 """CRUD operations for TIL model."""
 
+from collections.abc import Collection
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, defer, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
-from app.models import Tag, TIL
+from app.crud.fields import field_load_options
+from app.crud.slug import add_with_unique_slug
+from app.crud.versions import get_versions
+from app.models import TIL, Tag, til_tag_association
 from app.schemas.til import TILCreate, TILUpdate
-from app.utils.slug import generate_slug
+from app.utils.cursor import decode_cursor, encode_cursor
 
+# Sort keys used for keyset pagination: (day_number, created_at, id)
+_CURSOR_TYPES = (int, datetime.fromisoformat, UUID)
 
-async def get_existing_slugs(db: AsyncSession) -> list[str]:
-    """Get all existing TIL slugs.
 
-    Args:
-        db: Database session.
-
-    Returns:
-        List of existing slugs.
-    """
-    result = await db.execute(select(TIL.slug))
-    return list(result.scalars().all())
+def _load_options(
+    fields: Optional[Collection[str]], *always: InstrumentedAttribute[Any]
+) -> list[ExecutableOption]:
+    """Loader options for a TIL query, narrowed to a sparse fieldset if given."""
+    if fields is None:
+        return [selectinload(TIL.tags)]
+    return field_load_options(TIL, fields, always=always)
 
 
 async def get_tils(
@@ -33,22 +37,37 @@ async def get_tils(
     limit: int = 10,
     tag_slug: Optional[str] = None,
     is_published: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    summary: bool = False,
+    fields: Optional[Collection[str]] = None,
 ) -> tuple[list[TIL], int]:
     """Get TIL list with pagination and filtering.
 
     Args:
         db: Database session.
-        skip: Number of items to skip.
+        skip: Number of items to skip (ignored when cursor is given).
         limit: Number of items to return.
         tag_slug: Filter by tag slug (optional).
         is_published: Filter by published status (optional).
+        cursor: Keyset cursor from a previous page (optional).
+        summary: Skip loading the Markdown content column (summary view).
+        fields: Load only these response fields (plus the sort keys).
 
     Returns:
         Tuple of (TIL list, total count).
+
+    Raises:
+        ValueError: If the cursor is malformed.
     """
-    query = select(TIL).options(selectinload(TIL.tags))
+    query = select(TIL).options(
+        *_load_options(fields, TIL.day_number, TIL.created_at)
+    )
     count_query = select(func.count(TIL.id))
 
+    if summary and fields is None:
+        # Content is by far the largest column; raise instead of lazy-loading
+        query = query.options(defer(TIL.content, raiseload=True))
+
     # Filter by published status
     if is_published is not None:
         query = query.where(TIL.is_published == is_published)
@@ -60,8 +79,17 @@ async def get_tils(
         count_query = count_query.join(TIL.tags).where(Tag.slug == tag_slug)
 
     # Order by day_number descending (latest bootcamp day first)
-    query = query.order_by(TIL.day_number.desc(), TIL.created_at.desc())
-    query = query.offset(skip).limit(limit)
+    query = query.order_by(
+        TIL.day_number.desc(), TIL.created_at.desc(), TIL.id.desc()
+    )
+
+    # Keyset pagination: seek past the last item instead of scanning skipped rows
+    if cursor:
+        after = decode_cursor(cursor, _CURSOR_TYPES)
+        query = query.where(tuple_(TIL.day_number, TIL.created_at, TIL.id) < after)
+    else:
+        query = query.offset(skip)
+    query = query.limit(limit)
 
     result = await db.execute(query)
     count_result = await db.execute(count_query)
@@ -69,6 +97,18 @@ async def get_tils(
     return list(result.scalars().unique().all()), count_result.scalar() or 0
 
 
+def get_til_cursor(til: TIL) -> str:
+    """Build the keyset cursor pointing just after the given TIL.
+
+    Args:
+        til: Last TIL of the current page.
+
+    Returns:
+        Opaque cursor token.
+    """
+    return encode_cursor(til.day_number, til.created_at, til.id)
+
+
 async def get_til_by_id(db: AsyncSession, til_id: UUID) -> Optional[TIL]:
     """Get TIL by ID.
 
@@ -85,38 +125,75 @@ async def get_til_by_id(db: AsyncSession, til_id: UUID) -> Optional[TIL]:
     return result.scalar_one_or_none()
 
 
-async def get_til_by_slug(db: AsyncSession, slug: str) -> Optional[TIL]:
+async def get_til_by_slug(
+    db: AsyncSession, slug: str, *, fields: Optional[Collection[str]] = None
+) -> Optional[TIL]:
     """Get TIL by slug.
 
     Args:
         db: Database session.
         slug: TIL slug.
+        fields: Load only these response fields (plus updated_at).
 
     Returns:
         TIL object or None if not found.
     """
     result = await db.execute(
-        select(TIL).options(selectinload(TIL.tags)).where(TIL.slug == slug)
+        select(TIL)
+        .options(*_load_options(fields, TIL.updated_at))
+        .where(TIL.slug == slug)
     )
     return result.scalar_one_or_none()
 
 
-async def get_til_by_day_number(db: AsyncSession, day_number: int) -> Optional[TIL]:
+async def get_til_by_day_number(
+    db: AsyncSession, day_number: int, *, fields: Optional[Collection[str]] = None
+) -> Optional[TIL]:
     """Get TIL by day number.
 
     Args:
         db: Database session.
         day_number: Bootcamp day number.
+        fields: Load only these response fields (plus updated_at).
 
     Returns:
         TIL object or None if not found.
     """
     result = await db.execute(
-        select(TIL).options(selectinload(TIL.tags)).where(TIL.day_number == day_number)
+        select(TIL)
+        .options(*_load_options(fields, TIL.updated_at))
+        .where(TIL.day_number == day_number)
     )
     return result.scalar_one_or_none()
 
 
+async def get_til_versions(
+    db: AsyncSession,
+    *,
+    slug: Optional[str] = None,
+    day_number: Optional[int] = None,
+) -> list[Row[UUID, datetime]]:
+    """Get id and updated_at of a TIL and its tags without loading them.
+
+    Args:
+        db: Database session.
+        slug: TIL slug.
+        day_number: Bootcamp day number (when slug is not given).
+
+    Returns:
+        The TIL row followed by its tag rows, or [] if the TIL does not exist.
+    """
+    match = TIL.slug == slug if slug is not None else TIL.day_number == day_number
+    til_id = select(TIL.id).where(match).scalar_subquery()
+    return await get_versions(
+        db,
+        select(TIL.id, TIL.updated_at).where(TIL.id == til_id),
+        select(Tag.id, Tag.updated_at)
+        .join(til_tag_association, til_tag_association.c.tag_id == Tag.id)
+        .where(til_tag_association.c.til_id == til_id),
+    )
+
+
 async def create_til(db: AsyncSession, til_in: TILCreate) -> TIL:
     """Create a new TIL.
 
@@ -127,10 +204,6 @@ async def create_til(db: AsyncSession, til_in: TILCreate) -> TIL:
     Returns:
         Created TIL object.
     """
-    # Generate unique slug
-    existing_slugs = await get_existing_slugs(db)
-    slug = generate_slug(til_in.title, existing_slugs)
-
     # Get tags
     tags: list[Tag] = []
     if til_in.tag_ids:
@@ -140,16 +213,18 @@ async def create_til(db: AsyncSession, til_in: TILCreate) -> TIL:
     # Create TIL
     til = TIL(
         title=til_in.title,
-        slug=slug,
         day_number=til_in.day_number,
         excerpt=til_in.excerpt,
         content=til_in.content,
         is_published=til_in.is_published,
         published_at=datetime.now(timezone.utc) if til_in.is_published else None,
-        tags=tags,
+        tags=[],
     )
 
-    db.add(til)
+    # Insert with a unique slug generated from the title, then link tags
+    # (linking first would flush Tag.tils before the TIL is in the session)
+    await add_with_unique_slug(db, til, til_in.title)
+    til.tags = tags
     await db.flush()
     await db.refresh(til, ["tags"])
     return til
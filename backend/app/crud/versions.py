@@ -0,0 +1,31 @@
+"""Row versions (id, updated_at) for conditional GET validators."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Row, Select, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def get_versions(
+    db: AsyncSession, *parts: Select[UUID, datetime]
+) -> list[Row[UUID, datetime]]:
+    """Run (id, updated_at) selects as one query, in a stable order.
+
+    Only the two columns are read, so the validators of a representation can
+    be computed without loading or rendering it.
+
+    Args:
+        db: Database session.
+        *parts: Selects of (id, updated_at), e.g. a TIL and then its tags.
+
+    Returns:
+        Rows with id and updated_at, ordered by part and then by id.
+    """
+    union = union_all(
+        *(part.add_columns(literal(i).label("part")) for i, part in enumerate(parts))
+    ).subquery()
+    result = await db.execute(
+        select(union.c.id, union.c.updated_at).order_by(union.c.part, union.c.id)
+    )
+    return list(result.all())
@@ -1,4 +1,4 @@
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db, get_session_maker
 
-__all__ = ["Base", "get_db"]
+__all__ = ["Base", "get_db", "get_read_db", "get_session_maker"]
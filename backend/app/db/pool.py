@@ -0,0 +1,110 @@
+"""Connection pool instrumentation and startup warmup."""
+
+import asyncio
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long checkouts take.
+
+    Acquire time covers waiting for a free connection, opening a new one and
+    the pre-ping, i.e. everything a request waits for before its first query.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.acquire_seconds_total = 0.0
+        self.acquire_seconds_max = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.checkouts += 1
+            self.acquire_seconds_total += elapsed
+            self.acquire_seconds_max = max(self.acquire_seconds_max, elapsed)
+
+
+def pool_status(engine: AsyncEngine) -> dict[str, Any]:
+    """Report pool usage for an engine.
+
+    Args:
+        engine: Async engine to inspect.
+
+    Returns:
+        Connection counts and, for instrumented pools, checkout wait times.
+    """
+    pool = engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {"pool": type(pool).__name__}
+
+    status: dict[str, Any] = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # QueuePool counts overflow from -size; only positive values are in use
+        "overflow": max(pool.overflow(), 0),
+    }
+    if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        mean = pool.acquire_seconds_total / pool.checkouts if pool.checkouts else 0.0
+        status.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            acquire_ms_mean=round(mean * 1000, 3),
+            acquire_ms_max=round(pool.acquire_seconds_max * 1000, 3),
+        )
+    return status
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> int:
+    """Open pool connections ahead of the first requests.
+
+    All connections are held at once so that each one is a distinct pooled
+    connection, then returned to the pool as idle.
+
+    Args:
+        engine: Async engine whose pool to fill.
+        connections: Number of connections to open; capped at the pool size so
+            no overflow connection is opened only to be discarded.
+
+    Returns:
+        Number of connections opened.
+
+    Raises:
+        Exception: The first connection error, after releasing the
+            connections that did open.
+    """
+    pool = engine.pool
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        connections = min(connections, pool.size())
+    if connections <= 0:
+        return 0
+
+    conns = [engine.connect() for _ in range(connections)]
+    results = await asyncio.gather(
+        *(conn.start() for conn in conns), return_exceptions=True
+    )
+    opened = [
+        conn
+        for conn, result in zip(conns, results, strict=True)
+        if not isinstance(result, BaseException)
+    ]
+    await asyncio.gather(*(conn.close() for conn in opened))
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return len(opened)
@@ -1,13 +1,41 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import settings
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, warm_up_pool
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    """Pool and driver options from settings for an engine URL."""
+    if url.startswith("sqlite"):
+        return {}
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if url.startswith("postgresql+asyncpg"):
+        options["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+        }
+    return options
+
 
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    **_engine_options(settings.DATABASE_URL),
 )
 
 async_session_maker = async_sessionmaker(
@@ -16,6 +44,48 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read-only requests run in autocommit mode: no BEGIN/COMMIT round trips.
+# Without DATABASE_READ_URL this shares the primary engine's pool.
+read_engine: AsyncEngine
+if settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        settings.DATABASE_READ_URL,
+        echo=settings.DEBUG,
+        isolation_level="AUTOCOMMIT",
+        **_engine_options(settings.DATABASE_READ_URL),
+    )
+else:
+    read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
+def engines() -> list[AsyncEngine]:
+    """Distinct engines (primary, and the read replica when configured)."""
+    return [engine, read_engine] if settings.DATABASE_READ_URL else [engine]
+
+
+async def warm_up_engines() -> None:
+    """Pre-open DB_POOL_WARMUP connections on every engine."""
+    for db_engine in engines():
+        await warm_up_pool(db_engine, settings.DB_POOL_WARMUP)
+
+
+async def dispose_engines() -> None:
+    """Close all pooled connections."""
+    for db_engine in engines():
+        await db_engine.dispose()
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Dependency for work that opens its own sessions (e.g. batch jobs)."""
+    return async_session_maker
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database session."""
@@ -26,3 +96,13 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting a read-only async database session.
+
+    Statements autocommit individually and the session is never committed,
+    so it must not be used for writes.
+    """
+    async with read_session_maker() as session:
+        yield session
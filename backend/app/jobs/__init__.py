@@ -0,0 +1,12 @@
+"""Background jobs for long-running work (e.g. TIL generation)."""
+
+from app.config import settings
+from app.jobs.queue import JobHandler, JobQueue, dedupe_key
+
+job_queue = JobQueue(
+    workers=settings.JOB_WORKERS,
+    timeout=settings.JOB_TIMEOUT_SECONDS,
+    retention=settings.JOB_EVENTS_RETENTION_SECONDS,
+)
+
+__all__ = ["JobHandler", "JobQueue", "dedupe_key", "job_queue"]
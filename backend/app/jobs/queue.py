@@ -0,0 +1,340 @@
+"""In-process asyncio job queue backed by the jobs table."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.job import (
+    ACTIVE_JOB_STATUSES,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    Job,
+)
+
+logger = logging.getLogger(__name__)
+
+# A handler runs one job: it gets a session maker for any DB work and the
+# job's params, and yields {"event": ..., "data": {...}} progress events.
+# A final "complete" event's data becomes the job result; an "error" event
+# marks the job failed.
+JobHandler = Callable[
+    [async_sessionmaker[AsyncSession], dict[str, Any]],
+    AsyncIterator[dict[str, Any]],
+]
+
+# How often a client attached to a job of another worker process polls its row
+POLL_INTERVAL = 1.0
+
+
+def _utc_now() -> datetime:
+    """Return current UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def dedupe_key(kind: str, params: dict[str, Any]) -> str:
+    """Key identifying jobs of the same kind with the same params."""
+    payload = json.dumps([kind, params], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _error_event(error: str) -> dict[str, Any]:
+    return {"event": "error", "data": {"error": error}}
+
+
+def _final_event(job: Job) -> dict[str, Any]:
+    """The last event of a finished job, rebuilt from its row."""
+    if job.status == JOB_SUCCEEDED:
+        return {"event": "complete", "data": job.result or {}}
+    return _error_event(job.error or "Job failed")
+
+
+class _JobRun:
+    """Events of a job submitted to this process, as they are produced."""
+
+    def __init__(self, dedupe_key: str) -> None:
+        self.dedupe_key = dedupe_key
+        self.events: list[dict[str, Any]] = []
+        self.done = False
+        self._changed = asyncio.Condition()
+
+    async def append(self, event: dict[str, Any]) -> None:
+        async with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    async def finish(self) -> None:
+        async with self._changed:
+            self.done = True
+            self._changed.notify_all()
+
+    async def wait(self, seen: int) -> None:
+        """Wait until there are more than seen events or the job is done."""
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: len(self.events) > seen or self.done
+            )
+
+
+class JobQueue:
+    """Runs submitted jobs on a fixed number of asyncio worker tasks.
+
+    Clients submit work and then follow its events, so the work is not tied
+    to the request that started it: a client that disconnects can attach
+    again (GET the job's events) and gets every event from the start, and
+    submitting the same input while a job for it is still active returns
+    that job instead of starting the work twice.
+    """
+
+    def __init__(self, workers: int, timeout: float, retention: float) -> None:
+        """
+        Args:
+            workers: Jobs run concurrently in this process.
+            timeout: Seconds a job may run before it is failed.
+            retention: Seconds a finished job's events stay in memory; later
+                clients get only the stored final result.
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.retention = retention
+        self.session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+        self._queue: Optional[asyncio.Queue[tuple[UUID, JobHandler, dict]]] = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._runs: dict[UUID, _JobRun] = {}
+        self._active: dict[str, UUID] = {}
+        self._running: set[UUID] = set()
+        self._submit_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        """Start the worker tasks (idempotent)."""
+        if self._tasks:
+            return
+        self.session_maker = session_maker
+        self._queue = asyncio.Queue()
+        self._submit_lock = asyncio.Lock()
+        self._tasks = [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel running jobs and fail the ones still queued."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # Recorded once the workers are gone, outside the cancelled tasks
+        interrupted = list(self._running)
+        self._running.clear()
+        if self._queue is not None:
+            while not self._queue.empty():
+                job_id, _, _ = self._queue.get_nowait()
+                interrupted.append(job_id)
+            self._queue = None
+        for job_id in interrupted:
+            try:
+                await self._fail(job_id, "Job interrupted")
+            except Exception:
+                logger.exception("Job %s could not be marked interrupted", job_id)
+
+    async def submit(
+        self, kind: str, handler: JobHandler, params: dict[str, Any]
+    ) -> UUID:
+        """Queue a job, or return the active job for the same input.
+
+        Args:
+            kind: Job type recorded on the row, e.g. "til_generate".
+            handler: Coroutine generator that does the work.
+            params: JSON-serializable handler input.
+
+        Returns:
+            ID of the new or reused job.
+
+        Raises:
+            RuntimeError: If the queue has not been started.
+        """
+        if self._queue is None or self._submit_lock is None:
+            raise RuntimeError("Job queue is not running")
+        assert self.session_maker is not None
+
+        key = dedupe_key(kind, params)
+        async with self._submit_lock:
+            job_id = self._active.get(key)
+            if job_id is not None:
+                return job_id
+            async with self.session_maker() as db:
+                # Also reuse a job another worker process is running
+                job_id = await self._find_active(db, key)
+                if job_id is not None:
+                    return job_id
+                job = Job(kind=kind, params=params, dedupe_key=key, status=JOB_QUEUED)
+                db.add(job)
+                await db.commit()
+                job_id = job.id
+            self._runs[job_id] = _JobRun(key)
+            self._active[key] = job_id
+
+        await self._queue.put((job_id, handler, params))
+        return job_id
+
+    async def get(self, job_id: UUID) -> Optional[Job]:
+        """Load a job row."""
+        assert self.session_maker is not None
+        async with self.session_maker() as db:
+            return await db.get(Job, job_id)
+
+    async def events(
+        self, job_id: UUID, after: int = 0
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """Follow a job's events until it finishes.
+
+        Jobs running in this process replay their events from memory and then
+        stream new ones as they are produced. Other jobs (run by another
+        worker process, or finished longer than retention ago) are polled
+        until done and yield only their final event.
+
+        Args:
+            job_id: Job to follow.
+            after: Number of events already received; these are skipped.
+
+        Yields:
+            (sequence number starting at 1, event) pairs.
+
+        Raises:
+            LookupError: If the job does not exist.
+        """
+        run = self._runs.get(job_id)
+        if run is None:
+            async for item in self._stored_events(job_id, after):
+                yield item
+            return
+
+        seen = after
+        while True:
+            await run.wait(seen)
+            while seen < len(run.events):
+                seen += 1
+                yield seen, run.events[seen - 1]
+            if run.done:
+                return
+
+    async def _stored_events(
+        self, job_id: UUID, after: int
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        while True:
+            job = await self.get(job_id)
+            if job is None:
+                raise LookupError(f"Job {job_id} not found")
+            if job.status not in ACTIVE_JOB_STATUSES:
+                yield after + 1, _final_event(job)
+                return
+            if loop.time() >= deadline:
+                yield after + 1, _error_event("Job did not finish in time")
+                return
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def _find_active(self, db: AsyncSession, key: str) -> Optional[UUID]:
+        # Rows older than the timeout belong to a process that died mid-job
+        cutoff = _utc_now() - timedelta(seconds=self.timeout)
+        result = await db.execute(
+            select(Job.id)
+            .where(
+                Job.dedupe_key == key,
+                Job.status.in_(ACTIVE_JOB_STATUSES),
+                Job.created_at >= cutoff,
+            )
+            .order_by(Job.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def _work(self) -> None:
+        assert self._queue is not None
+        while True:
+            job_id, handler, params = await self._queue.get()
+            self._running.add(job_id)
+            try:
+                await self._run(job_id, handler, params)
+            except Exception:
+                logger.exception("Job %s could not be recorded", job_id)
+            self._running.discard(job_id)
+
+    async def _run(
+        self, job_id: UUID, handler: JobHandler, params: dict[str, Any]
+    ) -> None:
+        assert self.session_maker is not None
+        run = self._runs[job_id]
+        result: Optional[dict[str, Any]] = None
+        error: Optional[str] = None
+        try:
+            await self._update(job_id, status=JOB_RUNNING, started_at=_utc_now())
+            async with asyncio.timeout(self.timeout):
+                async for event in handler(self.session_maker, params):
+                    await run.append(event)
+                    if event["event"] == "complete":
+                        result = event["data"]
+                    elif event["event"] == "error":
+                        error = event["data"].get("error") or "Job failed"
+        except TimeoutError:
+            await self._fail(job_id, "Job timed out")
+            return
+        except Exception as e:
+            logger.exception("Job %s failed", job_id)
+            await self._fail(job_id, str(e))
+            return
+
+        if error is not None:
+            await self._finish(job_id, JOB_FAILED, error=error)
+        else:
+            await self._finish(job_id, JOB_SUCCEEDED, result=result)
+
+    async def _fail(self, job_id: UUID, error: str) -> None:
+        run = self._runs.get(job_id)
+        if run is not None:
+            await run.append(_error_event(error))
+        await self._finish(job_id, JOB_FAILED, error=error)
+
+    async def _finish(
+        self,
+        job_id: UUID,
+        status: str,
+        *,
+        result: Optional[dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        try:
+            await self._update(
+                job_id,
+                status=status,
+                result=result,
+                error=error,
+                finished_at=_utc_now(),
+            )
+        finally:
+            run = self._runs.get(job_id)
+            if run is not None:
+                await run.finish()
+                self._active.pop(run.dedupe_key, None)
+                asyncio.get_running_loop().call_later(
+                    self.retention, self._runs.pop, job_id, None
+                )
+
+    async def _update(self, job_id: UUID, **values: Any) -> None:
+        assert self.session_maker is not None
+        async with self.session_maker() as db:
+            await db.execute(update(Job).where(Job.id == job_id).values(**values))
+            await db.commit()
@@ -1,19 +1,48 @@
+import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
+from app.cache import response_cache
 from app.config import settings
+from app.db.pool import pool_status
+from app.db.session import (
+    async_session_maker,
+    dispose_engines,
+    engine,
+    read_engine,
+    warm_up_engines,
+)
+from app.jobs import job_queue
+from app.services.ai.providers import close_llm_providers
+from app.services.content.fetcher import close_http_fetcher
+from app.services.content.pool import close_parse_pool
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler."""
     # Startup
+    try:
+        await warm_up_engines()
+    except Exception:
+        # Not fatal: requests open connections on demand once the DB is up
+        logger.warning("Database pool warmup failed", exc_info=True)
+    await job_queue.start(async_session_maker)
     yield
     # Shutdown
+    await job_queue.stop()
+    await response_cache.close()
+    await close_llm_providers()
+    await close_http_fetcher()
+    close_parse_pool()
+    await dispose_engines()
 
 
 app = FastAPI(
@@ -42,3 +71,12 @@ app.include_router(api_router, prefix="/api/v1")
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/health/db")
+async def db_health_check() -> dict[str, Any]:
+    """Connection pool metrics (checked-out, overflow, checkout wait time)."""
+    pools = {"primary": pool_status(engine)}
+    if settings.DATABASE_READ_URL:
+        pools["read"] = pool_status(read_engine)
+    return {"status": "healthy", "pools": pools}
@@ -1,4 +1,7 @@
+from app.models import search  # noqa: F401  (registers search index DDL)
 from app.models.book import Book, BookNote, book_note_tag_association
+from app.models.job import Job
+from app.models.stats import ReadingStats
 from app.models.tag import Tag
 from app.models.til import TIL, til_tag_association
 
@@ -6,6 +9,8 @@ __all__ = [
     "Book",
     "BookNote",
     "book_note_tag_association",
+    "Job",
+    "ReadingStats",
     "Tag",
     "TIL",
     "til_tag_association",
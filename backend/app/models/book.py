@@ -19,7 +19,7 @@ from sqlalchemy import (
     Uuid,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.db.base import Base
 
@@ -100,8 +100,14 @@ class Book(Base):
         back_populates="book",
         cascade="all, delete-orphan",
         lazy="selectin",
+        passive_deletes=True,
     )
 
+    # Computed per query from a grouped aggregate over book_notes
+    # (see app.crud.book); not populated unless explicitly requested.
+    notes_count: Mapped[Optional[int]] = query_expression()
+    progress: Mapped[Optional[float]] = query_expression()
+
 
 class BookNote(Base):
     """BookNote model for chapter/daily reading notes."""
@@ -132,6 +138,10 @@ class BookNote(Base):
     ai_summary: Mapped[Optional[str]] = mapped_column(
         String(500), nullable=True
     )  # Short AI-generated summary
+    ai_summary_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )  # When ai_summary was written; stale once updated_at is later
     reading_date: Mapped[date] = mapped_column(Date, nullable=False, default=_today)
     is_published: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     published_at: Mapped[Optional[datetime]] = mapped_column(
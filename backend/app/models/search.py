@@ -0,0 +1,59 @@
+"""Full-text search index definitions.
+
+PostgreSQL: ``tils`` and ``book_notes`` carry two generated tsvector columns
+with GIN indexes, neither mapped on the models so the schema stays portable:
+
+- ``search_vector``: weighted word lexemes (migration 007)
+- ``search_bigrams``: character bigrams for Korean substring search (008)
+
+SQLite (test suite): equivalent FTS5 tables kept in sync by triggers are
+created alongside ``Base.metadata.create_all``.
+"""
+
+from sqlalchemy import DDL, column, event, table
+
+from app.db.base import Base
+
+# Text search configuration used by the generated tsvector columns
+SEARCH_TS_CONFIG = "simple"
+
+# SQLite FTS5 fallback tables (queried by app.crud.search)
+tils_fts = table("tils_fts", column("id"), column("title"), column("excerpt"))
+book_notes_fts = table("book_notes_fts", column("id"), column("chapter_title"))
+
+_SQLITE_FTS_CREATE = [
+    "CREATE VIRTUAL TABLE tils_fts USING fts5("
+    "id UNINDEXED, title, excerpt, content, tokenize='unicode61')",
+    "CREATE TRIGGER tils_fts_ai AFTER INSERT ON tils BEGIN "
+    "INSERT INTO tils_fts (id, title, excerpt, content) "
+    "VALUES (new.id, new.title, new.excerpt, new.content); END",
+    "CREATE TRIGGER tils_fts_au AFTER UPDATE ON tils BEGIN "
+    "UPDATE tils_fts SET title = new.title, excerpt = new.excerpt, "
+    "content = new.content WHERE id = old.id; END",
+    "CREATE TRIGGER tils_fts_ad AFTER DELETE ON tils BEGIN "
+    "DELETE FROM tils_fts WHERE id = old.id; END",
+    "CREATE VIRTUAL TABLE book_notes_fts USING fts5("
+    "id UNINDEXED, chapter_title, content, tokenize='unicode61')",
+    "CREATE TRIGGER book_notes_fts_ai AFTER INSERT ON book_notes BEGIN "
+    "INSERT INTO book_notes_fts (id, chapter_title, content) "
+    "VALUES (new.id, new.chapter_title, new.content); END",
+    "CREATE TRIGGER book_notes_fts_au AFTER UPDATE ON book_notes BEGIN "
+    "UPDATE book_notes_fts SET chapter_title = new.chapter_title, "
+    "content = new.content WHERE id = old.id; END",
+    "CREATE TRIGGER book_notes_fts_ad AFTER DELETE ON book_notes BEGIN "
+    "DELETE FROM book_notes_fts WHERE id = old.id; END",
+]
+
+_SQLITE_FTS_DROP = [
+    "DROP TABLE IF EXISTS tils_fts",
+    "DROP TABLE IF EXISTS book_notes_fts",
+]
+
+for _statement in _SQLITE_FTS_CREATE:
+    event.listen(
+        Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+for _statement in _SQLITE_FTS_DROP:
+    event.listen(
+        Base.metadata, "before_drop", DDL(_statement).execute_if(dialect="sqlite")
+    )
@@ -0,0 +1,41 @@
+"""Reading statistics summary model."""
+
+from datetime import date, datetime, timezone
+
+from sqlalchemy import Date, DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+# The summary table holds exactly one row with this primary key
+READING_STATS_ID = 1
+
+
+def _utc_now() -> datetime:
+    """Return current UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+class ReadingStats(Base):
+    """Single-row summary of reading statistics.
+
+    Kept current by book/note writes in the same transaction so that the
+    stats endpoint is a primary-key lookup instead of an aggregate scan.
+    """
+
+    __tablename__ = "reading_stats"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    total_books: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    reading_books: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_books: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_notes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    notes_this_month: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # First day of the month notes_this_month was counted from
+    month_start: Mapped[date] = mapped_column(Date, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=_utc_now,
+        onupdate=_utc_now,
+    )
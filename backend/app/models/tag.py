@@ -37,6 +37,12 @@ class Tag(Base):
         nullable=False,
         default=_utc_now,
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=_utc_now,
+        onupdate=_utc_now,
+    )
 
     # Many-to-many relationship with TIL
     tils: Mapped[list["TIL"]] = relationship(
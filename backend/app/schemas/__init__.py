@@ -4,14 +4,23 @@ from app.schemas.book import (
     BookNoteCreate,
     BookNoteListResponse,
     BookNoteResponse,
+    BookNoteSummaryResponse,
     BookNoteUpdate,
     BookResponse,
     BookUpdate,
     BookWithNotesResponse,
     ReadingStatsResponse,
 )
+from app.schemas.common import ListView
+from app.schemas.search import SearchResponse, SearchResult
 from app.schemas.tag import TagCreate, TagResponse, TagUpdate
-from app.schemas.til import TILCreate, TILListResponse, TILResponse, TILUpdate
+from app.schemas.til import (
+    TILCreate,
+    TILListResponse,
+    TILResponse,
+    TILSummaryResponse,
+    TILUpdate,
+)
 
 __all__ = [
     "BookCreate",
@@ -19,11 +28,15 @@ __all__ = [
     "BookNoteCreate",
     "BookNoteListResponse",
     "BookNoteResponse",
+    "BookNoteSummaryResponse",
     "BookNoteUpdate",
     "BookResponse",
     "BookUpdate",
     "BookWithNotesResponse",
+    "ListView",
     "ReadingStatsResponse",
+    "SearchResponse",
+    "SearchResult",
     "TagCreate",
     "TagResponse",
     "TagUpdate",
@@ -31,4 +44,5 @@ __all__ = [
     "TILUpdate",
     "TILResponse",
     "TILListResponse",
+    "TILSummaryResponse",
 ]
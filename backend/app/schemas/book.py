@@ -1,7 +1,7 @@
 """Book and BookNote schemas for request/response validation."""
 
 from datetime import date, datetime
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -65,6 +65,7 @@ class BookListResponse(BaseModel):
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None  # Keyset cursor for the next page
 
 
 # ============ BookNote Schemas ============
@@ -125,14 +126,38 @@ class BookNoteResponse(BookNoteBase):
     model_config = {"from_attributes": True}
 
 
+class BookNoteSummaryResponse(BaseModel):
+    """Schema for BookNote list items in the summary view.
+
+    Omits content, key_takeaways and questions.
+    """
+
+    id: UUID
+    book_id: UUID
+    slug: str
+    chapter_number: Optional[int]
+    chapter_title: str
+    pages: Optional[str]
+    ai_summary: Optional[str]
+    reading_date: date
+    is_published: bool
+    published_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    tags: list[TagResponse]
+
+    model_config = {"from_attributes": True}
+
+
 class BookNoteListResponse(BaseModel):
     """Schema for paginated BookNote list response."""
 
-    items: list[BookNoteResponse]
+    items: list[Union[BookNoteResponse, BookNoteSummaryResponse]]
     total: int
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None  # Keyset cursor for the next page
 
 
 # ============ Book with Notes ============
@@ -155,3 +180,5 @@ class ReadingStatsResponse(BaseModel):
     completed_books: int
     total_notes: int
     notes_this_month: int
+
+    model_config = {"from_attributes": True}
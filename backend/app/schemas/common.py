@@ -0,0 +1,56 @@
+"""Schemas shared across resources."""
+
+from functools import lru_cache
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+# List item projection: full objects, or slim summaries without Markdown content
+ListView = Literal["full", "summary"]
+
+
+def parse_fields(
+    schema: type[BaseModel], fields: Optional[str]
+) -> Optional[frozenset[str]]:
+    """Parse a comma-separated sparse fieldset against a response schema.
+
+    Args:
+        schema: Response schema the fields select from.
+        fields: Raw ``fields`` query value, e.g. "slug,updated_at".
+
+    Returns:
+        Requested field names, or None when all fields are wanted.
+
+    Raises:
+        ValueError: If a field is not part of the schema.
+    """
+    if fields is None:
+        return None
+    names = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    if not names:
+        return None
+    unknown = names - schema.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return names
+
+
+@lru_cache(maxsize=256)
+def partial_schema(
+    schema: type[BaseModel], fields: frozenset[str]
+) -> type[BaseModel]:
+    """Derive a schema with only the given fields of schema.
+
+    Field types and metadata are copied, so validation and serialization of
+    the remaining fields are unchanged.
+    """
+    definitions: dict[str, Any] = {
+        name: (info.annotation, info)
+        for name, info in schema.model_fields.items()
+        if name in fields
+    }
+    return create_model(
+        f"{schema.__name__}Partial",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
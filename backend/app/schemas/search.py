@@ -0,0 +1,25 @@
+"""Search schemas for response validation."""
+
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    """Schema for a single search hit."""
+
+    type: Literal["til", "book_note"]
+    id: UUID
+    slug: str
+    title: str
+    snippet: str  # HTML-escaped matching excerpt with <mark> highlights
+    rank: float
+    book_slug: Optional[str] = None  # Set for book notes
+
+
+class SearchResponse(BaseModel):
+    """Schema for search results."""
+
+    query: str
+    items: list[SearchResult]
@@ -1,7 +1,7 @@
 """TIL schemas for request/response validation."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -50,11 +50,29 @@ class TILResponse(TILBase):
     model_config = {"from_attributes": True}
 
 
+class TILSummaryResponse(BaseModel):
+    """Schema for TIL list items in the summary view (no Markdown content)."""
+
+    id: UUID
+    slug: str
+    title: str
+    day_number: int
+    excerpt: str
+    is_published: bool
+    published_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    tags: list[TagResponse]
+
+    model_config = {"from_attributes": True}
+
+
 class TILListResponse(BaseModel):
     """Schema for paginated TIL list response."""
 
-    items: list[TILResponse]
+    items: list[Union[TILResponse, TILSummaryResponse]]
     total: int
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None  # Keyset cursor for the next page
@@ -1,5 +1,5 @@
 # AI Package
-from app.services.ai.providers import get_llm_provider
+from app.services.ai.providers import close_llm_providers, get_llm_provider
 from app.services.ai.generator import TILGenerator
 
-__all__ = ["get_llm_provider", "TILGenerator"]
+__all__ = ["close_llm_providers", "get_llm_provider", "TILGenerator"]
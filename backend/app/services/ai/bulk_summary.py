@@ -0,0 +1,164 @@
+"""독서 노트 AI 요약 일괄 생성
+
+요약이 없거나 요약 이후 수정된(stale) 노트를 id 순으로 배치 단위로 읽어
+generate_book_note_summary를 동시에 실행합니다. 동시 호출 수는 세마포어로,
+LLM 사용량은 분당 토큰 한도로 제한합니다.
+
+배치마다 결과를 한 번의 UPDATE로 저장하고 커밋하므로, 작업이 중단되더라도
+다시 실행하면 아직 요약되지 않은 노트부터 이어서 처리합니다. 배치를 읽고
+저장하는 세션은 각각 짧게 열고 닫으며, LLM 호출 중에는 세션을 열어 두지
+않습니다.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.caching import (
+    apply_pending_invalidations,
+    invalidate_after_commit,
+    note_write_labels,
+)
+from app.config import settings
+from app.crud import book_crud
+from app.models.book import BookNote
+from app.services.ai.generator import generate_book_note_summary
+from app.services.ai.prompts import BOOK_SUMMARY_PROMPT
+from app.services.ai.ratelimit import TokenRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# 한국어 본문 기준 보수적인 추정치 (글자 2개당 토큰 1개)
+_CHARS_PER_TOKEN = 2
+# 요약 응답(최대 150자)에 쓰일 출력 토큰 추정치
+_OUTPUT_TOKENS = 200
+
+
+def estimate_tokens(note: BookNote) -> int:
+    """노트 하나를 요약하는 데 드는 입력+출력 토큰 추정"""
+    takeaways = note.key_takeaways or []
+    chars = (
+        len(BOOK_SUMMARY_PROMPT)
+        + len(note.content[:2000])
+        + sum(len(t) for t in takeaways)
+    )
+    return chars // _CHARS_PER_TOKEN + _OUTPUT_TOKENS
+
+
+async def summarize_stale_notes(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    concurrency: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> AsyncIterator[dict]:
+    """요약이 없거나 오래된 노트의 AI 요약을 일괄 생성
+
+    Args:
+        session_maker: 배치마다 세션을 여는 세션 팩토리
+        concurrency: 동시 LLM 호출 수 (기본: BULK_SUMMARY_CONCURRENCY)
+        tokens_per_minute: 분당 토큰 한도 (기본: BULK_SUMMARY_TOKENS_PER_MINUTE)
+        batch_size: 한 번에 읽고 저장할 노트 수 (기본: BULK_SUMMARY_BATCH_SIZE)
+        limit: 이번 실행에서 처리할 최대 노트 수 (기본: 전체)
+
+    Yields:
+        진행 이벤트 딕셔너리
+        - start: {"total": 대상 노트 수}
+        - note: {"id": ..., "summary": "..."} (노트마다, 완료 순서대로)
+        - note_error: {"id": ..., "error": "..."}
+        - progress: {"saved": ..., "failed": ..., "stale": ..., "total": ...}
+          (배치 저장 후, stale은 요약 중에 수정되어 저장하지 않은 노트 수)
+        - complete: {"saved": ..., "failed": ..., "stale": ..., "total": ...}
+    """
+    concurrency = concurrency or settings.BULK_SUMMARY_CONCURRENCY
+    batch_size = batch_size or settings.BULK_SUMMARY_BATCH_SIZE
+    limiter = TokenRateLimiter(
+        tokens_per_minute or settings.BULK_SUMMARY_TOKENS_PER_MINUTE
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def summarize(note: BookNote) -> str:
+        async with semaphore:
+            await limiter.acquire(estimate_tokens(note))
+            return await generate_book_note_summary(
+                content=note.content,
+                key_takeaways=note.key_takeaways or [],
+            )
+
+    async with session_maker() as db:
+        total = await book_crud.count_stale_summary_notes(db)
+    if limit is not None:
+        total = min(total, limit)
+    yield {"event": "start", "data": {"total": total}}
+
+    saved = failed = stale = 0
+    after_id: Optional[UUID] = None
+    while saved + failed + stale < total:
+        # 배치를 읽은 세션은 LLM 호출 전에 닫음 (호출과 SSE 전송 동안
+        # 트랜잭션을 열어 둔 채 커넥션을 붙잡지 않도록)
+        async with session_maker() as db:
+            notes = await book_crud.get_stale_summary_notes(
+                db,
+                after_id=after_id,
+                limit=min(batch_size, total - saved - failed - stale),
+            )
+        if not notes:
+            break
+        after_id = notes[-1].id
+
+        tasks = {asyncio.ensure_future(summarize(note)): note for note in notes}
+        summaries: dict[UUID, str] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    note = tasks[task]
+                    error = task.exception()
+                    if error is not None:
+                        failed += 1
+                        logger.warning(
+                            "Summary failed for note %s", note.id, exc_info=error
+                        )
+                        yield {
+                            "event": "note_error",
+                            "data": {"id": str(note.id), "error": str(error)},
+                        }
+                        continue
+                    summaries[note.id] = task.result()
+                    yield {
+                        "event": "note",
+                        "data": {"id": str(note.id), "summary": summaries[note.id]},
+                    }
+        finally:
+            # 소비가 중단되면(클라이언트 연결 종료 등) 남은 호출 취소
+            for task in pending:
+                task.cancel()
+
+        async with session_maker() as db:
+            # 요약 중에 수정된 노트는 저장하지 않음 (다음 실행에서 다시 요약)
+            written = await book_crud.bulk_update_summaries(db, notes, summaries)
+            for note in notes:
+                if note.id in written:
+                    invalidate_after_commit(db, note_write_labels(note))
+            await db.commit()
+            await apply_pending_invalidations(db)
+            saved += len(written)
+            stale += len(summaries) - len(written)
+
+        yield {
+            "event": "progress",
+            "data": {"saved": saved, "failed": failed, "stale": stale, "total": total},
+        }
+
+    yield {
+        "event": "complete",
+        "data": {"saved": saved, "failed": failed, "stale": stale, "total": total},
+    }
+
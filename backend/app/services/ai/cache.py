@@ -0,0 +1,150 @@
+"""LLM 생성 결과 캐시 (로컬 디스크, 콘텐츠 주소 기반)
+
+같은 Provider/모델/시스템 프롬프트/프롬프트 조합의 생성 결과를 디스크에
+저장해 두고, 관리자가 같은 URL이나 텍스트로 여러 번 다시 생성할 때
+LLM을 호출하지 않고 저장된 결과를 돌려줍니다.
+
+- 키: 위 네 값을 JSON으로 직렬화한 SHA-256 해시
+- 저장: <LLM_CACHE_DIR>/<키 앞 2자리>/<키>.json
+- 제거: 전체 크기가 LLM_CACHE_MAX_BYTES를 넘으면 가장 오래 사용되지 않은
+  항목부터 삭제 (조회 시 mtime 갱신, app.cache.DiskLRUStore)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from typing import AsyncIterator, Optional
+
+from app.cache import DiskLRUStore
+from app.config import settings
+from app.services.ai.providers.base import BaseLLMProvider, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationCache:
+    """디스크에 저장되는 LLM 생성 결과 캐시 (크기 기반 LRU 제거)"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.store = DiskLRUStore(directory, max_bytes, name="LLM cache")
+
+    @staticmethod
+    def key(
+        provider: str, model: str, system_prompt: Optional[str], prompt: str
+    ) -> str:
+        """Provider, 모델, 시스템 프롬프트, 프롬프트로 만든 캐시 키"""
+        payload = json.dumps(
+            [provider, model, system_prompt or "", prompt], ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[LLMResponse]:
+        """저장된 응답 반환 (없거나 읽을 수 없으면 None)"""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """응답 저장 후 필요하면 오래된 항목 제거 (실패는 로그만 남김)"""
+        body = json.dumps(asdict(response), ensure_ascii=False).encode()
+        await asyncio.to_thread(self.store.write, key, body)
+
+    def _get(self, key: str) -> Optional[LLMResponse]:
+        body = self.store.read(key)
+        if body is None:
+            return None
+        try:
+            return LLMResponse(**json.loads(body))
+        except (ValueError, TypeError):
+            logger.warning(
+                "Unreadable LLM cache entry %s", self.store.path(key), exc_info=True
+            )
+            return None
+
+
+class CachedLLMProvider(BaseLLMProvider):
+    """생성 결과를 GenerationCache로 캐싱하는 Provider 래퍼
+
+    force=True면 캐시를 읽지 않고 새로 생성한 결과로 캐시를 갱신합니다.
+    """
+
+    # 캐시 적중 시 스트리밍 응답을 재생하는 청크 크기 (문자 수)
+    REPLAY_CHUNK_SIZE = 64
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        cache: GenerationCache,
+        force: bool = False,
+    ):
+        self.provider = provider
+        self.cache = cache
+        self.force = force
+        self.name = provider.name
+
+    def _key(self, prompt: str, system_prompt: Optional[str]) -> str:
+        model = getattr(self.provider, "model", "")
+        return self.cache.key(self.provider.name, model, system_prompt, prompt)
+
+    async def _cached(self, key: str) -> Optional[LLMResponse]:
+        if self.force:
+            return None
+        return await self.cache.get(key)
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+    ) -> LLMResponse:
+        """캐시된 응답을 반환하거나, 없으면 생성 후 저장"""
+        key = self._key(prompt, system_prompt)
+        cached = await self._cached(key)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.generate(prompt, system_prompt)
+        await self.cache.set(key, response)
+        return response
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """캐시된 응답을 청크로 재생하거나, 없으면 스트리밍하며 저장
+
+        스트림이 끝까지 완료된 경우에만 저장합니다.
+        """
+        key = self._key(prompt, system_prompt)
+        cached = await self._cached(key)
+        if cached is not None:
+            content = cached.content
+            for start in range(0, len(content), self.REPLAY_CHUNK_SIZE):
+                yield content[start:start + self.REPLAY_CHUNK_SIZE]
+            return
+
+        chunks = []
+        async for chunk in self.provider.generate_stream(prompt, system_prompt):
+            chunks.append(chunk)
+            yield chunk
+        await self.cache.set(
+            key,
+            LLMResponse(
+                content="".join(chunks),
+                model=getattr(self.provider, "model", ""),
+            ),
+        )
+
+    async def health_check(self) -> bool:
+        """원본 Provider 상태 확인"""
+        return await self.provider.health_check()
+
+
+generation_cache = GenerationCache(settings.LLM_CACHE_DIR, settings.LLM_CACHE_MAX_BYTES)
+
+
+def cached_provider(provider: BaseLLMProvider, force: bool = False) -> BaseLLMProvider:
+    """LLM_CACHE_ENABLED면 provider를 생성 캐시로 감싸서 반환"""
+    if not settings.LLM_CACHE_ENABLED:
+        return provider
+    return CachedLLMProvider(provider, generation_cache, force=force)
@@ -1,28 +1,55 @@
 """TIL 생성기 - 메인 오케스트레이터"""
 
+import asyncio
 import json
-from typing import AsyncIterator, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+from typing import Any, AsyncIterator, Optional
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from fastapi import UploadFile
 
-from app.services.ai.providers import get_llm_provider
+from app.config import settings
+from app.services.ai.cache import cached_provider
+from app.services.ai.providers import BaseLLMProvider, get_llm_provider
+from app.services.ai.streaming import coalesce_chunks
 from app.services.ai.prompts import (
     TIL_SYSTEM_PROMPT,
     build_til_prompt,
     TITLE_PROMPT,
     EXCERPT_PROMPT,
+    METADATA_PROMPT,
 )
 from app.services.content.extractors.url import ContentProcessor
 from app.crud import til as til_crud
 
+logger = logging.getLogger(__name__)
+
 
 class TILGenerator:
     """TIL 생성 오케스트레이터"""
 
-    def __init__(self, db: Optional[AsyncSession] = None):
+    def __init__(
+        self,
+        db: Optional[AsyncSession] = None,
+        provider: Optional[BaseLLMProvider] = None,
+        structured_metadata: Optional[bool] = None,
+        force: bool = False,
+    ):
+        """
+        Args:
+            db: day_number 조회용 DB 세션
+            provider: 사용할 LLM Provider (기본: 공유 Anthropic Provider)
+            structured_metadata: 제목/요약을 JSON 한 번의 호출로 생성할지 여부
+                (기본: LLM_STRUCTURED_METADATA 설정)
+            force: 생성 캐시를 무시하고 새로 생성
+        """
         self.db = db
-        self.provider = get_llm_provider("anthropic")
+        self.provider = cached_provider(
+            provider or get_llm_provider("anthropic"), force=force
+        )
         self.content_processor = ContentProcessor()
+        if structured_metadata is None:
+            structured_metadata = settings.LLM_STRUCTURED_METADATA
+        self.structured_metadata = structured_metadata
 
     async def get_next_day_number(self) -> int:
         """다음 day_number 반환"""
@@ -36,6 +63,7 @@ class TILGenerator:
         input_type: str,
         content: Optional[str] = None,
         file: Optional[UploadFile] = None,
+        day_number: Optional[int] = None,
     ) -> AsyncIterator[dict]:
         """SSE 스트리밍 TIL 생성
         
@@ -43,13 +71,15 @@ class TILGenerator:
             input_type: "text", "url", 또는 "file"
             content: 텍스트 내용 또는 URL (input_type이 "file"이 아닐 때)
             file: 업로드된 파일 (input_type이 "file"일 때)
+            day_number: 미리 조회한 day_number (없으면 DB에서 조회)
         
         Yields:
             SSE 이벤트 딕셔너리
         """
         try:
             # 1. Day Number
-            day_number = await self.get_next_day_number()
+            if day_number is None:
+                day_number = await self.get_next_day_number()
             yield {"event": "day_number", "data": {"day_number": day_number}}
 
             # 2. 콘텐츠 처리
@@ -63,30 +93,31 @@ class TILGenerator:
             prompt = build_til_prompt(processed_content)
             content_buffer = []
             
-            async for chunk in self.provider.generate_stream(
-                prompt, TIL_SYSTEM_PROMPT
+            # 짧은 델타를 모아 LLM_STREAM_FLUSH_MS / _BYTES 단위로 전송
+            async for chunk in coalesce_chunks(
+                self.provider.generate_stream(prompt, TIL_SYSTEM_PROMPT),
+                max_delay=settings.LLM_STREAM_FLUSH_MS / 1000,
+                max_bytes=settings.LLM_STREAM_FLUSH_BYTES,
             ):
                 content_buffer.append(chunk)
                 yield {"event": "content_chunk", "data": {"chunk": chunk}}
 
             full_content = "".join(content_buffer)
 
-            # 4. 제목 생성
-            title = await self._generate_title(full_content)
-            yield {"event": "title", "data": {"title": title}}
+            # 4. 제목/요약 동시 생성 - 먼저 끝난 쪽부터 이벤트 전송
+            metadata = {}
+            async for field, value in self._generate_metadata(full_content):
+                metadata[field] = value
+                yield {"event": field, "data": {field: value}}
 
-            # 5. 요약 생성
-            excerpt = await self._generate_excerpt(full_content)
-            yield {"event": "excerpt", "data": {"excerpt": excerpt}}
-
-            # 6. 완료
+            # 5. 완료
             yield {
                 "event": "complete",
                 "data": {
                     "success": True,
                     "day_number": day_number,
-                    "title": title,
-                    "excerpt": excerpt,
+                    "title": metadata["title"],
+                    "excerpt": metadata["excerpt"],
                     "content": full_content,
                 }
             }
@@ -119,44 +150,132 @@ class TILGenerator:
         response = await self.provider.generate(prompt, TIL_SYSTEM_PROMPT)
         full_content = response.content
 
-        # 제목/요약 생성
-        title = await self._generate_title(full_content)
-        excerpt = await self._generate_excerpt(full_content)
+        # 제목/요약 동시 생성
+        metadata = {
+            field: value
+            async for field, value in self._generate_metadata(full_content)
+        }
         day_number = await self.get_next_day_number()
 
         return {
             "day_number": day_number,
-            "title": title,
-            "excerpt": excerpt,
+            "title": metadata["title"],
+            "excerpt": metadata["excerpt"],
             "content": full_content,
         }
 
+    async def _generate_metadata(self, content: str) -> AsyncIterator[tuple[str, str]]:
+        """제목과 요약을 생성하여 완료되는 순서대로 (필드명, 값) 반환
+
+        structured_metadata가 켜져 있으면 JSON 한 번의 호출로 둘 다 생성하고,
+        아니면 두 호출을 동시에 실행해 LLM 왕복 지연을 한 번으로 줄입니다.
+        """
+        if self.structured_metadata:
+            metadata = await self._generate_metadata_structured(content)
+            if metadata is not None:
+                for field, value in metadata.items():
+                    yield field, value
+                return
+
+        tasks = {
+            asyncio.ensure_future(self._generate_title(content)): "title",
+            asyncio.ensure_future(self._generate_excerpt(content)): "excerpt",
+        }
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield tasks[task], task.result()
+        finally:
+            # 한쪽이 실패하거나 소비가 중단되면 나머지 호출도 취소
+            for task in tasks:
+                task.cancel()
+
+    async def _generate_metadata_structured(self, content: str) -> Optional[dict]:
+        """JSON 한 번의 호출로 제목/요약 생성 (파싱 실패 시 None)"""
+        prompt = METADATA_PROMPT.format(content=content[:3000])
+        response = await self.provider.generate(prompt)
+        text = response.content
+        try:
+            data = json.loads(text[text.index("{"):text.rindex("}") + 1])
+            title, excerpt = data["title"], data["excerpt"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Structured title/excerpt response was not valid JSON")
+            return None
+        if not isinstance(title, str) or not isinstance(excerpt, str):
+            return None
+        return {
+            "title": self._clean_title(title),
+            "excerpt": self._clean_excerpt(excerpt),
+        }
+
     async def _generate_title(self, content: str) -> str:
         """콘텐츠 기반 제목 생성"""
         prompt = TITLE_PROMPT.format(content=content[:2000])
         response = await self.provider.generate(prompt)
-        return response.content.strip().strip('"').strip("'")
+        return self._clean_title(response.content)
 
     async def _generate_excerpt(self, content: str) -> str:
         """콘텐츠 기반 요약 생성"""
         prompt = EXCERPT_PROMPT.format(content=content[:3000])
         response = await self.provider.generate(prompt)
-        return response.content.strip()[:200]
+        return self._clean_excerpt(response.content)
+
+    @staticmethod
+    def _clean_title(title: str) -> str:
+        return title.strip().strip('"').strip("'")
+
+    @staticmethod
+    def _clean_excerpt(excerpt: str) -> str:
+        return excerpt.strip()[:200]
+
+
+async def generate_til_job(
+    session_maker: async_sessionmaker[AsyncSession], params: dict[str, Any]
+) -> AsyncIterator[dict]:
+    """작업 큐(app.jobs)에서 실행되는 TIL 생성 핸들러
+
+    day_number는 짧은 세션으로 먼저 조회하고, 수십 초 걸리는 LLM 호출
+    동안에는 DB 연결을 잡고 있지 않습니다.
+
+    Args:
+        session_maker: DB 세션 팩토리
+        params: {"input_type": "text" | "url", "content": ..., "force": bool}
+
+    Yields:
+        stream_generate와 같은 SSE 이벤트 딕셔너리
+    """
+    async with session_maker() as db:
+        max_day = await til_crud.get_max_day_number(db)
+
+    generator = TILGenerator(force=params.get("force", False))
+    async for event in generator.stream_generate(
+        input_type=params["input_type"],
+        content=params["content"],
+        day_number=(max_day or 0) + 1,
+    ):
+        yield event
 
 
-async def generate_book_note_summary(content: str, key_takeaways: list[str]) -> str:
+async def generate_book_note_summary(
+    content: str, key_takeaways: list[str], force: bool = False
+) -> str:
     """독서 노트의 짧은 AI 요약 생성
     
     Args:
         content: 노트 본문
         key_takeaways: 핵심 포인트 목록
+        force: 생성 캐시를 무시하고 새로 생성
         
     Returns:
         짧은 요약 (최대 150자)
     """
     from app.services.ai.prompts import BOOK_SUMMARY_PROMPT
     
-    provider = get_llm_provider("anthropic")
+    provider = cached_provider(get_llm_provider("anthropic"), force=force)
     
     takeaways_text = "\n".join(f"- {t}" for t in key_takeaways) if key_takeaways else "없음"
     prompt = BOOK_SUMMARY_PROMPT.format(
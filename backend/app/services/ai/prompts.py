@@ -104,6 +104,27 @@ EXCERPT_PROMPT = """다음 TIL 콘텐츠의 핵심을 요약해주세요.
 요약만 출력해주세요:"""
 
 
+METADATA_PROMPT = """다음 TIL 콘텐츠의 제목과 요약을 생성해주세요.
+
+제목 규칙:
+- 100자 이내
+- 동사 또는 핵심 개념으로 시작
+- 구체적이고 설명적
+- 클릭베이트 지양
+
+요약 규칙:
+- 1-2문장
+- 최대 200자
+- 핵심 학습 포인트 포함
+- 흥미를 유발
+
+콘텐츠:
+{content}
+
+다른 설명 없이 다음 JSON 형식으로만 출력해주세요:
+{{"title": "제목", "excerpt": "요약"}}"""
+
+
 # ============ Book Note Summary Prompt ============
 
 
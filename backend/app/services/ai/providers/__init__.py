@@ -1,18 +1,46 @@
 """LLM Provider Factory"""
 
+from typing import Optional
+
+from app.config import settings
 from app.services.ai.providers.base import BaseLLMProvider
 from app.services.ai.providers.anthropic import AnthropicProvider
 
+# (provider_type, model) -> 프로세스 전역 Provider 인스턴스
+_providers: dict[tuple[str, str], BaseLLMProvider] = {}
+
 
-def get_llm_provider(provider_type: str = "anthropic") -> BaseLLMProvider:
+def get_llm_provider(
+    provider_type: str = "anthropic", model: Optional[str] = None
+) -> BaseLLMProvider:
     """LLM Provider 인스턴스 반환
     
     현재는 Claude만 지원합니다. 추후 다른 Provider 추가 시 확장.
+    Provider와 모델 조합마다 하나의 인스턴스를 재사용하므로, 요청마다
+    HTTP 커넥션 풀을 새로 만들지 않고 TLS 연결을 이어서 사용합니다.
+    인스턴스는 애플리케이션 종료 시 close_llm_providers()로 정리됩니다.
     """
     if provider_type == "anthropic":
-        return AnthropicProvider()
+        key = (provider_type, model or settings.ANTHROPIC_MODEL)
+        provider = _providers.get(key)
+        if provider is None:
+            provider = _providers[key] = AnthropicProvider(model=key[1])
+        return provider
     else:
         raise ValueError(f"지원하지 않는 Provider: {provider_type}")
 
 
-__all__ = ["get_llm_provider", "BaseLLMProvider", "AnthropicProvider"]
+async def close_llm_providers() -> None:
+    """생성된 모든 Provider의 HTTP 커넥션 풀을 닫고 캐시를 비움"""
+    providers = list(_providers.values())
+    _providers.clear()
+    for provider in providers:
+        await provider.close()
+
+
+__all__ = [
+    "get_llm_provider",
+    "close_llm_providers",
+    "BaseLLMProvider",
+    "AnthropicProvider",
+]
@@ -2,6 +2,7 @@
 
 from typing import AsyncIterator, Optional
 import anthropic
+import httpx
 
 from app.services.ai.providers.base import BaseLLMProvider, LLMResponse
 from app.config import settings
@@ -10,12 +11,32 @@ from app.config import settings
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude Provider"""
 
+    name = "anthropic"
     DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
 
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         self.api_key = api_key or settings.ANTHROPIC_API_KEY
         self.model = model or getattr(settings, 'ANTHROPIC_MODEL', self.DEFAULT_MODEL)
-        self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            http_client=http_client or self._default_http_client(),
+        )
+
+    @staticmethod
+    def _default_http_client() -> httpx.AsyncClient:
+        """설정값(LLM_HTTP_*)으로 커넥션 풀 크기와 keep-alive를 지정한 HTTP 클라이언트"""
+        return anthropic.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
 
     async def generate(
         self,
@@ -66,3 +87,7 @@ class AnthropicProvider(BaseLLMProvider):
             return True
         except Exception:
             return False
+
+    async def close(self) -> None:
+        """HTTP 커넥션 풀 종료"""
+        await self.client.close()
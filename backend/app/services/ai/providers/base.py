@@ -17,6 +17,9 @@ class LLMResponse:
 class BaseLLMProvider(ABC):
     """LLM Provider 추상 베이스 클래스"""
 
+    # Provider 식별자 (생성 캐시 키에 사용)
+    name: str = ""
+
     @abstractmethod
     async def generate(
         self,
@@ -39,3 +42,6 @@ class BaseLLMProvider(ABC):
     async def health_check(self) -> bool:
         """Provider 상태 확인"""
         pass
+
+    async def close(self) -> None:  # noqa: B027
+        """HTTP 커넥션 풀 등 Provider 리소스 정리 (기본: 없음)"""
@@ -0,0 +1,44 @@
+"""LLM 토큰 사용량 제한"""
+
+import asyncio
+import time
+from typing import Callable
+
+
+class TokenRateLimiter:
+    """토큰 버킷 방식의 분당 토큰 사용량 제한
+
+    버킷은 분당 한도만큼 채워진 상태로 시작하고 초당 (한도 / 60)씩 다시
+    채워집니다. 대기 중인 요청은 도착 순서대로 처리됩니다.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, tokens: int) -> None:
+        """tokens만큼 사용할 수 있을 때까지 대기 (한도보다 크면 한도만큼)"""
+        needed = min(float(tokens), self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < needed:
+                await asyncio.sleep((needed - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= needed
@@ -0,0 +1,103 @@
+"""LLM 스트림 청크 병합
+
+Anthropic의 text_stream은 몇 글자짜리 델타를 TIL 하나에 수천 개 보내므로,
+델타마다 SSE 이벤트를 만들면 이벤트마다 JSON 인코딩, 소켓 쓰기, 프론트엔드
+렌더링이 일어납니다. coalesce_chunks는 델타를 모아 일정 시간 또는 일정
+크기 중 먼저 도달하는 시점에 한 번에 내보냅니다.
+"""
+
+import asyncio
+import contextlib
+from collections import deque
+from typing import AsyncIterator, Optional
+
+
+async def coalesce_chunks(
+    chunks: AsyncIterator[str],
+    max_delay: float,
+    max_bytes: int,
+) -> AsyncIterator[str]:
+    """청크를 모아서 max_delay초 또는 max_bytes 바이트마다 내보냄
+
+    모은 청크는 첫 청크가 도착한 뒤 max_delay초가 지나면 다음 청크를 기다리지
+    않고 바로 내보내므로, 모델이 잠시 멈춰도 체감 지연은 max_delay를 넘지
+    않습니다.
+
+    Args:
+        chunks: 원본 텍스트 스트림
+        max_delay: 청크를 모아 두는 최대 시간 (초, 0 이하면 병합하지 않음)
+        max_bytes: 모아 둔 UTF-8 크기가 이 값 이상이면 바로 내보냄 (한 프레임은
+            이 값에 처음 도달하게 한 청크까지만 담음)
+
+    Yields:
+        병합된 텍스트
+    """
+    if max_delay <= 0:
+        async for chunk in chunks:
+            yield chunk
+        return
+
+    buffer: deque[tuple[str, int]] = deque()  # (청크, UTF-8 크기)
+    size = 0
+    ready = asyncio.Event()  # 버퍼에 청크가 있거나 스트림이 끝남
+    full = asyncio.Event()  # max_bytes에 도달했거나 스트림이 끝남
+    finished = False
+    error: Optional[Exception] = None
+
+    async def pump() -> None:
+        # 원본 스트림은 이 태스크 하나가 소비 (델타마다 태스크를 만들지 않음)
+        nonlocal size, finished, error
+        try:
+            async for chunk in chunks:
+                nbytes = len(chunk.encode())
+                buffer.append((chunk, nbytes))
+                size += nbytes
+                ready.set()
+                if size >= max_bytes:
+                    full.set()
+        except Exception as e:
+            error = e
+        finally:
+            finished = True
+            ready.set()
+            full.set()
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            await ready.wait()
+            if not full.is_set():
+                # 첫 청크부터 max_delay가 지나거나 max_bytes가 찰 때까지 더 모음
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(max_delay):
+                        await full.wait()
+
+            # 한 프레임은 max_bytes를 넘는 시점까지만 (캐시 재생처럼 한꺼번에
+            # 들어온 청크는 여러 프레임으로 나눔)
+            parts = []
+            frame_size = 0
+            while buffer and frame_size < max_bytes:
+                chunk, nbytes = buffer.popleft()
+                parts.append(chunk)
+                frame_size += nbytes
+            size -= frame_size
+            frame = "".join(parts)
+            done = finished and not buffer
+            if not finished:
+                if not buffer:
+                    ready.clear()
+                if size < max_bytes:
+                    full.clear()
+            if frame:
+                yield frame
+            if done:
+                if error is not None:
+                    raise error
+                return
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -1,4 +1,15 @@
 # Content Extraction Package
-from app.services.content.extractors.url import URLExtractor
+# URLExtractor는 처음 접근할 때 임포트 (프로세스 풀 워커가 parsing 모듈을
+# 가져올 때 fastapi, 설정, 페처까지 함께 임포트하지 않도록)
+
+from typing import Any
 
 __all__ = ["URLExtractor"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "URLExtractor":
+        from app.services.content.extractors.url import URLExtractor
+
+        return URLExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,9 @@
 """파일 콘텐츠 추출기"""
 
+import codecs
 from dataclasses import dataclass
 from typing import Optional
-from fastapi import UploadFile
+from starlette.datastructures import UploadFile
 
 
 @dataclass
@@ -13,10 +14,21 @@ class ExtractedContent:
     filename: Optional[str] = None
 
 
+class FileTooLargeError(ValueError):
+    """업로드 파일이 MAX_FILE_SIZE를 넘음"""
+
+
 class FileExtractor:
-    """파일에서 콘텐츠를 추출합니다."""
+    """파일에서 콘텐츠를 추출합니다.
+
+    업로드를 CHUNK_SIZE씩 읽으면서 크기 제한을 확인하고 바로 디코딩하므로,
+    파일 전체를 bytes로 메모리에 올리지 않습니다. 크기 제한은 Starlette가
+    업로드를 이미 스풀한 뒤에 적용되어 디코딩만 줄여 주므로, 업로드 자체는
+    엔드포인트에서 Content-Length로 먼저 거부해야 합니다.
+    """
 
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    CHUNK_SIZE = 64 * 1024
     SUPPORTED_EXTENSIONS = {".md", ".markdown", ".txt", ".mdx"}
 
     def supports(self, filename: str, content_type: Optional[str] = None) -> bool:
@@ -35,41 +47,68 @@ class FileExtractor:
         ext = "." + filename.rsplit(".", 1)[-1].lower()
         return ext in self.SUPPORTED_EXTENSIONS
 
-    async def extract(self, file: UploadFile) -> ExtractedContent:
+    async def extract(
+        self, file: UploadFile, max_chars: Optional[int] = None
+    ) -> ExtractedContent:
         """파일에서 콘텐츠 추출
         
         Args:
             file: 업로드된 파일
+            max_chars: 보관할 최대 문자 수 (이후 내용은 크기 확인만 하고 버림)
             
         Returns:
             추출된 콘텐츠
+
+        Raises:
+            FileTooLargeError: 파일이 MAX_FILE_SIZE를 넘을 때 (넘는 즉시 디코딩 중단)
+            ValueError: 파일명이 없을 때
         """
         if not file.filename:
             raise ValueError("파일명이 없습니다.")
-        
-        # 파일 크기 확인
-        content = await file.read()
-        if len(content) > self.MAX_FILE_SIZE:
-            raise ValueError(
-                f"파일 크기는 {self.MAX_FILE_SIZE // 1024 // 1024}MB를 초과할 수 없습니다"
-            )
-        
-        # UTF-8로 디코딩
+
+        # 크기를 이미 알면 읽기 전에 거부
+        if file.size is not None:
+            self.check_size(file.size)
+
+        # UTF-8로 디코딩하고, 실패하면 처음부터 latin-1로 다시 읽음
         try:
-            text = content.decode("utf-8")
+            text = await self._decode(file, "utf-8", max_chars)
         except UnicodeDecodeError:
-            # UTF-8 실패 시 다른 인코딩 시도
-            try:
-                text = content.decode("latin-1")
-            except Exception as e:
-                raise ValueError(f"파일을 읽을 수 없습니다: {e}")
-        
+            await file.seek(0)
+            text = await self._decode(file, "latin-1", max_chars)
+
         return ExtractedContent(
             text=text,
             filename=file.filename,
         )
 
+    async def _decode(
+        self, file: UploadFile, encoding: str, max_chars: Optional[int]
+    ) -> str:
+        """파일을 청크 단위로 읽으며 크기 제한 확인과 증분 디코딩"""
+        decoder = codecs.getincrementaldecoder(encoding)()
+        parts: list[str] = []
+        kept = 0
+        size = 0
+        while chunk := await file.read(self.CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.MAX_FILE_SIZE:
+                raise self._too_large()
+            # 잘라낼 부분도 끝까지 디코딩해서 인코딩 오류는 그대로 감지
+            part = decoder.decode(chunk)
+            if max_chars is None or kept < max_chars:
+                parts.append(part)
+                kept += len(part)
+        parts.append(decoder.decode(b"", final=True))
+        text = "".join(parts)
+        return text if max_chars is None else text[:max_chars]
 
+    def check_size(self, size: int) -> None:
+        """크기가 MAX_FILE_SIZE를 넘으면 FileTooLargeError 발생"""
+        if size > self.MAX_FILE_SIZE:
+            raise self._too_large()
 
-
-
+    def _too_large(self) -> FileTooLargeError:
+        return FileTooLargeError(
+            f"파일 크기는 {self.MAX_FILE_SIZE // 1024 // 1024}MB를 초과할 수 없습니다"
+        )
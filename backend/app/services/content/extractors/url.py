@@ -1,12 +1,14 @@
 """URL 콘텐츠 추출기"""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Optional
 
-import httpx
-from bs4 import BeautifulSoup
-from readability import Document
-from fastapi import UploadFile
+from starlette.datastructures import UploadFile
+
+from app.services.content.fetch_cache import CachedPage, FetchCache, get_fetch_cache
+from app.services.content.fetcher import HTTPFetcher, get_http_fetcher
+from app.services.content.parsing import PARSER_VERSION, parse_article
+from app.services.content.pool import ParsePool, get_parse_pool
 
 
 @dataclass
@@ -20,81 +22,91 @@ class ExtractedContent:
 class URLExtractor:
     """URL에서 본문 콘텐츠를 추출합니다."""
 
-    TIMEOUT = 30.0
     USER_AGENT = (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
+    def __init__(
+        self,
+        fetcher: Optional[HTTPFetcher] = None,
+        parse_pool: Optional[ParsePool] = None,
+        cache: Optional[FetchCache] = None,
+    ):
+        """
+        Args:
+            fetcher: 사용할 HTTP 페처 (기본: 프로세스 전역 페처)
+            parse_pool: HTML 파싱을 실행할 풀 (기본: 프로세스 전역 풀)
+            cache: 페이지 캐시 (기본: URL_FETCH_CACHE_ENABLED면 전역 캐시)
+        """
+        self.fetcher = fetcher or get_http_fetcher()
+        self.parse_pool = parse_pool or get_parse_pool()
+        self.cache = cache or get_fetch_cache()
+
     async def extract(self, url: str) -> ExtractedContent:
         """URL에서 콘텐츠 추출
-        
+
+        캐시된 페이지가 있으면 조건부 요청으로 재검증하고, 304 Not Modified면
+        저장된 추출 결과를 다시 파싱하지 않고 반환합니다.
+
         Args:
             url: 추출할 웹 페이지 URL
             
         Returns:
             추출된 콘텐츠 (텍스트, 제목, URL)
         """
-        async with httpx.AsyncClient(
-            timeout=self.TIMEOUT,
-            follow_redirects=True
-        ) as client:
-            response = await client.get(
-                url,
-                headers={"User-Agent": self.USER_AGENT}
-            )
-            response.raise_for_status()
-
-        # readability로 본문 추출
-        doc = Document(response.text)
-        soup = BeautifulSoup(doc.summary(), "html.parser")
-
-        # 코드 블록 보존
-        for pre in soup.find_all("pre"):
-            code = pre.find("code")
-            if code:
-                lang = ""
-                if code.get("class"):
-                    for cls in code.get("class", []):
-                        if cls.startswith("language-"):
-                            lang = cls.replace("language-", "")
-                            break
-                code_text = code.get_text()
-                pre.replace_with(f"\n```{lang}\n{code_text}\n```\n")
-
-        # 인라인 코드 보존
-        for code in soup.find_all("code"):
-            code.replace_with(f"`{code.get_text()}`")
-
-        # 링크 텍스트 보존
-        for a in soup.find_all("a"):
-            href = a.get("href", "")
-            text = a.get_text()
-            if href and text:
-                a.replace_with(f"[{text}]({href})")
-
-        text = soup.get_text(separator="\n", strip=True)
-        
-        # 과도한 빈 줄 정리
-        lines = text.split("\n")
-        cleaned_lines = []
-        empty_count = 0
-        for line in lines:
-            if not line.strip():
-                empty_count += 1
-                if empty_count <= 2:
-                    cleaned_lines.append("")
-            else:
-                empty_count = 0
-                cleaned_lines.append(line)
-        
-        text = "\n".join(cleaned_lines)
-
-        return ExtractedContent(
-            text=text,
-            title=doc.title(),
+        cached = await self.cache.get(url) if self.cache else None
+        headers = {"User-Agent": self.USER_AGENT}
+        if cached:
+            headers.update(cached.conditional_headers())
+
+        page = await self.fetcher.fetch(url, headers=headers)
+        body = page.text
+        etag = page.headers.get("etag")
+        last_modified = page.headers.get("last-modified")
+
+        if page.status_code == 304:
+            if cached is None:
+                raise ValueError(f"조건부 요청이 아닌데 304 응답을 받았습니다: {url}")
+            if cached.extracted and cached.parser_version == PARSER_VERSION:
+                return ExtractedContent(**cached.extracted)
+            # 파서가 바뀐 경우 저장된 원본 본문을 다시 파싱
+            body = cached.body
+            etag = etag or cached.etag
+            last_modified = last_modified or cached.last_modified
+
+        # 본문 추출은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        article = await self.parse_pool.run(parse_article, body)
+
+        extracted = ExtractedContent(
+            text=article.text,
+            title=article.title,
             url=url,
         )
+        await self._store(url, body, etag, last_modified, extracted)
+        return extracted
+
+    async def _store(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        extracted: ExtractedContent,
+    ) -> None:
+        """검증자(ETag, Last-Modified)가 있는 응답만 캐시에 저장"""
+        if self.cache is None or not (etag or last_modified):
+            return  # 재검증할 수 없으면 저장하지 않음
+        await self.cache.set(
+            CachedPage(
+                url=url,
+                body=body,
+                etag=etag,
+                last_modified=last_modified,
+                parser_version=PARSER_VERSION,
+                extracted=asdict(extracted),
+            )
+        )
 
 
 class ContentProcessor:
@@ -140,7 +152,10 @@ class ContentProcessor:
         elif input_type == "text" and content:
             text = content
         elif input_type == "file" and file:
-            extracted = await self.file_extractor.extract(file)
+            # 잘릴 부분은 보관하지 않음 (크기 제한 확인만)
+            extracted = await self.file_extractor.extract(
+                file, max_chars=self.MAX_CONTENT_LENGTH
+            )
             text = extracted.text
             # 원본 파일 정보 추가
             if extracted.filename:
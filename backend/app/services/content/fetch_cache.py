@@ -0,0 +1,94 @@
+"""URL 페이지 캐시 (로컬 디스크, 조건부 요청으로 재검증)
+
+관리자가 같은 문서 URL로 TIL을 여러 번 다시 생성할 때마다 페이지를 새로
+받아 파싱하지 않도록, 원본 본문과 검증자(ETag, Last-Modified), 추출 결과를
+URL별로 저장합니다. 다음 요청은 If-None-Match/If-Modified-Since로 보내고
+304 Not Modified를 받으면 저장된 추출 결과를 그대로 씁니다.
+
+- 키: URL의 SHA-256 해시
+- 저장: <URL_FETCH_CACHE_DIR>/<키 앞 2자리>/<키>.json
+- 제거: 전체 크기가 URL_FETCH_CACHE_MAX_BYTES를 넘으면 가장 오래 사용되지
+  않은 항목부터 삭제 (조회 시 mtime 갱신, app.cache.DiskLRUStore)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from app.cache import DiskLRUStore
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedPage:
+    """캐시된 페이지 (원본 본문, 검증자, 추출 결과)"""
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    parser_version: int = 0  # extracted를 만든 parsing.PARSER_VERSION
+    extracted: Optional[dict[str, Any]] = None  # ExtractedContent 필드
+
+    def conditional_headers(self) -> dict[str, str]:
+        """재검증 요청 헤더 (If-None-Match, If-Modified-Since)"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class FetchCache:
+    """디스크에 저장되는 URL 페이지 캐시 (크기 기반 LRU 제거)"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.store = DiskLRUStore(directory, max_bytes, name="fetch cache")
+
+    @staticmethod
+    def key(url: str) -> str:
+        """URL로 만든 캐시 키"""
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _path(self, url: str) -> Path:
+        return self.store.path(self.key(url))
+
+    async def get(self, url: str) -> Optional[CachedPage]:
+        """저장된 페이지 반환 (없거나 읽을 수 없으면 None)"""
+        return await asyncio.to_thread(self._get, url)
+
+    async def set(self, page: CachedPage) -> None:
+        """페이지 저장 후 필요하면 오래된 항목 제거 (실패는 로그만 남김)"""
+        body = json.dumps(asdict(page), ensure_ascii=False).encode()
+        await asyncio.to_thread(self.store.write, self.key(page.url), body)
+
+    def _get(self, url: str) -> Optional[CachedPage]:
+        body = self.store.read(self.key(url))
+        if body is None:
+            return None
+        try:
+            page = CachedPage(**json.loads(body))
+        except (ValueError, TypeError):
+            logger.warning(
+                "Unreadable fetch cache entry %s", self._path(url), exc_info=True
+            )
+            return None
+        if page.url != url:
+            return None  # 해시 충돌
+        return page
+
+
+fetch_cache = FetchCache(settings.URL_FETCH_CACHE_DIR, settings.URL_FETCH_CACHE_MAX_BYTES)
+
+
+def get_fetch_cache() -> Optional[FetchCache]:
+    """URL_FETCH_CACHE_ENABLED면 전역 FetchCache, 아니면 None"""
+    if not settings.URL_FETCH_CACHE_ENABLED:
+        return None
+    return fetch_cache
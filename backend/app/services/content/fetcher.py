@@ -0,0 +1,211 @@
+"""웹 페이지 HTTP 페처
+
+URL 추출마다 httpx.AsyncClient를 새로 만들면 같은 도메인을 다시 가져올 때도
+DNS 조회와 TCP/TLS 연결을 처음부터 반복합니다. HTTPFetcher는 프로세스 전역
+클라이언트 하나로 연결을 재사용하고(h2가 설치되어 있으면 HTTP/2), 본문을
+스트리밍으로 읽어 크기 제한을 넘는 즉시 중단합니다.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchedPage:
+    """가져온 웹 페이지"""
+    url: str  # 리다이렉트 후 최종 URL
+    text: str
+    status_code: int = 200
+    headers: dict[str, str] = field(default_factory=dict)  # 소문자 키
+
+
+@dataclass
+class _HostLimit:
+    """호스트별 동시 요청 제한 (users: 대기 중이거나 실행 중인 요청 수)"""
+    semaphore: asyncio.Semaphore
+    users: int = 0
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HTTPFetcher:
+    """공유 커넥션 풀로 웹 페이지를 가져옵니다 (크기/시간 제한, 호스트별 동시 연결 제한)."""
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            max_bytes: 본문 최대 크기 (기본: URL_FETCH_MAX_BYTES)
+            connect_timeout: 연결 제한 시간 (초, 기본: URL_FETCH_CONNECT_TIMEOUT)
+            read_timeout: 읽기 사이 최대 대기 시간 (초, 기본: URL_FETCH_READ_TIMEOUT)
+            total_timeout: 요청 전체 제한 시간 (초, 기본: URL_FETCH_TOTAL_TIMEOUT)
+            max_connections: 전체 연결 수 (기본: URL_FETCH_MAX_CONNECTIONS)
+            max_connections_per_host: 호스트별 동시 요청 수
+                (기본: URL_FETCH_MAX_CONNECTIONS_PER_HOST)
+            http2: HTTP/2 사용 여부 (기본: URL_FETCH_HTTP2, h2 패키지 필요)
+            transport: httpx 전송 계층 (테스트용)
+        """
+        self.max_bytes = max_bytes or settings.URL_FETCH_MAX_BYTES
+        self.total_timeout = total_timeout or settings.URL_FETCH_TOTAL_TIMEOUT
+        self.max_connections_per_host = (
+            max_connections_per_host or settings.URL_FETCH_MAX_CONNECTIONS_PER_HOST
+        )
+        if http2 is None:
+            http2 = settings.URL_FETCH_HTTP2
+        if http2 and not _http2_available():
+            logger.warning("h2 is not installed; fetching URLs over HTTP/1.1")
+            http2 = False
+
+        connect_timeout = connect_timeout or settings.URL_FETCH_CONNECT_TIMEOUT
+        read_timeout = read_timeout or settings.URL_FETCH_READ_TIMEOUT
+        max_connections = max_connections or settings.URL_FETCH_MAX_CONNECTIONS
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            follow_redirects=True,
+            timeout=httpx.Timeout(
+                connect=connect_timeout,
+                read=read_timeout,
+                write=read_timeout,
+                pool=connect_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+        # 요청이 남아 있는 호스트만 보관 (가져온 호스트 수만큼 계속 늘지 않도록)
+        self._host_limits: dict[str, _HostLimit] = {}
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str) -> AsyncIterator[None]:
+        """호스트별 동시 요청 수 제한 안에서 실행"""
+        host = urlsplit(url).netloc.lower()
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = _HostLimit(
+                asyncio.Semaphore(self.max_connections_per_host)
+            )
+        limit.users += 1
+        try:
+            async with limit.semaphore:
+                yield
+        finally:
+            limit.users -= 1
+            if not limit.users:
+                del self._host_limits[host]
+
+    async def fetch(
+        self, url: str, headers: Optional[dict[str, str]] = None
+    ) -> FetchedPage:
+        """URL의 본문을 max_bytes까지 스트리밍으로 읽어서 반환
+
+        Args:
+            url: 가져올 URL
+            headers: 추가 요청 헤더
+
+        Returns:
+            가져온 페이지
+
+        Raises:
+            ValueError: 본문이 max_bytes를 넘거나 total_timeout 안에 끝나지 않을 때
+            httpx.HTTPError: 연결 실패, 읽기 시간 초과, 4xx/5xx 응답
+
+        조건부 요청(If-None-Match 등)에 304 Not Modified가 오면 본문 없이
+        status_code=304인 페이지를 반환합니다.
+        """
+        try:
+            async with self._host_slot(url), asyncio.timeout(self.total_timeout):
+                return await self._fetch(url, headers or {})
+        except TimeoutError:
+            raise ValueError(
+                f"페이지를 {self.total_timeout:g}초 안에 가져오지 못했습니다: {url}"
+            ) from None
+
+    async def _fetch(self, url: str, headers: dict[str, str]) -> FetchedPage:
+        async with self.client.stream("GET", url, headers=headers) as response:
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                return FetchedPage(
+                    url=str(response.url),
+                    text="",
+                    status_code=response.status_code,
+                    headers=dict(response.headers),
+                )
+            response.raise_for_status()
+
+            # 크기를 미리 알 수 있으면 본문을 읽기 전에 거부
+            length = response.headers.get("Content-Length")
+            if length is not None and length.isdigit() and int(length) > self.max_bytes:
+                raise self._too_large()
+
+            chunks = []
+            size = 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise self._too_large()
+                chunks.append(chunk)
+
+            text = b"".join(chunks).decode(
+                response.encoding or "utf-8", errors="replace"
+            )
+            return FetchedPage(
+                url=str(response.url),
+                text=text,
+                status_code=response.status_code,
+                headers=dict(response.headers),
+            )
+
+    def _too_large(self) -> ValueError:
+        return ValueError(
+            f"페이지 크기는 {self.max_bytes // 1024 // 1024}MB를 초과할 수 없습니다"
+        )
+
+    async def close(self) -> None:
+        """커넥션 풀 종료"""
+        await self.client.aclose()
+
+
+_fetcher: Optional[HTTPFetcher] = None
+
+
+def get_http_fetcher() -> HTTPFetcher:
+    """프로세스 전역 HTTPFetcher 반환 (close_http_fetcher()로 정리)"""
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = HTTPFetcher()
+    return _fetcher
+
+
+async def close_http_fetcher() -> None:
+    """전역 HTTPFetcher의 커넥션 풀을 닫음"""
+    global _fetcher
+    fetcher, _fetcher = _fetcher, None
+    if fetcher is not None:
+        await fetcher.close()
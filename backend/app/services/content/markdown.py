@@ -0,0 +1,263 @@
+"""HTML → 마크다운 변환 (한 번의 순회)
+
+readability가 추출한 본문 HTML을 lxml 트리로 한 번만 순회(iterwalk의
+start/end 이벤트)하면서 마크다운을 만듭니다. 제목, 목록(중첩 포함), 언어가
+지정된 코드 블록, 인라인 코드, 링크, 강조, 인용문, 표를 보존합니다.
+"""
+
+import re
+from itertools import islice
+from typing import Optional, Union
+
+from lxml import etree, html
+
+_WHITESPACE = re.compile(r"\s+")
+_SPACES = re.compile(r" {2,}")
+
+# 내용과 꼬리 텍스트(tail)를 모두 버리지 않고 내용만 건너뛰는 태그
+_SKIP = {
+    "script", "style", "noscript", "head", "title", "template",
+    "svg", "button", "form", "input", "select", "textarea", "iframe", "img",
+}
+_HEADINGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_BLOCKS = {
+    "html", "body", "div", "section", "article", "main", "header", "footer",
+    "aside", "nav", "figure", "figcaption", "p", "dl", "dt", "dd", "address",
+    "details", "summary", "center",
+}
+_EMPHASIS = {"strong": "**", "b": "**", "em": "*", "i": "*"}
+_LANGUAGE_PREFIXES = ("language-", "lang-", "highlight-source-", "highlight-")
+
+
+class _Break:
+    """<br> (문단 안 줄바꿈)"""
+
+
+_BREAK = _Break()
+
+
+class _Block(str):
+    """이미 변환이 끝난 블록 (다른 블록과 빈 줄로 구분)"""
+
+
+_Item = Union[str, _Break, _Block]
+
+
+class _Frame:
+    """변환 중인 요소 하나 (자식 내용을 items에 모음)"""
+
+    __slots__ = ("tag", "element", "items", "counter")
+
+    def __init__(self, tag: str, element: Optional[etree._Element] = None):
+        self.tag = tag
+        self.element = element
+        self.items: list[_Item] = []
+        self.counter = 0  # <ol>의 다음 번호
+
+
+def _inline_text(items: list[_Item]) -> str:
+    """인라인 항목을 공백을 정리한 한 문단 텍스트로"""
+    parts = []
+    for item in items:
+        if isinstance(item, _Break):
+            parts.append("\n")
+        elif isinstance(item, _Block):
+            parts.append(f"\n{item}\n")
+        else:
+            parts.append(item)
+    text = _SPACES.sub(" ", "".join(parts))
+    return "\n".join(line.strip() for line in text.split("\n")).strip()
+
+
+def _render(items: list[_Item], separator: str = "\n\n") -> str:
+    """블록과 (블록 사이의) 인라인 문단을 separator로 연결"""
+    blocks: list[str] = []
+    inline: list[_Item] = []
+    for item in items:
+        if isinstance(item, _Block):
+            paragraph = _inline_text(inline)
+            if paragraph:
+                blocks.append(paragraph)
+            inline = []
+            if item:
+                blocks.append(item)
+        else:
+            inline.append(item)
+    paragraph = _inline_text(inline)
+    if paragraph:
+        blocks.append(paragraph)
+    return separator.join(blocks)
+
+
+def _collapse(text: Optional[str]) -> str:
+    return _WHITESPACE.sub(" ", text) if text else ""
+
+
+def _code_language(element: etree._Element) -> str:
+    """pre/code(또는 pre를 감싼 하이라이터 div)의 class에서 언어 이름
+
+    language-python, lang-sql, highlight-python3 형식을 인식합니다.
+    """
+    wrappers = islice(element.iterancestors(), 2)
+    for node in (*element.iter("code"), element, *wrappers):
+        for cls in (node.get("class") or "").split():
+            for prefix in _LANGUAGE_PREFIXES:
+                if cls.startswith(prefix) and len(cls) > len(prefix):
+                    return cls[len(prefix):]
+    return ""
+
+
+def _inline_code(text: str) -> str:
+    text = _collapse(text).strip()
+    if not text:
+        return ""
+    fence = "``" if "`" in text else "`"
+    return f"{fence}{text}{fence}"
+
+
+def _indent(text: str, first: str, rest: str) -> str:
+    lines = text.split("\n")
+    return "\n".join(
+        [first + lines[0]] + [rest + line if line else "" for line in lines[1:]]
+    )
+
+
+class MarkdownConverter:
+    """lxml 트리를 한 번 순회하며 마크다운을 생성"""
+
+    def convert(self, source: str) -> str:
+        """HTML 문자열을 마크다운으로 변환"""
+        if not source.strip():
+            return ""
+        root = html.fromstring(source)
+        return self.convert_element(root)
+
+    def convert_element(self, root: etree._Element) -> str:
+        """요소(와 그 하위 트리)를 마크다운으로 변환 (root의 tail은 제외)"""
+        stack = [_Frame("root")]
+        walker = etree.iterwalk(root, events=("start", "end", "comment"))
+        for event, element in walker:
+            if event == "comment":
+                # 주석 자체는 버리고 뒤따르는 텍스트만 유지
+                self._text(stack, element.tail)
+                continue
+            tag = element.tag if isinstance(element.tag, str) else ""
+            tag = tag.lower()
+            if event == "start":
+                self._start(stack, walker, element, tag)
+            else:
+                self._end(stack, element, tag)
+                if element is not root:
+                    self._text(stack, element.tail)
+        return _render(stack[0].items)
+
+    def _text(self, stack: list[_Frame], text: Optional[str]) -> None:
+        if text:
+            stack[-1].items.append(_collapse(text))
+
+    def _start(
+        self,
+        stack: list[_Frame],
+        walker: etree.iterwalk,
+        element: etree._Element,
+        tag: str,
+    ) -> None:
+        frame = stack[-1]
+        if tag in _SKIP:
+            walker.skip_subtree()
+            return
+        if tag == "br":
+            frame.items.append(_BREAK)
+            return
+        if tag == "hr":
+            frame.items.append(_Block("---"))
+            return
+        if tag == "pre":
+            # 코드는 공백과 줄바꿈을 그대로 유지
+            code = "".join(element.itertext()).strip("\n")
+            language = _code_language(element)
+            frame.items.append(_Block(f"```{language}\n{code}\n```"))
+            walker.skip_subtree()
+            return
+        if tag == "code":
+            frame.items.append(_inline_code("".join(element.itertext())))
+            walker.skip_subtree()
+            return
+        if tag == "table":
+            frame.items.append(_Block(self._table(element)))
+            walker.skip_subtree()
+            return
+        if tag == "li" and frame.tag == "ol":
+            frame.counter += 1
+        stack.append(_Frame(tag, element))
+        self._text(stack, element.text)
+
+    def _end(self, stack: list[_Frame], element: etree._Element, tag: str) -> None:
+        if len(stack) == 1 or stack[-1].element is not element:
+            return  # 건너뛴 요소 (이미 처리됨)
+        frame = stack.pop()
+        parent = stack[-1]
+
+        if tag in _HEADINGS:
+            text = _inline_text(frame.items).replace("\n", " ")
+            if text:
+                parent.items.append(_Block(f"{'#' * _HEADINGS[tag]} {text}"))
+        elif tag in ("ul", "ol"):
+            parent.items.append(_Block(_render(frame.items, "\n")))
+        elif tag == "li":
+            if parent.tag == "ol":
+                start = parent.element.get("start", "1") if parent.element is not None else "1"
+                number = (int(start) if start.isdigit() else 1) + parent.counter - 1
+                marker = f"{number}. "
+            else:
+                marker = "- "
+            body = _render(frame.items, "\n")
+            parent.items.append(_Block(_indent(body, marker, " " * len(marker))))
+        elif tag == "blockquote":
+            body = _render(frame.items)
+            if body:
+                parent.items.append(_Block(_indent(body, "> ", "> ").replace("\n\n", "\n>\n")))
+        elif tag == "a":
+            text = _inline_text(frame.items).replace("\n", " ")
+            href = element.get("href", "") if element is not None else ""
+            if href and text:
+                parent.items.append(f"[{text}]({href})")
+            else:
+                parent.items.append(text)
+        elif tag in _EMPHASIS:
+            text = _inline_text(frame.items).replace("\n", " ")
+            if text:
+                mark = _EMPHASIS[tag]
+                parent.items.append(f"{mark}{text}{mark}")
+        elif tag in _BLOCKS:
+            parent.items.append(_Block(_render(frame.items)))
+        else:
+            # span 등 인라인 요소는 내용만 유지
+            parent.items.extend(frame.items)
+
+    def _table(self, table: etree._Element) -> str:
+        """표를 마크다운 표로 (첫 행을 머리글로 사용)"""
+        rows = []
+        for tr in table.iter("tr"):
+            cells = [
+                self.convert_element(cell).replace("\n", " ").replace("|", "\\|")
+                for cell in tr
+                if isinstance(cell.tag, str) and cell.tag.lower() in ("th", "td")
+            ]
+            if cells:
+                rows.append(cells)
+        if not rows:
+            return ""
+        width = max(len(row) for row in rows)
+        rows = [row + [""] * (width - len(row)) for row in rows]
+        lines = [
+            "| " + " | ".join(rows[0]) + " |",
+            "|" + " --- |" * width,
+        ]
+        lines += ["| " + " | ".join(row) + " |" for row in rows[1:]]
+        return "\n".join(lines)
+
+
+def html_to_markdown(source: str) -> str:
+    """HTML 문자열을 마크다운으로 변환"""
+    return MarkdownConverter().convert(source)
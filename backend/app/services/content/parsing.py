@@ -0,0 +1,41 @@
+"""HTML 본문 추출 (CPU 작업)
+
+readability 추출과 마크다운 변환은 큰 페이지에서 수십~수백 ms가 걸리는
+동기 작업이므로, 이벤트 루프 밖(app.services.content.pool)에서 실행할 수
+있도록 가벼운 모듈에 순수 함수로 둡니다. 프로세스 풀 워커는 이 모듈과
+markdown 모듈(과 readability, lxml)만 임포트합니다. app.services.content
+패키지는 URLExtractor를 처음 접근할 때 임포트하므로 워커에 fastapi나 설정,
+페처가 올라오지 않습니다.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from readability import Document
+
+from app.services.content.markdown import html_to_markdown
+
+# parse_article의 출력 형식이 바뀌면 올림 (캐시된 추출 결과를 다시 파싱)
+PARSER_VERSION = 1
+
+
+@dataclass
+class ParsedArticle:
+    """HTML에서 추출한 본문"""
+    text: str
+    title: Optional[str] = None
+
+
+def parse_article(html: str) -> ParsedArticle:
+    """HTML에서 본문을 추출해 마크다운으로 변환
+
+    Args:
+        html: 웹 페이지 HTML
+
+    Returns:
+        본문 텍스트와 제목
+    """
+    # readability로 본문 추출 후 한 번의 순회로 마크다운 변환
+    doc = Document(html)
+    text = html_to_markdown(doc.summary())
+    return ParsedArticle(text=text, title=doc.title())
@@ -0,0 +1,190 @@
+"""CPU 작업용 실행 풀
+
+HTML 파싱처럼 오래 걸리는 동기 작업을 이벤트 루프에서 직접 실행하면 그동안
+같은 워커의 모든 요청(SSE 스트림 포함)이 멈춥니다. ParsePool은 작업을 크기가
+제한된 프로세스 풀에서 실행하고, 프로세스 풀을 만들 수 없는 환경에서는 스레드
+풀로 대신 실행합니다.
+
+빈 워커가 있을 때만 작업을 넘기므로 제한 시간은 작업이 실제로 시작된 뒤부터
+잽니다. 제한 시간을 넘기거나 워커가 죽으면 그 풀을 버리고(프로세스는 종료)
+다음 작업부터 새 풀을 씁니다. 이때 같은 풀에서 실행 중이던 다른 작업도
+실패합니다.
+
+- "process": 별도 프로세스 (GIL과 무관하게 병렬 실행, 기본)
+- "thread": 스레드 풀 (이벤트 루프는 응답하지만 GIL을 나눠 씀)
+- "inline": 이벤트 루프에서 바로 실행 (디버깅/비교용)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXECUTOR_TYPES = ("process", "thread", "inline")
+
+
+class ParsePool:
+    """크기가 제한된 프로세스 풀 (프로세스 풀을 쓸 수 없으면 스레드 풀)"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        executor_type: Optional[str] = None,
+    ):
+        """
+        Args:
+            workers: 동시에 실행할 작업 수 (기본: CONTENT_PARSE_WORKERS)
+            timeout: 작업 하나의 제한 시간 (초, 기본: CONTENT_PARSE_TIMEOUT)
+            executor_type: "process", "thread", "inline"
+                (기본: CONTENT_PARSE_EXECUTOR)
+        """
+        self.workers = workers or settings.CONTENT_PARSE_WORKERS
+        self.timeout = timeout or settings.CONTENT_PARSE_TIMEOUT
+        self.executor_type = executor_type or settings.CONTENT_PARSE_EXECUTOR
+        if self.executor_type not in EXECUTOR_TYPES:
+            raise ValueError(f"지원하지 않는 실행 방식: {self.executor_type}")
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_ready: Optional[asyncio.Future[Any]] = None
+        # 풀 안에서 대기하는 시간이 제한 시간에 포함되지 않도록 빈 워커 수만큼만 제출
+        self._slots = asyncio.Semaphore(self.workers)
+
+    def _thread_executor(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="parse"
+            )
+        return self._thread_pool
+
+    def _executor(self) -> Executor:
+        if self.executor_type == "thread":
+            return self._thread_executor()
+        if self._process_pool is None:
+            try:
+                # spawn: 스레드가 있는 서버 프로세스를 fork하지 않음
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+                # 빈 워커가 없을 때마다 프로세스를 하나씩 띄우므로, 워커 수만큼
+                # 한꺼번에 제출해 모든 워커를 미리 띄움 (initializer까지 끝난 뒤 완료)
+                loop = asyncio.get_running_loop()
+                self._process_ready = asyncio.gather(
+                    *(
+                        loop.run_in_executor(self._process_pool, _ready)
+                        for _ in range(self.workers)
+                    )
+                )
+            except (OSError, NotImplementedError, ImportError):
+                # 세마포어를 만들 수 없는 환경 등
+                logger.warning(
+                    "Process pool unavailable; parsing in threads", exc_info=True
+                )
+                self.executor_type = "thread"
+                return self._thread_executor()
+        return self._process_pool
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """func(*args)를 풀에서 실행하고 결과를 반환
+
+        프로세스 풀에서 실행하는 func와 인자, 결과는 pickle할 수 있어야
+        합니다 (모듈 최상위 함수).
+
+        Raises:
+            ValueError: 작업이 timeout 안에 끝나지 않거나 워커 프로세스가 죽었을 때
+        """
+        if self.executor_type == "inline":
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            executor = self._executor()
+            try:
+                if executor is self._process_pool:
+                    # 워커 프로세스를 띄우고 파서를 임포트하는 시간은 제한 시간에
+                    # 포함하지 않음
+                    assert self._process_ready is not None
+                    await asyncio.shield(self._process_ready)
+                return await asyncio.wait_for(
+                    loop.run_in_executor(executor, partial(func, *args)),
+                    self.timeout,
+                )
+            except TimeoutError:
+                # 멈춘 작업이 워커를 계속 차지하지 않도록 풀을 교체
+                logger.warning("Parse task timed out; replacing the pool")
+                self._discard(executor)
+                raise ValueError(
+                    f"페이지 분석이 {self.timeout:g}초 안에 끝나지 않았습니다."
+                ) from None
+            except BrokenProcessPool as e:
+                # 워커가 죽은 풀(메모리 부족 등)은 버리고 다음 작업부터 새 풀 사용
+                logger.warning("Parse process pool broke; replacing it")
+                self._discard(executor)
+                raise ValueError("페이지 분석 중 작업 프로세스가 종료되었습니다.") from e
+
+    def _discard(self, executor: Executor) -> None:
+        """executor가 아직 현재 풀이면 버림 (다음 작업은 새 풀에서 실행)"""
+        if executor is self._process_pool:
+            self._process_pool = self._process_ready = None
+        elif executor is self._thread_pool:
+            self._thread_pool = None
+        else:
+            return  # 다른 작업이 이미 교체함
+        _shutdown(executor)
+
+    def close(self) -> None:
+        """풀 종료 (실행 중인 작업은 기다리지 않음)"""
+        for executor in (self._process_pool, self._thread_pool):
+            if executor is not None:
+                self._discard(executor)
+
+
+def _init_worker() -> None:
+    """워커 프로세스 초기화: 첫 작업 전에 파서(readability, lxml)를 임포트"""
+    import app.services.content.parsing  # noqa: F401
+
+
+def _ready() -> None:
+    """워커 프로세스 기동 확인용 빈 작업"""
+
+
+def _shutdown(executor: Executor) -> None:
+    """executor를 기다리지 않고 종료 (프로세스 풀은 워커 프로세스도 종료)
+
+    실행 중인 스레드는 멈출 수 없으므로 스레드 풀은 새 작업만 막습니다.
+    """
+    # shutdown()이 _processes를 비우기 전에 가져옴 (공개 API가 없음)
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+_pool: Optional[ParsePool] = None
+
+
+def get_parse_pool() -> ParsePool:
+    """프로세스 전역 ParsePool 반환 (close_parse_pool()로 정리)"""
+    global _pool
+    if _pool is None:
+        _pool = ParsePool()
+    return _pool
+
+
+def close_parse_pool() -> None:
+    """전역 ParsePool 종료"""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
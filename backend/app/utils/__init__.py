@@ -1,3 +1,4 @@
-from app.utils.slug import generate_slug
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.slug import generate_slug, slugify_title
 
-__all__ = ["generate_slug"]
+__all__ = ["decode_cursor", "encode_cursor", "generate_slug", "slugify_title"]
@@ -0,0 +1,52 @@
+import base64
+import json
+from collections.abc import Callable, Sequence
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+
+def _to_json(value: Any) -> Any:
+    """Convert a sort key value to a JSON-serializable form."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode sort key values into an opaque pagination cursor.
+
+    Args:
+        values: Sort key values of the last item on the current page.
+
+    Returns:
+        URL-safe cursor token.
+    """
+    payload = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[Callable[[Any], Any]]) -> tuple:
+    """Decode an opaque pagination cursor back into sort key values.
+
+    Args:
+        cursor: Cursor token produced by encode_cursor.
+        types: Converter for each sort key (e.g. int, datetime.fromisoformat, UUID).
+
+    Returns:
+        Tuple of converted sort key values.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError
+        pairs = zip(types, values, strict=True)
+        return tuple(convert(value) for convert, value in pairs)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
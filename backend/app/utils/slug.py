@@ -3,6 +3,19 @@ from typing import Optional
 from slugify import slugify
 
 
+def slugify_title(title: str, max_length: int = 100) -> str:
+    """Convert a title to its base URL-safe slug (without a uniqueness suffix).
+
+    Args:
+        title: The title to convert to a slug.
+        max_length: Maximum length of the base slug.
+
+    Returns:
+        A URL-safe slug, or "post" when the title has no usable characters.
+    """
+    return slugify(title, lowercase=True, max_length=max_length) or "post"
+
+
 def generate_slug(title: str, existing_slugs: Optional[list[str]] = None) -> str:
     """Generate a URL-safe slug from a title.
 
@@ -13,18 +26,13 @@ def generate_slug(title: str, existing_slugs: Optional[list[str]] = None) -> str
     Returns:
         A unique URL-safe slug.
     """
-    if existing_slugs is None:
-        existing_slugs = []
-
-    base_slug = slugify(title, lowercase=True, max_length=100)
-
-    if not base_slug:
-        base_slug = "post"
+    existing = set(existing_slugs or [])
+    base_slug = slugify_title(title)
 
     slug = base_slug
     counter = 1
 
-    while slug in existing_slugs:
+    while slug in existing:
         slug = f"{base_slug}-{counter}"
         counter += 1
 
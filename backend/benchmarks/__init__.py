@@ -0,0 +1,5 @@
+"""Micro-benchmarks for performance-sensitive code paths.
+
+Run from the backend directory, e.g. ``python -m benchmarks.bench_reading_stats``.
+Set BENCH_DATABASE_URL to benchmark against PostgreSQL instead of SQLite.
+"""
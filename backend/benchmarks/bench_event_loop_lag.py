@@ -0,0 +1,101 @@
+"""Measure event-loop lag while URL generations parse large pages.
+
+Usage: python -m benchmarks.bench_event_loop_lag [--concurrency 8] [--paragraphs 3000]
+
+Each generation runs URLExtractor.extract on a synthetic article (served from
+memory, so only parsing costs time) through a ParsePool of each executor
+type. Meanwhile a ticker sleeps 5 ms in a loop and records how late it wakes
+up. That lateness is what every other request in the worker, SSE streams
+included, waits on.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.services.content.extractors.url import URLExtractor
+from app.services.content.fetcher import HTTPFetcher
+from app.services.content.pool import EXECUTOR_TYPES, ParsePool
+
+TICK = 0.005
+
+
+def make_article(paragraphs: int) -> str:
+    """A long article with headings, code blocks and links."""
+    parts = ["<html><head><title>Benchmark article</title></head><body><article>"]
+    for i in range(paragraphs):
+        if i % 20 == 0:
+            parts.append(f"<h2>Section {i // 20}</h2>")
+        parts.append(
+            f"<p>Paragraph {i} explains <code>asyncio.gather</code> and links to "
+            f'<a href="https://example.com/{i}">reference {i}</a> in detail.</p>'
+        )
+        if i % 10 == 0:
+            parts.append(
+                '<pre><code class="language-python">'
+                f"result = await fetch({i})\nprint(result)</code></pre>"
+            )
+    parts.append("</article></body></html>")
+    return "".join(parts)
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(TICK)
+        lags.append(loop.time() - start - TICK)
+
+
+async def run(executor_type: str, html: str, concurrency: int) -> None:
+    fetcher = HTTPFetcher(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, text=html, headers={"Content-Type": "text/html"}
+            )
+        ),
+        http2=False,
+    )
+    pool = ParsePool(workers=2, timeout=120, executor_type=executor_type)
+    extractor = URLExtractor(fetcher, pool)
+    # Start workers outside the measurement (process spawn takes a while)
+    await extractor.extract("https://example.com/warmup")
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(extractor.extract(f"https://example.com/{i}") for i in range(concurrency))
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick_task
+    pool.close()
+    await fetcher.close()
+
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{executor_type:<8} {elapsed * 1000:9.0f} ms total "
+        f"{statistics.mean(lags_ms):8.1f} ms mean lag {p99:8.1f} ms p99 "
+        f"{lags_ms[-1]:8.1f} ms max"
+    )
+
+
+async def main(concurrency: int, paragraphs: int) -> None:
+    html = make_article(paragraphs)
+    print(f"{concurrency} concurrent extractions of a {len(html) // 1024} KB page")
+    for executor_type in EXECUTOR_TYPES:
+        await run(executor_type, html, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--paragraphs", type=int, default=3000)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.paragraphs))
@@ -0,0 +1,117 @@
+"""Compare HTML → Markdown conversion against the previous BeautifulSoup pipeline.
+
+Usage: python -m benchmarks.bench_html_to_markdown [--repeat 50] [--scale 20]
+
+Each page in benchmarks/fixtures/html is run through readability once, then
+the extracted article HTML is converted repeatedly by:
+
+- legacy: the pipeline parse_article used before (BeautifulSoup html.parser,
+  one find_all + replace_with pass each for pre, code and links, get_text and
+  a blank-line cleanup loop), kept here verbatim for comparison
+- markdown: html_to_markdown, one lxml iterwalk pass over the tree
+
+``--scale`` repeats each article body to get page sizes closer to long docs
+pages, where the extra passes dominate.
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from readability import Document
+
+from app.services.content.markdown import html_to_markdown
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+
+def legacy_to_text(summary: str) -> str:
+    """parse_article's previous BeautifulSoup conversion."""
+    soup = BeautifulSoup(summary, "html.parser")
+
+    for pre in soup.find_all("pre"):
+        code = pre.find("code")
+        if code:
+            lang = ""
+            if code.get("class"):
+                for cls in code.get("class", []):
+                    if cls.startswith("language-"):
+                        lang = cls.replace("language-", "")
+                        break
+            code_text = code.get_text()
+            pre.replace_with(f"\n```{lang}\n{code_text}\n```\n")
+
+    for code in soup.find_all("code"):
+        code.replace_with(f"`{code.get_text()}`")
+
+    for a in soup.find_all("a"):
+        href = a.get("href", "")
+        text = a.get_text()
+        if href and text:
+            a.replace_with(f"[{text}]({href})")
+
+    text = soup.get_text(separator="\n", strip=True)
+
+    lines = text.split("\n")
+    cleaned_lines = []
+    empty_count = 0
+    for line in lines:
+        if not line.strip():
+            empty_count += 1
+            if empty_count <= 2:
+                cleaned_lines.append("")
+        else:
+            empty_count = 0
+            cleaned_lines.append(line)
+    return "\n".join(cleaned_lines)
+
+
+def load_corpus(scale: int) -> dict[str, str]:
+    """Readability output for each fixture, body repeated scale times."""
+    corpus = {}
+    for path in sorted(FIXTURES.glob("*.html")):
+        summary = Document(path.read_text(encoding="utf-8")).summary()
+        head, _, rest = summary.partition("<body>")
+        body, _, tail = rest.rpartition("</body>")
+        corpus[path.stem] = f"{head}<body>{body * scale}</body>{tail}"
+    return corpus
+
+
+def measure(convert: Callable[[str], str], html: str, repeat: int) -> float:
+    """Median milliseconds per conversion."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        convert(html)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main(repeat: int, scale: int) -> None:
+    corpus = load_corpus(scale)
+    print(f"{'page':<18} {'KB':>6} {'legacy ms':>10} {'markdown ms':>12} {'speedup':>8}")
+    totals = [0.0, 0.0]
+    for name, html in corpus.items():
+        legacy = measure(legacy_to_text, html, repeat)
+        markdown = measure(html_to_markdown, html, repeat)
+        totals[0] += legacy
+        totals[1] += markdown
+        print(
+            f"{name:<18} {len(html.encode()) // 1024:>6} {legacy:>10.2f} "
+            f"{markdown:>12.2f} {legacy / markdown:>7.1f}x"
+        )
+    print(
+        f"{'total':<18} {'':>6} {totals[0]:>10.2f} {totals[1]:>12.2f} "
+        f"{totals[0] / totals[1]:>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--scale", type=int, default=20)
+    args = parser.parse_args()
+    main(args.repeat, args.scale)
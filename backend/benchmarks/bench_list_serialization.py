@@ -0,0 +1,74 @@
+"""Compare ways of rendering a 100-item TIL list page to JSON.
+
+Usage: python -m benchmarks.bench_list_serialization [--iterations 500]
+
+Rows are loaded once; only serialization is timed:
+
+- jsonable_encoder: model_validate per row, then FastAPI's encoder + json
+- model_dump_json: model_validate per row, then Pydantic's JSON serializer
+- row_dict + orjson: fields read straight off the rows, encoded by orjson
+"""
+
+import argparse
+import asyncio
+import json
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.serialization import dump_json, row_dict
+from app.crud import til_crud
+from app.models import TIL, Tag
+from app.schemas import TILListResponse, TILResponse
+from benchmarks.common import bench_database, timeit
+
+PAGE_SIZE = 100
+
+
+async def main(iterations: int) -> None:
+    """Time each rendering path over the same loaded page."""
+    async with bench_database() as session_maker:
+        async with session_maker() as db:
+            tags = [Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(3)]
+            for day in range(1, PAGE_SIZE + 1):
+                db.add(
+                    TIL(
+                        title=f"Day {day}",
+                        slug=f"day-{day}",
+                        day_number=day,
+                        excerpt="Excerpt " * 10,
+                        content="Content " * 200,
+                        is_published=True,
+                        tags=tags,
+                    )
+                )
+            await db.commit()
+
+        async with session_maker() as db:
+            tils, total = await til_crud.get_tils(db, limit=PAGE_SIZE)
+        page = {"total": total, "page": 1, "size": PAGE_SIZE, "pages": 1}
+
+        def validated_page() -> TILListResponse:
+            items = [TILResponse.model_validate(til) for til in tils]
+            return TILListResponse(items=items, next_cursor=None, **page)
+
+        async def encoder_path() -> None:
+            json.dumps(jsonable_encoder(validated_page())).encode()
+
+        async def pydantic_path() -> None:
+            validated_page().model_dump_json().encode()
+
+        async def row_path() -> None:
+            items = [row_dict(TILResponse, til) for til in tils]
+            dump_json({"items": items, **page, "next_cursor": None})
+
+        print(f"page size: {len(tils)}")
+        await timeit("model_validate + jsonable_encoder", encoder_path, iterations)
+        await timeit("model_validate + model_dump_json", pydantic_path, iterations)
+        await timeit("row_dict + orjson", row_path, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
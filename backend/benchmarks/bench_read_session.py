@@ -0,0 +1,65 @@
+"""Compare a committing request session with the read-only autocommit session.
+
+Usage: python -m benchmarks.bench_read_session [--iterations 500]
+
+Against SQLite the latency difference is small; set BENCH_DATABASE_URL to a
+networked PostgreSQL to see the saved round trips in wall time.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.crud import til_crud
+from app.models import TIL
+from benchmarks.common import RoundTripCounter, bench_database, timeit
+
+
+async def main(iterations: int) -> None:
+    """Time a TIL detail read through both session kinds."""
+    async with bench_database() as session_maker:
+        engine = session_maker.kw["bind"]
+        async with session_maker() as db:
+            db.add(
+                TIL(
+                    title="Benchmark",
+                    slug="benchmark",
+                    day_number=1,
+                    excerpt="Excerpt",
+                    content="Content " * 200,
+                    is_published=True,
+                )
+            )
+            await db.commit()
+
+        read_session_maker = async_sessionmaker(
+            engine.execution_options(isolation_level="AUTOCOMMIT"),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        counter = RoundTripCounter(engine)
+
+        async def committing_read() -> None:
+            async with session_maker() as db:
+                await til_crud.get_til_by_slug(db, "benchmark")
+                await db.commit()
+
+        async def autocommit_read() -> None:
+            async with read_session_maker() as db:
+                await til_crud.get_til_by_slug(db, "benchmark")
+
+        counter.reset()
+        await timeit("get_db (BEGIN ... COMMIT)", committing_read, iterations)
+        print(f"  round trips/op: {counter.reset() / (iterations + 1):.1f}")
+
+        await timeit("get_read_db (autocommit)", autocommit_read, iterations)
+        print(f"  round trips/op: {counter.reset() / (iterations + 1):.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
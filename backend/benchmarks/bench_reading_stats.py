@@ -0,0 +1,96 @@
+"""Compare /books/stats strategies: conditional aggregate vs summary row.
+
+Usage: python -m benchmarks.bench_reading_stats [--notes 100000] [--books 500]
+"""
+
+import argparse
+import asyncio
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.crud import book_crud
+from app.models import Book, BookNote
+from benchmarks.common import QueryCounter, bench_database, timeit
+
+
+async def seed(
+    session_maker: async_sessionmaker[AsyncSession], books: int, notes: int
+) -> None:
+    """Insert books and notes in bulk."""
+    book_ids = [uuid.uuid4() for _ in range(books)]
+    statuses = ["reading", "completed", "on_hold"]
+    async with session_maker() as db:
+        await db.execute(
+            insert(Book),
+            [
+                {
+                    "id": book_id,
+                    "title": f"Book {i}",
+                    "author": "Author",
+                    "status": statuses[i % 3],
+                    "slug": f"book-{i}",
+                }
+                for i, book_id in enumerate(book_ids)
+            ],
+        )
+        today = date.today()
+        batch = 10_000
+        for offset in range(0, notes, batch):
+            await db.execute(
+                insert(BookNote),
+                [
+                    {
+                        "book_id": book_ids[i % books],
+                        "chapter_title": f"Chapter {i}",
+                        "content": "Note body " * 50,
+                        "reading_date": today - timedelta(days=i % 90),
+                        "is_published": i % 2 == 0,
+                        "slug": f"note-{i}",
+                    }
+                    for i in range(offset, min(offset + batch, notes))
+                ],
+            )
+        await db.commit()
+
+
+async def main(books: int, notes: int, iterations: int) -> None:
+    """Seed the database and time both stats modes."""
+    async with bench_database() as session_maker:
+        print(f"Seeding {books} books / {notes} notes ...")
+        await seed(session_maker, books, notes)
+        counter = QueryCounter(session_maker.kw["bind"])
+
+        async with session_maker() as db:
+            settings.READING_STATS_SUMMARY = False
+            counter.reset()
+            await timeit(
+                "aggregate (1 conditional query)",
+                lambda: book_crud.get_reading_stats(db),
+                iterations,
+            )
+            print(f"  statements/op: {counter.reset() / (iterations + 1):.1f}")
+
+            settings.READING_STATS_SUMMARY = True
+            await book_crud.rebuild_reading_stats(db)
+            await db.commit()
+            counter.reset()
+
+            async def summary_lookup() -> None:
+                db.expire_all()  # force a real primary-key SELECT each time
+                await book_crud.get_reading_stats(db)
+
+            await timeit("summary row (primary-key lookup)", summary_lookup, iterations)
+            print(f"  statements/op: {counter.reset() / (iterations + 1):.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=500)
+    parser.add_argument("--notes", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.books, args.notes, args.iterations))
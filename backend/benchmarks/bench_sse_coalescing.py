@@ -0,0 +1,101 @@
+"""Compare SSE output for a streamed TIL with and without chunk coalescing.
+
+Usage: python -m benchmarks.bench_sse_coalescing [--deltas 2000] [--interval-ms 0.5]
+
+A fake model stream yields --deltas short text deltas (about 3 characters each,
+like Anthropic text_stream) with --interval-ms between them. Every frame goes
+through the same steps as /generate/stream: an event dict, sse_message, the
+sse_response StreamingResponse and one ASGI send per event, written to
+/dev/null.
+
+Reported per TIL: SSE events written, events per second, CPU milliseconds
+(process time, excluding the pauses) and the worst delay a delta spent
+buffered before it was written.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from app.api.sse import sse_message, sse_response
+from app.services.ai.streaming import coalesce_chunks
+
+DELTA = "abc"
+
+
+async def model_stream(
+    deltas: int, interval: float, produced: list[float]
+) -> AsyncIterator[str]:
+    """Fake text_stream recording when each delta was produced."""
+    loop = asyncio.get_running_loop()
+    for _ in range(deltas):
+        if interval:
+            await asyncio.sleep(interval)
+        produced.append(loop.time())
+        yield DELTA
+
+
+async def run(deltas: int, interval: float, flush_ms: int, flush_bytes: int) -> None:
+    loop = asyncio.get_running_loop()
+    produced: list[float] = []
+    fd = os.open(os.devnull, os.O_WRONLY)
+    events = 0
+    worst_delay = 0.0
+    written_chars = 0
+
+    async def messages() -> AsyncIterator[str]:
+        nonlocal events, worst_delay, written_chars
+        async for chunk in coalesce_chunks(
+            model_stream(deltas, interval, produced),
+            max_delay=flush_ms / 1000,
+            max_bytes=flush_bytes,
+        ):
+            events += 1
+            # The oldest delta in this frame waited the longest
+            oldest = produced[written_chars // len(DELTA)]
+            worst_delay = max(worst_delay, loop.time() - oldest)
+            written_chars += len(chunk)
+            event = {"event": "content_chunk", "data": {"chunk": chunk}}
+            yield sse_message(event["event"], event["data"], id=events)
+
+    async def receive() -> dict[str, Any]:
+        await asyncio.Event().wait()  # the client never disconnects
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body":
+            os.write(fd, message.get("body", b""))
+
+    scope = {"type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}}
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        await sse_response(messages())(scope, receive, send)
+    finally:
+        os.close(fd)
+    cpu_ms = (time.process_time() - cpu_start) * 1000
+    wall = time.perf_counter() - wall_start
+
+    label = "no coalescing" if flush_ms == 0 else f"{flush_ms} ms / {flush_bytes} B"
+    print(
+        f"{label:<20} {events:7d} events {events / wall:10.0f} events/s "
+        f"{cpu_ms:8.1f} ms CPU {worst_delay * 1000:8.1f} ms max buffered"
+    )
+
+
+async def main(deltas: int, interval_ms: float) -> None:
+    interval = interval_ms / 1000
+    print(f"{deltas} deltas, {interval_ms} ms apart")
+    for flush_ms, flush_bytes in ((0, 0), (20, 256), (50, 512), (100, 2048)):
+        await run(deltas, interval, flush_ms, flush_bytes)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--deltas", type=int, default=2000)
+    parser.add_argument("--interval-ms", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(main(args.deltas, args.interval_ms))
@@ -0,0 +1,93 @@
+"""Shared helpers for benchmarks."""
+
+import os
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+def make_engine() -> AsyncEngine:
+    """Create the benchmark engine from BENCH_DATABASE_URL (SQLite by default)."""
+    url = os.environ.get("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL)
+    if url.startswith("sqlite"):
+        return create_async_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    return create_async_engine(url)
+
+
+@asynccontextmanager
+async def bench_database() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Create all tables on a fresh engine and drop them afterwards."""
+    engine = make_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+async def timeit(
+    label: str, func: Callable[[], Awaitable[Any]], iterations: int = 100
+) -> float:
+    """Run func repeatedly and print the mean latency in milliseconds."""
+    await func()  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    mean_ms = (time.perf_counter() - start) / iterations * 1000
+    print(f"{label:<40} {mean_ms:10.3f} ms/op")
+    return mean_ms
+
+
+class QueryCounter:
+    """Count SQL statements sent through an engine."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *_: Any) -> None:
+        self.count += 1
+
+    def reset(self) -> int:
+        """Return the current count and start over from zero."""
+        count, self.count = self.count, 0
+        return count
+
+
+class RoundTripCounter(QueryCounter):
+    """Count statements plus BEGIN/COMMIT sent through an engine.
+
+    Transaction control is not counted for connections in AUTOCOMMIT mode,
+    where the driver sends no BEGIN or COMMIT.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        super().__init__(engine)
+        event.listen(engine.sync_engine, "begin", self._on_transaction)
+        event.listen(engine.sync_engine, "commit", self._on_transaction)
+
+    def _on_transaction(self, conn: Any) -> None:
+        if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+            self.count += 1
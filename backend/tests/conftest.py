@@ -4,16 +4,27 @@ from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
-from app.api.deps import get_db
+from app.api.caching import apply_pending_invalidations
+from app.api.deps import get_db, get_read_db, get_session_maker
+from app.cache import get_cache_backend, response_cache
 from app.config import settings
 from app.db.base import Base
+from app.jobs import JobQueue, job_queue
 from app.main import app
-from app.models import Tag, TIL  # noqa: F401
+from app.models import Book, Tag, TIL  # noqa: F401
 
 
+# Keep tests from sharing LLM output and fetched pages through the on-disk caches
+settings.LLM_CACHE_ENABLED = False
+settings.URL_FETCH_CACHE_ENABLED = False
+
+# Tests run in one process, so the per-process response cache is coherent
+response_cache.backend = get_cache_backend("memory")
+
 # Test database URL (SQLite for testing)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -24,6 +35,14 @@ test_engine = create_async_engine(
     poolclass=StaticPool,
 )
 
+
+@event.listens_for(test_engine.sync_engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection: Any, _: Any) -> None:
+    """Enforce ON DELETE CASCADE in SQLite like PostgreSQL does."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 # Create test session maker
 test_async_session_maker = async_sessionmaker(
     test_engine,
@@ -31,6 +50,14 @@ test_async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Autocommit sessions for read-only endpoints, like app.db.session
+test_read_session_maker = async_sessionmaker(
+    test_engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
@@ -46,6 +73,7 @@ async def setup_database() -> AsyncGenerator[None, None]:
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
+    await response_cache.clear()
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
@@ -56,11 +84,18 @@ async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
+            await apply_pending_invalidations(session)
         except Exception:
             await session.rollback()
             raise
 
 
+async def override_get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Override read-only database dependency for testing."""
+    async with test_read_session_maker() as session:
+        yield session
+
+
 @pytest.fixture
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide a test database session."""
@@ -72,6 +107,8 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """Provide an async HTTP client for testing."""
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    app.dependency_overrides[get_session_maker] = lambda: test_async_session_maker
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
@@ -80,6 +117,14 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+async def running_job_queue() -> AsyncGenerator[JobQueue, None]:
+    """Run the job queue workers against the test database."""
+    await job_queue.start(test_async_session_maker)
+    yield job_queue
+    await job_queue.stop()
+
+
 @pytest.fixture
 def admin_headers() -> dict[str, str]:
     """Provide admin authentication headers."""
@@ -138,3 +183,19 @@ async def sample_til_with_tags(db_session: AsyncSession, sample_tag: Tag) -> TIL
     await db_session.commit()
     await db_session.refresh(til, ["tags"])
     return til
+
+
+@pytest.fixture
+async def sample_book(db_session: AsyncSession) -> Book:
+    """Create a sample book for testing."""
+    book = Book(
+        title="Clean Code",
+        author="Robert C. Martin",
+        total_chapters=4,
+        status="reading",
+        slug="clean-code",
+    )
+    db_session.add(book)
+    await db_session.commit()
+    await db_session.refresh(book)
+    return book
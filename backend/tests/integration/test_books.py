@@ -0,0 +1,340 @@
+"""Integration tests for book endpoints."""
+
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.crud import book as book_crud
+from app.models import Book, BookNote
+from app.models.stats import READING_STATS_ID, ReadingStats
+
+
+async def _add_notes(
+    db_session: AsyncSession, book: Book, published: int, drafts: int
+) -> None:
+    """Attach published and draft notes to a book."""
+    for i in range(published + drafts):
+        note = BookNote(
+            book_id=book.id,
+            chapter_title=f"{book.slug} chapter {i}",
+            content="Long note body " * 100,
+            is_published=i < published,
+            slug=f"{book.slug}-chapter-{i}",
+        )
+        db_session.add(note)
+    await db_session.commit()
+
+
+class TestListBooks:
+    """Tests for GET /api/v1/books endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_list_books_computed_counts(
+        self, client: AsyncClient, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test notes_count and progress are computed per book."""
+        other = Book(title="Refactoring", author="Martin Fowler", slug="refactoring")
+        db_session.add(other)
+        await db_session.commit()
+        await _add_notes(db_session, sample_book, published=3, drafts=2)
+
+        response = await client.get("/api/v1/books")
+        assert response.status_code == 200
+        data = response.json()
+        books = {item["slug"]: item for item in data["items"]}
+        assert books["clean-code"]["notes_count"] == 5
+        assert books["clean-code"]["progress"] == 75.0
+        assert books["refactoring"]["notes_count"] == 0
+        assert books["refactoring"]["progress"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_progress_capped_at_100(
+        self, client: AsyncClient, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test progress never exceeds 100 percent."""
+        await _add_notes(db_session, sample_book, published=6, drafts=0)
+
+        response = await client.get(f"/api/v1/books/{sample_book.slug}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["notes_count"] == 6
+        assert data["progress"] == 100.0
+        assert len(data["notes"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_list_books_sparse_fields(
+        self, client: AsyncClient, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test that fields narrows items, computing counts only when asked."""
+        await _add_notes(db_session, sample_book, published=1, drafts=0)
+
+        response = await client.get("/api/v1/books?fields=slug")
+        assert response.json()["items"] == [{"slug": "clean-code"}]
+
+        response = await client.get("/api/v1/books?fields=slug,notes_count")
+        assert response.json()["items"] == [{"slug": "clean-code", "notes_count": 1}]
+
+    @pytest.mark.asyncio
+    async def test_get_book_sparse_fields(
+        self, client: AsyncClient, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test that notes are only returned when requested."""
+        await _add_notes(db_session, sample_book, published=2, drafts=0)
+        url = f"/api/v1/books/{sample_book.slug}"
+
+        response = await client.get(f"{url}?fields=title,progress")
+        assert response.json() == {"title": "Clean Code", "progress": 50.0}
+
+        response = await client.get(f"{url}?fields=notes")
+        assert len(response.json()["notes"]) == 2
+
+        response = await client.get(f"{url}?fields=isbn")
+        assert response.status_code == 400
+
+
+class TestWriteBooks:
+    """Tests for book create/update/delete endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_create_book(
+        self, client: AsyncClient, admin_headers: dict
+    ) -> None:
+        """Test creating a book returns zeroed computed fields."""
+        response = await client.post(
+            "/api/v1/books",
+            json={"title": "New Book", "author": "Someone", "total_chapters": 10},
+            headers=admin_headers,
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["slug"] == "new-book"
+        assert data["notes_count"] == 0
+        assert data["progress"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_update_book_recomputes_progress(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        db_session: AsyncSession,
+        sample_book: Book,
+    ) -> None:
+        """Test progress follows a total_chapters change."""
+        await _add_notes(db_session, sample_book, published=2, drafts=1)
+
+        response = await client.put(
+            f"/api/v1/books/{sample_book.id}",
+            json={"total_chapters": 8},
+            headers=admin_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["notes_count"] == 3
+        assert data["progress"] == 25.0
+
+    @pytest.mark.asyncio
+    async def test_delete_book(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        db_session: AsyncSession,
+        sample_book: Book,
+    ) -> None:
+        """Test deleting a book with notes."""
+        await _add_notes(db_session, sample_book, published=1, drafts=0)
+
+        response = await client.delete(
+            f"/api/v1/books/{sample_book.id}", headers=admin_headers
+        )
+        assert response.status_code == 204
+
+        response = await client.get(f"/api/v1/books/{sample_book.slug}")
+        assert response.status_code == 404
+
+
+class TestListBookNotes:
+    """Tests for GET /api/v1/books/{slug}/notes endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_list_notes_cursor_pagination(
+        self, client: AsyncClient, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test note list keyset pagination matches page/size ordering."""
+        for i in range(1, 6):
+            note = BookNote(
+                book_id=sample_book.id,
+                chapter_title=f"Chapter {i}",
+                content=f"Notes for chapter {i}",
+                reading_date=date(2026, 1, i),
+                slug=f"chapter-{i}",
+            )
+            db_session.add(note)
+        await db_session.commit()
+
+        url = f"/api/v1/books/{sample_book.slug}/notes"
+        response = await client.get(f"{url}?size=2")
+        data = response.json()
+        assert data["total"] == 5
+        slugs = [item["slug"] for item in data["items"]]
+        while data["next_cursor"]:
+            response = await client.get(f"{url}?size=2&cursor={data['next_cursor']}")
+            assert response.status_code == 200
+            data = response.json()
+            slugs.extend(item["slug"] for item in data["items"])
+
+        assert slugs == [f"chapter-{i}" for i in range(5, 0, -1)]
+
+    @pytest.mark.asyncio
+    async def test_list_notes_summary_view(
+        self, client: AsyncClient, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test the summary view omits the large text fields."""
+        await _add_notes(db_session, sample_book, published=2, drafts=0)
+
+        response = await client.get(
+            f"/api/v1/books/{sample_book.slug}/notes?view=summary"
+        )
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert len(items) == 2
+        for item in items:
+            assert not {"content", "key_takeaways", "questions"} & set(item)
+            assert item["chapter_title"].startswith("clean-code chapter")
+
+    @pytest.mark.asyncio
+    async def test_list_notes_sparse_fields(
+        self, client: AsyncClient, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test that fields narrows note items and overrides view."""
+        await _add_notes(db_session, sample_book, published=2, drafts=0)
+
+        response = await client.get(
+            f"/api/v1/books/{sample_book.slug}/notes?fields=slug,content&view=summary"
+        )
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert {frozenset(item) for item in items} == {frozenset({"slug", "content"})}
+
+    @pytest.mark.asyncio
+    async def test_get_note_sparse_fields(
+        self, client: AsyncClient, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test that fields narrows a note detail response."""
+        await _add_notes(db_session, sample_book, published=1, drafts=0)
+
+        response = await client.get(
+            f"/api/v1/books/{sample_book.slug}/notes/clean-code-chapter-0"
+            "?fields=chapter_title"
+        )
+        assert response.status_code == 200
+        assert response.json() == {"chapter_title": "clean-code chapter 0"}
+
+
+class TestReadingStats:
+    """Tests for GET /api/v1/books/stats endpoint."""
+
+    async def _exercise(
+        self, client: AsyncClient, admin_headers: dict
+    ) -> list[dict]:
+        """Run a sequence of writes, collecting stats after each step."""
+        snapshots = []
+
+        async def snapshot() -> None:
+            response = await client.get("/api/v1/books/stats")
+            assert response.status_code == 200
+            snapshots.append(response.json())
+
+        await snapshot()
+        response = await client.post(
+            "/api/v1/books",
+            json={"title": "Stats Book", "author": "Someone"},
+            headers=admin_headers,
+        )
+        book = response.json()
+        await snapshot()
+
+        note_ids = []
+        for i, reading_date in enumerate([date.today(), date(2000, 1, 1)]):
+            response = await client.post(
+                f"/api/v1/books/{book['slug']}/notes",
+                json={
+                    "chapter_title": f"Chapter {i}",
+                    "content": "Body",
+                    "reading_date": reading_date.isoformat(),
+                },
+                headers=admin_headers,
+            )
+            note_ids.append(response.json()["id"])
+        await snapshot()
+
+        await client.put(
+            f"/api/v1/books/{book['slug']}/notes/{note_ids[0]}",
+            json={"reading_date": "2000-01-02"},
+            headers=admin_headers,
+        )
+        await client.put(
+            f"/api/v1/books/{book['id']}",
+            json={"status": "completed"},
+            headers=admin_headers,
+        )
+        await snapshot()
+
+        await client.delete(
+            f"/api/v1/books/{book['slug']}/notes/{note_ids[1]}",
+            headers=admin_headers,
+        )
+        await snapshot()
+
+        await client.delete(f"/api/v1/books/{book['id']}", headers=admin_headers)
+        await snapshot()
+        return snapshots
+
+    @pytest.mark.asyncio
+    async def test_stats_aggregate(
+        self, client: AsyncClient, admin_headers: dict
+    ) -> None:
+        """Test stats computed by the conditional aggregate query."""
+        snapshots = await self._exercise(client, admin_headers)
+        assert snapshots[2] == {
+            "total_books": 1,
+            "reading_books": 1,
+            "completed_books": 0,
+            "total_notes": 2,
+            "notes_this_month": 1,
+        }
+        assert snapshots[3]["completed_books"] == 1
+        assert snapshots[3]["notes_this_month"] == 0
+        assert snapshots[4]["total_notes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_summary_matches_aggregate(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the maintained summary row tracks every write."""
+        expected = await self._exercise(client, admin_headers)
+
+        monkeypatch.setattr(settings, "READING_STATS_SUMMARY", True)
+        assert await self._exercise(client, admin_headers) == expected
+
+    @pytest.mark.asyncio
+    async def test_rebuild_upserts_summary_row(
+        self, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test rebuilding inserts a missing row and overwrites an existing one."""
+        first = await book_crud.rebuild_reading_stats(db_session)
+        assert first.total_books == 1
+
+        first.total_books = 99
+        await db_session.commit()
+        await book_crud.rebuild_reading_stats(db_session)
+        await db_session.commit()
+
+        row = await db_session.get(ReadingStats, READING_STATS_ID)
+        assert row.total_books == 1
+        assert row.month_start == date.today().replace(day=1)
@@ -0,0 +1,242 @@
+"""Integration tests for bulk book note summarization."""
+
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.crud import book_crud
+from app.models import Book, BookNote
+from app.schemas import BookNoteUpdate
+from app.services.ai import bulk_summary
+
+URL = "/api/v1/books/notes/summarize"
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    """Parse an SSE body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.fixture(autouse=True)
+def fake_summary(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the LLM call with a deterministic summary."""
+
+    async def generate(content: str, key_takeaways: list[str]) -> str:
+        if content.startswith("broken"):
+            raise RuntimeError("LLM unavailable")
+        return f"Summary: {content[:20]}"
+
+    monkeypatch.setattr(bulk_summary, "generate_book_note_summary", generate)
+
+
+async def _add_note(
+    db_session: AsyncSession, book: Book, slug: str, content: str, **values: object
+) -> BookNote:
+    note = BookNote(
+        book_id=book.id, chapter_title=slug, slug=slug, content=content, **values
+    )
+    db_session.add(note)
+    await db_session.commit()
+    return note
+
+
+class TestBulkSummary:
+    """Tests for POST /api/v1/books/notes/summarize."""
+
+    @pytest.mark.asyncio
+    async def test_summarizes_missing_and_stale(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_headers: dict[str, str],
+        sample_book: Book,
+    ) -> None:
+        """Test only missing and stale summaries are regenerated."""
+        written = datetime.now(timezone.utc) - timedelta(days=1)
+        missing = await _add_note(db_session, sample_book, "missing", "Missing body")
+        await _add_note(
+            db_session,
+            sample_book,
+            "stale",
+            "Edited body",
+            ai_summary="Old",
+            ai_summary_at=written - timedelta(hours=1),
+            updated_at=written,
+        )
+        await _add_note(
+            db_session,
+            sample_book,
+            "fresh",
+            "Fresh body",
+            ai_summary="Current",
+            ai_summary_at=written,
+            updated_at=written,
+        )
+
+        response = await client.post(URL, headers=admin_headers)
+        assert response.status_code == 200
+        events = _events(response.text)
+        assert events[0] == ("start", {"total": 2})
+        assert events[-1] == (
+            "complete",
+            {"saved": 2, "failed": 0, "stale": 0, "total": 2},
+        )
+
+        db_session.expire_all()
+        notes = {
+            note.slug: note for note in (await db_session.scalars(select(BookNote)))
+        }
+        assert notes["missing"].ai_summary == "Summary: Missing body"
+        assert notes["stale"].ai_summary == "Summary: Edited body"
+        assert notes["fresh"].ai_summary == "Current"
+        assert notes["missing"].updated_at == missing.updated_at
+        assert await book_crud.count_stale_summary_notes(db_session) == 0
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_partial_run(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_headers: dict[str, str],
+        sample_book: Book,
+    ) -> None:
+        """Test a second run picks up the notes the first one left."""
+        for i in range(3):
+            await _add_note(db_session, sample_book, f"note-{i}", f"Body {i}")
+
+        first = await client.post(f"{URL}?limit=2", headers=admin_headers)
+        second = await client.post(URL, headers=admin_headers)
+        first, second = _events(first.text), _events(second.text)
+
+        assert first[-1][1]["saved"] == 2
+        assert second[0] == ("start", {"total": 1})
+        assert second[-1][1]["saved"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_notes_are_reported_and_left_stale(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_headers: dict[str, str],
+        sample_book: Book,
+    ) -> None:
+        """Test an LLM failure does not stop the run or save a summary."""
+        broken = await _add_note(db_session, sample_book, "broken", "broken body")
+        await _add_note(db_session, sample_book, "ok", "Good body")
+
+        events = _events((await client.post(URL, headers=admin_headers)).text)
+
+        error = {"id": str(broken.id), "error": "LLM unavailable"}
+        assert ("note_error", error) in events
+        assert events[-1] == (
+            "complete",
+            {"saved": 1, "failed": 1, "stale": 0, "total": 2},
+        )
+        assert await book_crud.count_stale_summary_notes(db_session) == 1
+
+    @pytest.mark.asyncio
+    async def test_note_edited_during_summary_is_left_stale(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_headers: dict[str, str],
+        sample_book: Book,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a summary of content edited mid-call is not saved."""
+        edited = await _add_note(db_session, sample_book, "edited", "Old body")
+        edited_id = edited.id
+        await _add_note(db_session, sample_book, "ok", "Good body")
+
+        async def generate(content: str, key_takeaways: list[str]) -> str:
+            if content == "Old body":
+                note = await book_crud.get_book_note_by_id(db_session, edited_id)
+                await book_crud.update_book_note(
+                    db_session, note, BookNoteUpdate(content="New body")
+                )
+                await db_session.commit()
+            return f"Summary: {content}"
+
+        monkeypatch.setattr(bulk_summary, "generate_book_note_summary", generate)
+        events = _events((await client.post(URL, headers=admin_headers)).text)
+
+        assert events[-1] == (
+            "complete",
+            {"saved": 1, "failed": 0, "stale": 1, "total": 2},
+        )
+        db_session.expire_all()
+        note = await db_session.scalar(
+            select(BookNote).where(BookNote.id == edited_id)
+        )
+        assert note.content == "New body"
+        assert note.ai_summary is None
+        assert await book_crud.count_stale_summary_notes(db_session) == 1
+
+    @pytest.mark.asyncio
+    async def test_no_session_open_during_llm_calls(
+        self,
+        db_session: AsyncSession,
+        sample_book: Book,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test batches are read and saved in short sessions around the calls."""
+        await _add_note(db_session, sample_book, "a", "Body a")
+        await _add_note(db_session, sample_book, "b", "Body b")
+        session_maker = async_sessionmaker(db_session.bind, expire_on_commit=False)
+        open_sessions = 0
+        seen: list[int] = []
+
+        @asynccontextmanager
+        async def counting_sessions() -> AsyncIterator[AsyncSession]:
+            nonlocal open_sessions
+            async with session_maker() as session:
+                open_sessions += 1
+                try:
+                    yield session
+                finally:
+                    open_sessions -= 1
+
+        async def generate(content: str, key_takeaways: list[str]) -> str:
+            seen.append(open_sessions)
+            return f"Summary: {content}"
+
+        monkeypatch.setattr(bulk_summary, "generate_book_note_summary", generate)
+        events = [
+            event
+            async for event in bulk_summary.summarize_stale_notes(counting_sessions)
+        ]
+
+        assert seen == [0, 0]
+        assert events[-1]["data"]["saved"] == 2
+
+    @pytest.mark.asyncio
+    async def test_requires_admin(self, client: AsyncClient) -> None:
+        """Test the endpoint is admin only."""
+        response = await client.post(URL)
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_manual_summary_is_current(
+        self,
+        db_session: AsyncSession,
+        sample_book: Book,
+    ) -> None:
+        """Test writing ai_summary through update marks it as current."""
+        note = await _add_note(db_session, sample_book, "manual", "Body")
+        note = await book_crud.get_book_note_by_id(db_session, note.id)
+        await book_crud.update_book_note(
+            db_session, note, BookNoteUpdate(ai_summary="Written by hand")
+        )
+        await db_session.commit()
+
+        assert await book_crud.count_stale_summary_notes(db_session) == 0
@@ -0,0 +1,211 @@
+"""Integration tests for ETag / Last-Modified conditional GETs."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import response_cache
+from app.crud import til_crud
+from app.models import TIL, Book, BookNote, Tag
+
+
+class TestConditionalTIL:
+    """Tests for conditional GET /api/v1/tils/{slug} and /tils/day/{n}."""
+
+    @pytest.mark.asyncio
+    async def test_validators_present(
+        self, client: AsyncClient, sample_til: TIL
+    ) -> None:
+        """Test ETag, Last-Modified and Cache-Control are returned."""
+        response = await client.get(f"/api/v1/tils/{sample_til.slug}")
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["last-modified"].endswith("GMT")
+        assert response.headers["cache-control"] == "no-cache"
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_returns_304(
+        self, client: AsyncClient, sample_til: TIL
+    ) -> None:
+        """Test a matching If-None-Match returns 304 without a body."""
+        first = await client.get(f"/api/v1/tils/{sample_til.slug}")
+        etag = first.headers["etag"]
+
+        response = await client.get(
+            f"/api/v1/tils/{sample_til.slug}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        by_day = await client.get(
+            f"/api/v1/tils/day/{sample_til.day_number}",
+            headers={"If-None-Match": f'"other", W/{etag}'},
+        )
+        assert by_day.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_if_modified_since_returns_304(
+        self, client: AsyncClient, sample_til: TIL
+    ) -> None:
+        """Test If-Modified-Since at Last-Modified returns 304."""
+        first = await client.get(f"/api/v1/tils/{sample_til.slug}")
+        last_modified = first.headers["last-modified"]
+
+        response = await client.get(
+            f"/api/v1/tils/{sample_til.slug}",
+            headers={"If-Modified-Since": last_modified},
+        )
+        assert response.status_code == 304
+
+        stale = await client.get(
+            f"/api/v1/tils/{sample_til.slug}",
+            headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+        )
+        assert stale.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_takes_precedence(
+        self, client: AsyncClient, sample_til: TIL
+    ) -> None:
+        """Test a stale ETag wins over a current If-Modified-Since."""
+        first = await client.get(f"/api/v1/tils/{sample_til.slug}")
+
+        response = await client.get(
+            f"/api/v1/tils/{sample_til.slug}",
+            headers={
+                "If-None-Match": '"stale"',
+                "If-Modified-Since": first.headers["last-modified"],
+            },
+        )
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_update_changes_etag(
+        self, client: AsyncClient, admin_headers: dict[str, str], sample_til: TIL
+    ) -> None:
+        """Test updating the TIL invalidates the previous ETag."""
+        first = await client.get(f"/api/v1/tils/{sample_til.slug}")
+        etag = first.headers["etag"]
+
+        await client.put(
+            f"/api/v1/tils/{sample_til.id}",
+            json={"title": "Updated title"},
+            headers=admin_headers,
+        )
+
+        response = await client.get(
+            f"/api/v1/tils/{sample_til.slug}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_tag_rename_changes_etag(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        sample_til_with_tags: TIL,
+        sample_tag: Tag,
+    ) -> None:
+        """Test renaming an embedded tag invalidates the TIL ETag."""
+        url = f"/api/v1/tils/{sample_til_with_tags.slug}"
+        etag = (await client.get(url)).headers["etag"]
+
+        await client.put(
+            f"/api/v1/tags/{sample_tag.id}",
+            json={"name": "Python3"},
+            headers=admin_headers,
+        )
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["tags"][0]["name"] == "Python3"
+
+    @pytest.mark.asyncio
+    async def test_304_without_cache_skips_loading(
+        self,
+        client: AsyncClient,
+        sample_til_with_tags: TIL,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a current conditional GET never loads the TIL when uncached."""
+        url = f"/api/v1/tils/{sample_til_with_tags.slug}"
+        etag = (await client.get(url)).headers["etag"]
+        monkeypatch.setattr(response_cache, "backend", None)
+
+        async def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("TIL loaded for a 304")
+
+        monkeypatch.setattr(til_crud, "get_til_by_slug", fail)
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+
+class TestConditionalBooks:
+    """Tests for conditional GET on book and note detail endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_new_note_changes_book_etag(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        sample_book: Book,
+    ) -> None:
+        """Test adding a note invalidates the book-with-notes ETag."""
+        url = f"/api/v1/books/{sample_book.slug}"
+        etag = (await client.get(url)).headers["etag"]
+        assert (await client.get(url, headers={"If-None-Match": etag})).status_code == 304
+
+        await client.post(
+            f"{url}/notes",
+            json={"chapter_title": "Chapter 1", "content": "Meaningful names"},
+            headers=admin_headers,
+        )
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["notes_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_note_not_modified(
+        self, client: AsyncClient, db_session: AsyncSession, sample_book: Book
+    ) -> None:
+        """Test a note detail answers 304 for its current ETag."""
+        note = BookNote(
+            book_id=sample_book.id,
+            chapter_title="Chapter 1",
+            content="Meaningful names",
+            slug="clean-code-chapter-1",
+        )
+        db_session.add(note)
+        await db_session.commit()
+
+        url = f"/api/v1/books/{sample_book.slug}/notes/{note.slug}"
+        etag = (await client.get(url)).headers["etag"]
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+class TestConditionalTags:
+    """Tests for conditional GET /api/v1/tags."""
+
+    @pytest.mark.asyncio
+    async def test_tag_list_etag(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        sample_tag: Tag,
+    ) -> None:
+        """Test the tag list answers 304 until a tag is deleted."""
+        etag = (await client.get("/api/v1/tags")).headers["etag"]
+        response = await client.get("/api/v1/tags", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        await client.delete(f"/api/v1/tags/{sample_tag.id}", headers=admin_headers)
+
+        response = await client.get("/api/v1/tags", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == []
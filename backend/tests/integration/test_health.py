@@ -0,0 +1,24 @@
+"""Integration tests for health endpoints."""
+
+import pytest
+from httpx import AsyncClient
+
+
+class TestHealth:
+    """Tests for /health and /health/db."""
+
+    @pytest.mark.asyncio
+    async def test_health(self, client: AsyncClient) -> None:
+        """Test the liveness endpoint."""
+        response = await client.get("/health")
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy"}
+
+    @pytest.mark.asyncio
+    async def test_db_pool_metrics(self, client: AsyncClient) -> None:
+        """Test pool metrics are reported."""
+        response = await client.get("/health/db")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert "pool" in data["pools"]["primary"]
@@ -0,0 +1,345 @@
+"""Integration tests for background TIL generation jobs."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+from uuid import uuid4
+
+import pytest
+from fastapi import Request
+from httpx import AsyncClient
+
+from app.api.v1.endpoints import generate
+from app.jobs import JobQueue
+from app.models import TIL
+from app.services.ai import generator
+from app.services.ai.providers.base import BaseLLMProvider, LLMResponse
+from app.services.content.extractors.file import FileExtractor
+
+
+def _messages(body: str) -> list[dict[str, str]]:
+    """Parse an SSE body into field dicts (event, data and optional id)."""
+    return [
+        dict(line.split(": ", 1) for line in block.splitlines())
+        for block in body.strip().split("\n\n")
+    ]
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    """Parse an SSE body into (event, data) pairs."""
+    return [
+        (message["event"], json.loads(message["data"]))
+        for message in _messages(body)
+    ]
+
+
+class FakeProvider(BaseLLMProvider):
+    """Provider whose content stream can be held open by a gate."""
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.prompts: list[str] = []
+
+    async def generate(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> LLMResponse:
+        return LLMResponse(content="Generated", model="fake")
+
+    async def generate_stream(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        self.prompts.append(prompt)
+        yield "# Body"
+        await self.gate.wait()
+        yield "\n\ntext"
+
+    async def health_check(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def provider(monkeypatch: pytest.MonkeyPatch) -> FakeProvider:
+    """Route TIL generation to a fake provider."""
+    fake = FakeProvider()
+    monkeypatch.setattr(generator, "get_llm_provider", lambda *args, **kwargs: fake)
+    return fake
+
+
+async def _collect(queue: JobQueue, job_id: Any) -> list[dict]:
+    return [event async for _, event in queue.events(job_id)]
+
+
+class TestGenerateJobs:
+    """Tests for generation submitted through the job queue."""
+
+    @pytest.mark.asyncio
+    async def test_stream_runs_generation_as_job(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        running_job_queue: JobQueue,
+        provider: FakeProvider,
+        sample_til: TIL,
+    ) -> None:
+        """Test the stream announces the job and the job stores the result."""
+        response = await client.post(
+            "/api/v1/generate/stream",
+            json={"input_type": "text", "content": "notes"},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        events = _events(response.text)
+        names = [name for name, _ in events]
+        assert names[0] == "job"
+        assert names[1] == "day_number"
+        assert names[-1] == "complete"
+        assert events[1][1] == {"day_number": 2}
+        job_id = events[0][1]["job_id"]
+        assert response.headers["x-job-id"] == job_id
+
+        response = await client.get(
+            f"/api/v1/generate/jobs/{job_id}", headers=admin_headers
+        )
+        assert response.status_code == 200
+        job = response.json()
+        assert job["status"] == "succeeded"
+        assert job["result"]["content"] == "# Body\n\ntext"
+        assert job["finished_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_reattach_replays_events(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        running_job_queue: JobQueue,
+        provider: FakeProvider,
+    ) -> None:
+        """Test a client attaching later receives every event from the start."""
+        first = await client.post(
+            "/api/v1/generate/stream",
+            json={"input_type": "text", "content": "notes"},
+            headers=admin_headers,
+        )
+        job_id = first.headers["x-job-id"]
+
+        again = await client.get(
+            f"/api/v1/generate/jobs/{job_id}/events", headers=admin_headers
+        )
+
+        assert again.status_code == 200
+        assert _events(again.text) == _events(first.text)
+
+    @pytest.mark.asyncio
+    async def test_resume_from_last_event_id(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        running_job_queue: JobQueue,
+        provider: FakeProvider,
+    ) -> None:
+        """Test events carry increasing ids and Last-Event-ID resumes after one."""
+        first = await client.post(
+            "/api/v1/generate/stream",
+            json={"input_type": "text", "content": "notes"},
+            headers=admin_headers,
+        )
+        messages = _messages(first.text)
+        ids = [int(message["id"]) for message in messages[1:]]
+        assert "id" not in messages[0]
+        assert ids == list(range(1, len(ids) + 1))
+
+        resumed = await client.get(
+            f"/api/v1/generate/jobs/{first.headers['x-job-id']}/events",
+            headers={**admin_headers, "Last-Event-ID": "2"},
+        )
+
+        assert _messages(resumed.text)[1:] == messages[3:]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_submission_reuses_active_job(
+        self, running_job_queue: JobQueue, provider: FakeProvider
+    ) -> None:
+        """Test the same input attaches to the running job instead of rerunning."""
+        provider.gate.clear()
+        params = {"input_type": "text", "content": "notes", "force": False}
+
+        job_id = await running_job_queue.submit(
+            "til_generate", generator.generate_til_job, params
+        )
+        same = await running_job_queue.submit(
+            "til_generate", generator.generate_til_job, params
+        )
+        other = await running_job_queue.submit(
+            "til_generate",
+            generator.generate_til_job,
+            {**params, "content": "other notes"},
+        )
+        provider.gate.set()
+        await _collect(running_job_queue, job_id)
+        await _collect(running_job_queue, other)
+
+        assert same == job_id
+        assert other != job_id
+        assert len(provider.prompts) == 2
+
+    @pytest.mark.asyncio
+    async def test_finished_job_is_not_reused(
+        self, running_job_queue: JobQueue, provider: FakeProvider
+    ) -> None:
+        """Test resubmitting after completion starts a new job."""
+        params = {"input_type": "text", "content": "notes", "force": False}
+        job_id = await running_job_queue.submit(
+            "til_generate", generator.generate_til_job, params
+        )
+        await _collect(running_job_queue, job_id)
+
+        again = await running_job_queue.submit(
+            "til_generate", generator.generate_til_job, params
+        )
+        await _collect(running_job_queue, again)
+
+        assert again != job_id
+
+    @pytest.mark.asyncio
+    async def test_failing_handler_marks_job_failed(
+        self, running_job_queue: JobQueue
+    ) -> None:
+        """Test a handler exception ends the stream with an error event."""
+
+        async def handler(session_maker: Any, params: dict) -> AsyncIterator[dict]:
+            yield {"event": "step", "data": {}}
+            raise RuntimeError("boom")
+
+        job_id = await running_job_queue.submit("test", handler, {})
+        events = await _collect(running_job_queue, job_id)
+        job = await running_job_queue.get(job_id)
+
+        assert events == [
+            {"event": "step", "data": {}},
+            {"event": "error", "data": {"error": "boom"}},
+        ]
+        assert job is not None
+        assert job.status == "failed"
+        assert job.error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_stored_result_after_events_expire(
+        self, running_job_queue: JobQueue, provider: FakeProvider
+    ) -> None:
+        """Test jobs no longer held in memory replay their stored result."""
+        job_id = await running_job_queue.submit(
+            "til_generate",
+            generator.generate_til_job,
+            {"input_type": "text", "content": "notes", "force": False},
+        )
+        events = await _collect(running_job_queue, job_id)
+        running_job_queue._runs.pop(job_id)
+
+        assert await _collect(running_job_queue, job_id) == [events[-1]]
+
+    @pytest.mark.asyncio
+    async def test_upload_runs_as_job(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        running_job_queue: JobQueue,
+        provider: FakeProvider,
+    ) -> None:
+        """Test uploaded files are converted to text and generated as a job."""
+        response = await client.post(
+            "/api/v1/generate/upload",
+            files={"file": ("notes.md", b"# Notes", "text/markdown")},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        assert _events(response.text)[-1][0] == "complete"
+        assert "원본 파일: notes.md" in provider.prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_returns_413(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        running_job_queue: JobQueue,
+        provider: FakeProvider,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test uploads past the size limit are rejected before queuing."""
+        monkeypatch.setattr(FileExtractor, "MAX_FILE_SIZE", 1024)
+        response = await client.post(
+            "/api/v1/generate/upload",
+            files={"file": ("notes.md", b"x" * 2048, "text/markdown")},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 413
+        assert provider.prompts == []
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_rejected_before_parsing(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        running_job_queue: JobQueue,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a Content-Length past the limit is refused without reading the form."""
+        monkeypatch.setattr(FileExtractor, "MAX_FILE_SIZE", 1024)
+        monkeypatch.setattr(generate, "UPLOAD_OVERHEAD", 0)
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("form parsed")
+
+        monkeypatch.setattr(Request, "form", fail)
+        response = await client.post(
+            "/api/v1/generate/upload",
+            files={"file": ("notes.md", b"x" * 2048, "text/markdown")},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_returns_404(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        running_job_queue: JobQueue,
+    ) -> None:
+        """Test looking up or attaching to a missing job."""
+        for path in (f"/jobs/{uuid4()}", f"/jobs/{uuid4()}/events"):
+            response = await client.get(
+                f"/api/v1/generate{path}", headers=admin_headers
+            )
+            assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_stream_requires_content(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        running_job_queue: JobQueue,
+    ) -> None:
+        """Test file input and missing content are rejected before queuing."""
+        for body in ({"input_type": "file"}, {"input_type": "text"}):
+            response = await client.post(
+                "/api/v1/generate/stream", json=body, headers=admin_headers
+            )
+            assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_stream_without_running_queue(
+        self, client: AsyncClient, admin_headers: dict[str, str]
+    ) -> None:
+        """Test submitting while the queue is stopped returns 503."""
+        response = await client.post(
+            "/api/v1/generate/stream",
+            json={"input_type": "text", "content": "notes"},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 503
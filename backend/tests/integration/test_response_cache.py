@@ -0,0 +1,172 @@
+"""Integration tests for response caching and write invalidation."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import TIL, Book, BookNote, Tag
+
+
+class TestTILCache:
+    """Tests for cached TIL reads."""
+
+    @pytest.mark.asyncio
+    async def test_detail_served_from_cache(
+        self, client: AsyncClient, db_session: AsyncSession, sample_til: TIL
+    ) -> None:
+        """Test repeated reads do not see out-of-band database changes."""
+        url = f"/api/v1/tils/{sample_til.slug}"
+        first = await client.get(url)
+
+        await db_session.execute(
+            update(TIL).where(TIL.id == sample_til.id).values(title="Changed")
+        )
+        await db_session.commit()
+
+        second = await client.get(url)
+        assert second.json() == first.json()
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_detail_and_lists(
+        self, client: AsyncClient, admin_headers: dict[str, str], sample_til: TIL
+    ) -> None:
+        """Test updating a TIL refreshes its detail and list pages."""
+        await client.get(f"/api/v1/tils/{sample_til.slug}")
+        await client.get(f"/api/v1/tils/day/{sample_til.day_number}")
+        await client.get("/api/v1/tils")
+
+        await client.put(
+            f"/api/v1/tils/{sample_til.id}",
+            json={"title": "Updated title"},
+            headers=admin_headers,
+        )
+
+        detail = await client.get(f"/api/v1/tils/{sample_til.slug}")
+        by_day = await client.get(f"/api/v1/tils/day/{sample_til.day_number}")
+        listing = await client.get("/api/v1/tils")
+        assert detail.json()["title"] == "Updated title"
+        assert by_day.json()["title"] == "Updated title"
+        assert listing.json()["items"][0]["title"] == "Updated title"
+
+    @pytest.mark.asyncio
+    async def test_create_invalidates_tag_page(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        sample_tag: Tag,
+    ) -> None:
+        """Test creating a tagged TIL refreshes that tag's list page."""
+        url = f"/api/v1/tils?tag={sample_tag.slug}"
+        assert (await client.get(url)).json()["total"] == 0
+
+        await client.post(
+            "/api/v1/tils",
+            json={
+                "title": "Tagged",
+                "day_number": 7,
+                "excerpt": "Excerpt",
+                "content": "Content",
+                "tag_ids": [str(sample_tag.id)],
+            },
+            headers=admin_headers,
+        )
+
+        assert (await client.get(url)).json()["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tag_rename_invalidates_embedding_responses(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        sample_til_with_tags: TIL,
+        sample_tag: Tag,
+    ) -> None:
+        """Test renaming a tag refreshes TILs and the tag list embedding it."""
+        await client.get(f"/api/v1/tils/{sample_til_with_tags.slug}")
+        await client.get("/api/v1/tags")
+
+        await client.put(
+            f"/api/v1/tags/{sample_tag.id}",
+            json={"name": "Python3"},
+            headers=admin_headers,
+        )
+
+        til = await client.get(f"/api/v1/tils/{sample_til_with_tags.slug}")
+        tags = await client.get("/api/v1/tags")
+        assert til.json()["tags"][0]["name"] == "Python3"
+        assert tags.json()[0]["name"] == "Python3"
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_cached(
+        self, client: AsyncClient, admin_headers: dict[str, str]
+    ) -> None:
+        """Test a 404 does not stick once the TIL exists."""
+        assert (await client.get("/api/v1/tils/day/3")).status_code == 404
+
+        await client.post(
+            "/api/v1/tils",
+            json={
+                "title": "Day three",
+                "day_number": 3,
+                "excerpt": "Excerpt",
+                "content": "Content",
+            },
+            headers=admin_headers,
+        )
+
+        assert (await client.get("/api/v1/tils/day/3")).status_code == 200
+
+
+class TestBookCache:
+    """Tests for cached book and note reads."""
+
+    @pytest.mark.asyncio
+    async def test_note_write_invalidates_book_views(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        sample_book: Book,
+    ) -> None:
+        """Test creating a note refreshes the book, book list, notes and stats."""
+        base = f"/api/v1/books/{sample_book.slug}"
+        await client.get(base)
+        await client.get("/api/v1/books")
+        await client.get(f"{base}/notes")
+        await client.get("/api/v1/books/stats")
+
+        await client.post(
+            f"{base}/notes",
+            json={"chapter_title": "Chapter 1", "content": "Meaningful names"},
+            headers=admin_headers,
+        )
+
+        assert (await client.get(base)).json()["notes_count"] == 1
+        assert (await client.get("/api/v1/books")).json()["items"][0]["notes_count"] == 1
+        assert (await client.get(f"{base}/notes")).json()["total"] == 1
+        assert (await client.get("/api/v1/books/stats")).json()["total_notes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_book_invalidates_note_detail(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_headers: dict[str, str],
+        sample_book: Book,
+    ) -> None:
+        """Test deleting a book drops its cached note details."""
+        note = BookNote(
+            book_id=sample_book.id,
+            chapter_title="Chapter 1",
+            content="Meaningful names",
+            slug="clean-code-chapter-1",
+        )
+        db_session.add(note)
+        await db_session.commit()
+
+        url = f"/api/v1/books/{sample_book.slug}/notes/{note.slug}"
+        assert (await client.get(url)).status_code == 200
+
+        await client.delete(f"/api/v1/books/{sample_book.id}", headers=admin_headers)
+
+        assert (await client.get(url)).status_code == 404
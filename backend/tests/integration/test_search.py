@@ -0,0 +1,181 @@
+"""Integration tests for search endpoints."""
+
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import TIL, Book, BookNote
+
+
+@pytest.fixture
+async def search_corpus(db_session: AsyncSession, sample_book: Book) -> None:
+    """Create published and draft content to search."""
+    db_session.add_all(
+        [
+            TIL(
+                title="FastAPI 의존성 주입",
+                slug="fastapi-di",
+                day_number=1,
+                excerpt="Depends 사용법",
+                content="FastAPI dependency injection with Depends and asyncio.",
+                is_published=True,
+            ),
+            TIL(
+                title="Draft about asyncio",
+                slug="draft-asyncio",
+                day_number=2,
+                excerpt="Draft",
+                content="asyncio event loop internals",
+                is_published=False,
+            ),
+            BookNote(
+                book_id=sample_book.id,
+                chapter_title="Chapter 1: asyncio basics",
+                content="Coroutines, tasks and the asyncio event loop. asyncio!",
+                reading_date=date(2026, 1, 1),
+                is_published=True,
+                slug="asyncio-basics",
+            ),
+            BookNote(
+                book_id=sample_book.id,
+                chapter_title="Chapter 2: Naming",
+                content="Meaningful names matter.",
+                reading_date=date(2026, 1, 2),
+                is_published=True,
+                slug="naming",
+            ),
+        ]
+    )
+    await db_session.commit()
+
+
+class TestSearch:
+    """Tests for GET /api/v1/search endpoint."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("search_corpus")
+    async def test_search_across_types(self, client: AsyncClient) -> None:
+        """Test that published TILs and notes are both returned."""
+        response = await client.get("/api/v1/search?q=asyncio")
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert {(item["type"], item["slug"]) for item in items} == {
+            ("til", "fastapi-di"),
+            ("book_note", "asyncio-basics"),
+        }
+        note = next(item for item in items if item["type"] == "book_note")
+        assert note["book_slug"] == "clean-code"
+        assert "<mark>" in note["snippet"]
+        ranks = [item["rank"] for item in items]
+        assert ranks == sorted(ranks, reverse=True)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("search_corpus")
+    async def test_search_type_filter(self, client: AsyncClient) -> None:
+        """Test restricting results to one content type."""
+        response = await client.get("/api/v1/search?q=asyncio&type=til")
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [item["slug"] for item in items] == ["fastapi-di"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("search_corpus")
+    async def test_search_korean_terms(self, client: AsyncClient) -> None:
+        """Test matching a Korean word in the title."""
+        response = await client.get("/api/v1/search?q=의존성")
+        assert response.status_code == 200
+        assert [item["slug"] for item in response.json()["items"]] == ["fastapi-di"]
+
+    @pytest.mark.asyncio
+    async def test_search_korean_substring(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """Test that ngram mode finds a stem inside a word with a particle."""
+        db_session.add(
+            TIL(
+                title="이벤트 루프",
+                slug="event-loop",
+                day_number=3,
+                excerpt="요약",
+                content="비동기를 사용하면 대기 시간을 줄일 수 있다.",
+                is_published=True,
+            )
+        )
+        await db_session.commit()
+
+        response = await client.get("/api/v1/search?q=동기")
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [item["slug"] for item in items] == ["event-loop"]
+        assert "<mark>동기</mark>" in items[0]["snippet"]
+
+        response = await client.get("/api/v1/search?q=동기&mode=fulltext")
+        assert response.json()["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_ngram_snippet_is_escaped_and_case_insensitive(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """Test n-gram snippets escape markup and highlight any letter case."""
+        db_session.add(
+            TIL(
+                title="비동기 정리",
+                slug="async-notes",
+                day_number=3,
+                excerpt="요약",
+                content="<script>x</script> 비동기 AsyncIO & asyncio 루프",
+                is_published=True,
+            )
+        )
+        await db_session.commit()
+
+        response = await client.get("/api/v1/search?q=asyncio&mode=ngram")
+        assert response.status_code == 200
+        assert response.json()["items"][0]["snippet"] == (
+            "&lt;script&gt;x&lt;/script&gt; 비동기 <mark>AsyncIO</mark> &amp; "
+            "<mark>asyncio</mark> 루프"
+        )
+
+    @pytest.mark.asyncio
+    async def test_fulltext_snippet_is_escaped(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """Test fulltext snippets escape markup like n-gram ones do."""
+        db_session.add(
+            TIL(
+                title="Event loops",
+                slug="event-loops",
+                day_number=3,
+                excerpt="Summary",
+                content="<b>bold</b> asyncio & friends",
+                is_published=True,
+            )
+        )
+        await db_session.commit()
+
+        response = await client.get("/api/v1/search?q=asyncio&mode=fulltext")
+        assert response.status_code == 200
+        assert response.json()["items"][0]["snippet"] == (
+            "&lt;b&gt;bold&lt;/b&gt; <mark>asyncio</mark> &amp; friends"
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("search_corpus")
+    async def test_search_query_syntax_is_escaped(self, client: AsyncClient) -> None:
+        """Test that FTS operators in user input do not cause errors."""
+        response = await client.get('/api/v1/search?q=asyncio" OR (')
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("search_corpus")
+    async def test_book_notes_search_param(
+        self, client: AsyncClient, sample_book: Book
+    ) -> None:
+        """Test the q filter on the book notes list uses the search index."""
+        response = await client.get(f"/api/v1/books/{sample_book.slug}/notes?q=names")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["slug"] == "naming"
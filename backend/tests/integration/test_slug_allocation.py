@@ -0,0 +1,152 @@
+"""Integration tests for database-backed slug allocation."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import slug as slug_crud
+from app.models import TIL, Tag
+
+
+def _til(slug: str, day_number: int) -> TIL:
+    return TIL(
+        title="Title",
+        slug=slug,
+        day_number=day_number,
+        excerpt="Excerpt",
+        content="Content",
+    )
+
+
+class TestNextAvailableSlug:
+    """Tests for next_available_slug."""
+
+    @pytest.mark.asyncio
+    async def test_free_base_slug(self, db_session: AsyncSession) -> None:
+        """Test that an unused base slug is returned as-is."""
+        slug = await slug_crud.next_available_slug(db_session, TIL.slug, "hello")
+        assert slug == "hello"
+
+    @pytest.mark.asyncio
+    async def test_next_suffix_after_highest(self, db_session: AsyncSession) -> None:
+        """Test that the suffix continues after the highest existing one."""
+        db_session.add_all(
+            [_til("hello", 1), _til("hello-1", 2), _til("hello-7", 3)]
+        )
+        await db_session.commit()
+
+        slug = await slug_crud.next_available_slug(db_session, TIL.slug, "hello")
+        assert slug == "hello-8"
+
+    @pytest.mark.asyncio
+    async def test_ignores_non_numeric_and_other_prefixes(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that only base and base-N rows are considered."""
+        db_session.add_all(
+            [
+                _til("hello", 1),
+                _til("hello-world", 2),
+                _til("hello-world-9", 3),
+                _til("hellox-5", 4),
+            ]
+        )
+        await db_session.commit()
+
+        slug = await slug_crud.next_available_slug(db_session, TIL.slug, "hello")
+        assert slug == "hello-1"
+
+    @pytest.mark.asyncio
+    async def test_ignores_suffixes_too_long_for_integer(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that numeric suffixes past INTEGER range are not cast."""
+        db_session.add_all(
+            [_til("top", 1), _til("top-2", 2), _til("top-10000000000", 3)]
+        )
+        await db_session.commit()
+
+        slug = await slug_crud.next_available_slug(db_session, TIL.slug, "top")
+        assert slug == "top-3"
+
+    @pytest.mark.asyncio
+    async def test_like_wildcards_are_literal(self, db_session: AsyncSession) -> None:
+        """Test that LIKE wildcards in the base slug match literally."""
+        db_session.add_all([_til("a_b", 1), _til("axb-3", 2)])
+        await db_session.commit()
+
+        slug = await slug_crud.next_available_slug(db_session, TIL.slug, "a_b")
+        assert slug == "a_b-1"
+
+
+class TestAddWithUniqueSlug:
+    """Tests for add_with_unique_slug."""
+
+    @pytest.mark.asyncio
+    async def test_retries_on_conflict(
+        self, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a slug taken by a concurrent writer is retried."""
+        db_session.add(Tag(name="Existing", slug="python"))
+        await db_session.commit()
+
+        # Simulate a writer that committed "python" after our lookup
+        real_next = slug_crud.next_available_slug
+        calls = 0
+
+        async def stale_then_real(*args: object) -> str:
+            nonlocal calls
+            calls += 1
+            return "python" if calls == 1 else await real_next(*args)
+
+        monkeypatch.setattr(slug_crud, "next_available_slug", stale_then_real)
+
+        tag = Tag(name="Python")
+        await slug_crud.add_with_unique_slug(db_session, tag, "Python")
+        await db_session.commit()
+
+        assert calls == 2
+        assert tag.slug == "python-1"
+
+
+class TestUpdateWithUniqueSlug:
+    """Tests for update_with_unique_slug."""
+
+    @pytest.mark.asyncio
+    async def test_rename_retries_on_conflict(
+        self, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a rename to a slug taken concurrently is retried."""
+        db_session.add(Tag(name="Existing", slug="python"))
+        tag = Tag(name="Go", slug="go")
+        db_session.add(tag)
+        await db_session.commit()
+
+        real_next = slug_crud.next_available_slug
+        calls = 0
+
+        async def stale_then_real(*args: object) -> str:
+            nonlocal calls
+            calls += 1
+            return "python" if calls == 1 else await real_next(*args)
+
+        monkeypatch.setattr(slug_crud, "next_available_slug", stale_then_real)
+
+        tag.name = "Python"
+        await slug_crud.update_with_unique_slug(db_session, tag, "Python")
+        await db_session.commit()
+        await db_session.refresh(tag)
+
+        assert calls == 2
+        assert (tag.name, tag.slug) == ("Python", "python-1")
+
+    @pytest.mark.asyncio
+    async def test_keeps_matching_slug(self, db_session: AsyncSession) -> None:
+        """Test a rename with the same base slug keeps the current slug."""
+        tag = Tag(name="Python", slug="python-2")
+        db_session.add(tag)
+        await db_session.commit()
+
+        tag.name = "python"
+        await slug_crud.update_with_unique_slug(db_session, tag, "python")
+
+        assert tag.slug == "python-2"
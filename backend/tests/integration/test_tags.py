@@ -33,6 +33,18 @@ class TestListTags:
         assert data[0]["slug"] == "python"
         assert "id" in data[0]
 
+    @pytest.mark.asyncio
+    async def test_list_tags_sparse_fields(
+        self, client: AsyncClient, sample_tag: Tag
+    ) -> None:
+        """Test that fields narrows each tag to the requested keys."""
+        response = await client.get("/api/v1/tags?fields=name")
+        assert response.status_code == 200
+        assert response.json() == [{"name": "Python"}]
+
+        response = await client.get("/api/v1/tags?fields=name,tils")
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_list_tags_multiple(
         self, client: AsyncClient, db_session: AsyncSession
@@ -68,6 +68,43 @@ class TestListTILs:
         data = response.json()
         assert len(data["items"]) == 5
 
+    @pytest.mark.asyncio
+    async def test_list_tils_cursor_pagination(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """Test TIL list keyset pagination with next_cursor."""
+        for i in range(1, 8):
+            til = TIL(
+                title=f"Day {i} TIL",
+                slug=f"day-{i}-til",
+                day_number=i,
+                excerpt=f"Excerpt for day {i}",
+                content=f"Content for day {i}",
+                is_published=True,
+            )
+            db_session.add(til)
+        await db_session.commit()
+
+        day_numbers: list[int] = []
+        response = await client.get("/api/v1/tils?size=3")
+        data = response.json()
+        day_numbers.extend(item["day_number"] for item in data["items"])
+        while data["next_cursor"]:
+            response = await client.get(
+                f"/api/v1/tils?size=3&cursor={data['next_cursor']}"
+            )
+            assert response.status_code == 200
+            data = response.json()
+            day_numbers.extend(item["day_number"] for item in data["items"])
+
+        assert day_numbers == [7, 6, 5, 4, 3, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_list_tils_invalid_cursor(self, client: AsyncClient) -> None:
+        """Test that a malformed cursor is rejected."""
+        response = await client.get("/api/v1/tils?cursor=not-a-cursor")
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_list_tils_filter_by_published(
         self, client: AsyncClient, db_session: AsyncSession
@@ -118,6 +155,51 @@ class TestListTILs:
         assert len(data["items"]) == 1
         assert data["items"][0]["title"] == sample_til_with_tags.title
 
+    @pytest.mark.asyncio
+    async def test_list_tils_summary_view(
+        self, client: AsyncClient, sample_til_with_tags: TIL
+    ) -> None:
+        """Test the summary view omits content but keeps list fields."""
+        response = await client.get("/api/v1/tils?view=summary")
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert "content" not in item
+        assert item["excerpt"] == sample_til_with_tags.excerpt
+        assert item["tags"][0]["slug"] == "python"
+
+        full = await client.get("/api/v1/tils")
+        assert full.json()["items"][0]["content"] == sample_til_with_tags.content
+
+    @pytest.mark.asyncio
+    async def test_list_tils_invalid_view(self, client: AsyncClient) -> None:
+        """Test that an unknown view is rejected."""
+        response = await client.get("/api/v1/tils?view=compact")
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_list_tils_sparse_fields(
+        self, client: AsyncClient, sample_til_with_tags: TIL
+    ) -> None:
+        """Test that fields narrows each item to the requested keys."""
+        response = await client.get("/api/v1/tils?fields=slug,title&size=1")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"] == [
+            {"slug": sample_til_with_tags.slug, "title": sample_til_with_tags.title}
+        ]
+        assert data["total"] == 1
+        assert data["next_cursor"] is not None
+
+        response = await client.get("/api/v1/tils?fields=slug,tags")
+        assert response.json()["items"][0]["tags"][0]["slug"] == "python"
+
+    @pytest.mark.asyncio
+    async def test_list_tils_unknown_field(self, client: AsyncClient) -> None:
+        """Test that an unknown field is rejected."""
+        response = await client.get("/api/v1/tils?fields=slug,secret")
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Unknown fields: secret"
+
 
 class TestGetTIL:
     """Tests for GET /api/v1/tils/{slug} endpoint."""
@@ -140,6 +222,18 @@ class TestGetTIL:
         response = await client.get("/api/v1/tils/non-existent")
         assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_get_til_sparse_fields(
+        self, client: AsyncClient, sample_til_with_tags: TIL
+    ) -> None:
+        """Test that fields narrows the detail response and keeps validators."""
+        response = await client.get(
+            f"/api/v1/tils/{sample_til_with_tags.slug}?fields=title,updated_at"
+        )
+        assert response.status_code == 200
+        assert set(response.json()) == {"title", "updated_at"}
+        assert "etag" in response.headers
+
 
 class TestGetTILByDay:
     """Tests for GET /api/v1/tils/day/{day_number} endpoint."""
@@ -0,0 +1,41 @@
+"""Unit tests for keyset pagination cursor utility."""
+
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+
+from app.utils.cursor import decode_cursor, encode_cursor
+
+
+class TestCursor:
+    """Tests for encode_cursor / decode_cursor."""
+
+    def test_round_trip(self) -> None:
+        """Test that decoded values match the encoded sort keys."""
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc)
+        item_id = uuid.uuid4()
+        cursor = encode_cursor(15, created_at, item_id)
+        result = decode_cursor(cursor, (int, datetime.fromisoformat, uuid.UUID))
+        assert result == (15, created_at, item_id)
+
+    def test_date_round_trip(self) -> None:
+        """Test that date values survive the round trip."""
+        cursor = encode_cursor(date(2026, 3, 1))
+        assert decode_cursor(cursor, (date.fromisoformat,)) == (date(2026, 3, 1),)
+
+    def test_cursor_is_url_safe(self) -> None:
+        """Test that the cursor needs no URL escaping."""
+        cursor = encode_cursor("a/b+c", datetime.now(timezone.utc))
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    def test_malformed_cursor_raises(self) -> None:
+        """Test that garbage input raises ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", (int,))
+
+    def test_wrong_arity_raises(self) -> None:
+        """Test that a cursor with the wrong number of keys is rejected."""
+        cursor = encode_cursor(1, 2)
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, (int,))
@@ -0,0 +1,50 @@
+"""Unit tests for the shared on-disk LRU store."""
+
+import os
+from pathlib import Path
+
+from app.cache import DiskLRUStore
+
+
+class TestDiskLRUStore:
+    """Tests for DiskLRUStore."""
+
+    def test_round_trip_and_miss(self, tmp_path: Path) -> None:
+        """Test written bytes are read back and unknown keys miss."""
+        store = DiskLRUStore(str(tmp_path), max_bytes=1024)
+        store.write("ab" * 32, b"body")
+
+        assert store.read("ab" * 32) == b"body"
+        assert store.read("cd" * 32) is None
+
+    def test_read_marks_entry_recently_used(self, tmp_path: Path) -> None:
+        """Test reading bumps the mtime used to pick eviction victims."""
+        store = DiskLRUStore(str(tmp_path), max_bytes=1024)
+        store.write("ab" * 32, b"body")
+        path = store.path("ab" * 32)
+        os.utime(path, (1000, 1000))
+
+        store.read("ab" * 32)
+
+        assert path.stat().st_mtime > 1000
+
+    def test_evicts_oldest_until_under_limit(self, tmp_path: Path) -> None:
+        """Test the least recently used entries go first."""
+        store = DiskLRUStore(str(tmp_path), max_bytes=250)
+        keys = [f"{i:064x}" for i in range(3)]
+        for i, key in enumerate(keys[:2]):
+            store.write(key, b"x" * 100)
+            os.utime(store.path(key), (1000 + i, 1000 + i))
+
+        store.write(keys[2], b"x" * 100)
+
+        assert store.read(keys[0]) is None
+        assert store.read(keys[1]) == store.read(keys[2]) == b"x" * 100
+        assert store._size == 200
+
+    def test_oversized_entry_is_not_stored(self, tmp_path: Path) -> None:
+        """Test an entry bigger than the whole store is skipped."""
+        store = DiskLRUStore(str(tmp_path), max_bytes=10)
+        store.write("ab" * 32, b"x" * 11)
+
+        assert store.read("ab" * 32) is None
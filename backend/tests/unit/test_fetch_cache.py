@@ -0,0 +1,231 @@
+"""Unit tests for the conditional-request URL page cache."""
+
+import os
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from app.services.content import parsing
+from app.services.content.extractors.url import URLExtractor
+from app.services.content.fetch_cache import CachedPage, FetchCache
+from app.services.content.fetcher import HTTPFetcher
+from app.services.content.pool import ParsePool
+
+ARTICLE = """
+<html><head><title>Caching</title></head><body>
+<article><h1>Caching</h1>
+<p>Validators let a client revalidate a stored response instead of
+downloading it again.</p>
+<p>See <a href="https://www.rfc-editor.org/rfc/rfc9111">RFC 9111</a>.</p>
+</article></body></html>
+"""
+
+
+class _Site:
+    """Pages served by the local test server, and the requests it saw."""
+
+    def __init__(self) -> None:
+        self.body = ARTICLE
+        self.etag: Optional[str] = '"v1"'
+        self.last_modified: Optional[str] = "Wed, 01 Oct 2026 08:00:00 GMT"
+        self.requests: list[dict[str, str]] = []
+
+
+@pytest.fixture
+def site() -> Iterator[tuple[_Site, str]]:
+    """A local HTTP server honouring If-None-Match and If-Modified-Since."""
+    state = _Site()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            headers = {key.lower(): value for key, value in self.headers.items()}
+            state.requests.append(headers)
+            if state.etag and headers.get("if-none-match") == state.etag:
+                fresh = True
+            elif "if-none-match" not in headers and state.last_modified:
+                fresh = headers.get("if-modified-since") == state.last_modified
+            else:
+                fresh = False
+
+            self.send_response(304 if fresh else 200)
+            if state.etag:
+                self.send_header("ETag", state.etag)
+            if state.last_modified:
+                self.send_header("Last-Modified", state.last_modified)
+            if fresh:
+                self.end_headers()
+                return
+            body = state.body.encode()
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield state, f"http://127.0.0.1:{server.server_port}/docs/caching"
+    server.shutdown()
+    server.server_close()
+
+
+async def _extract_twice(cache: FetchCache, url: str, between=None):
+    fetcher = HTTPFetcher(http2=False)
+    extractor = URLExtractor(fetcher, ParsePool(executor_type="inline"), cache)
+    try:
+        first = await extractor.extract(url)
+        if between is not None:
+            between()
+        second = await extractor.extract(url)
+    finally:
+        await fetcher.close()
+    return first, second
+
+
+class TestURLExtractorCache:
+    """Tests for URLExtractor revalidating cached pages."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_extraction_on_not_modified(self, site, tmp_path, monkeypatch):
+        """Test a 304 returns the stored extraction without parsing again."""
+        state, url = site
+        cache = FetchCache(str(tmp_path), 1024 * 1024)
+        parsed: list[str] = []
+        original = parsing.parse_article
+
+        def counting_parse(html: str):
+            parsed.append(html)
+            return original(html)
+
+        monkeypatch.setattr(
+            "app.services.content.extractors.url.parse_article", counting_parse
+        )
+        first, second = await _extract_twice(cache, url)
+
+        assert second == first
+        assert first.title == "Caching"
+        assert "[RFC 9111](https://www.rfc-editor.org/rfc/rfc9111)" in first.text
+        assert len(parsed) == 1
+        assert "if-none-match" not in state.requests[0]
+        assert state.requests[1]["if-none-match"] == '"v1"'
+        assert state.requests[1]["if-modified-since"] == state.last_modified
+
+        stored = await cache.get(url)
+        assert stored.body == ARTICLE
+        assert stored.etag == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_last_modified_only(self, site, tmp_path):
+        """Test pages without an ETag revalidate by date."""
+        state, url = site
+        state.etag = None
+        first, second = await _extract_twice(FetchCache(str(tmp_path), 1024 * 1024), url)
+
+        assert second == first
+        assert "if-none-match" not in state.requests[1]
+        assert state.requests[1]["if-modified-since"] == state.last_modified
+
+    @pytest.mark.asyncio
+    async def test_changed_page_is_refetched(self, site, tmp_path):
+        """Test a new ETag replaces the cached body and extraction."""
+        state, url = site
+        cache = FetchCache(str(tmp_path), 1024 * 1024)
+
+        def change() -> None:
+            state.body = ARTICLE.replace("RFC 9111", "RFC 9110")
+            state.etag = '"v2"'
+
+        first, second = await _extract_twice(cache, url, between=change)
+
+        assert "RFC 9111" in first.text
+        assert "RFC 9110" in second.text
+        assert (await cache.get(url)).etag == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_pages_without_validators_are_not_cached(self, site, tmp_path):
+        """Test responses that cannot be revalidated are not stored."""
+        state, url = site
+        state.etag = state.last_modified = None
+        cache = FetchCache(str(tmp_path), 1024 * 1024)
+        await _extract_twice(cache, url)
+
+        assert await cache.get(url) is None
+        assert all("if-modified-since" not in headers for headers in state.requests)
+
+    @pytest.mark.asyncio
+    async def test_parser_change_reparses_stored_body(self, site, tmp_path, monkeypatch):
+        """Test a 304 for an entry from an older parser reparses the cached body."""
+        state, url = site
+        cache = FetchCache(str(tmp_path), 1024 * 1024)
+        await cache.set(
+            CachedPage(
+                url=url,
+                body=ARTICLE,
+                etag='"v1"',
+                parser_version=parsing.PARSER_VERSION - 1,
+                extracted={"text": "stale", "title": None, "url": url},
+            )
+        )
+        fetcher = HTTPFetcher(http2=False)
+        extracted = await URLExtractor(
+            fetcher, ParsePool(executor_type="inline"), cache
+        ).extract(url)
+        await fetcher.close()
+
+        assert len(state.requests) == 1
+        assert state.requests[0]["if-none-match"] == '"v1"'
+        assert extracted.title == "Caching"
+        assert (await cache.get(url)).parser_version == parsing.PARSER_VERSION
+
+
+class TestFetchCache:
+    """Tests for FetchCache storage and eviction."""
+
+    def _page(self, url: str, size: int = 1000) -> CachedPage:
+        return CachedPage(url=url, body="x" * size, etag='"e"')
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_and_miss(self, tmp_path):
+        """Test stored pages are read back and unknown URLs miss."""
+        cache = FetchCache(str(tmp_path), 1024 * 1024)
+        await cache.set(self._page("https://a.example/"))
+
+        assert (await cache.get("https://a.example/")).body == "x" * 1000
+        assert await cache.get("https://b.example/") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path):
+        """Test the oldest unused entry goes first once the cap is exceeded."""
+        cache = FetchCache(str(tmp_path), 3500)
+        for name in ("a", "b", "c"):
+            await cache.set(self._page(f"https://{name}.example/"))
+        # Make "a" the oldest on disk, then read it so "b" becomes the LRU entry
+        for age, name in ((300, "a"), (200, "b"), (100, "c")):
+            path = cache._path(f"https://{name}.example/")
+            os.utime(path, (path.stat().st_atime, path.stat().st_mtime - age))
+        assert await cache.get("https://a.example/") is not None
+
+        await cache.set(self._page("https://d.example/"))
+
+        assert await cache.get("https://b.example/") is None
+        for name in ("a", "c", "d"):
+            assert await cache.get(f"https://{name}.example/") is not None
+        total = sum(path.stat().st_size for path in Path(tmp_path).glob("*/*.json"))
+        assert total <= 3500
+
+    @pytest.mark.asyncio
+    async def test_unreadable_entry_is_a_miss(self, tmp_path):
+        """Test a corrupt entry is treated as missing."""
+        cache = FetchCache(str(tmp_path), 1024 * 1024)
+        path = cache._path("https://a.example/")
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        assert await cache.get("https://a.example/") is None
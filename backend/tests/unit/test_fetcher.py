@@ -0,0 +1,173 @@
+"""Unit tests for the pooled URL fetcher."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from app.services.content.extractors.url import URLExtractor
+from app.services.content.fetcher import HTTPFetcher
+from app.services.content.pool import ParsePool
+
+ARTICLE = """
+<html><head><title>Async IO</title></head><body>
+<article><h1>Async IO</h1>
+<p>Event loops run coroutines cooperatively, switching at every await.</p>
+<p>See <a href="https://docs.python.org/3/library/asyncio.html">the docs</a>.</p>
+<pre><code class="language-python">await asyncio.sleep(1)</code></pre>
+</article></body></html>
+"""
+
+
+def _fetcher(handler, **kwargs) -> HTTPFetcher:
+    return HTTPFetcher(transport=httpx.MockTransport(handler), http2=False, **kwargs)
+
+
+class TestHTTPFetcher:
+    """Tests for HTTPFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_follows_redirects(self) -> None:
+        """Test the final URL and decoded body are returned."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/old":
+                return httpx.Response(301, headers={"Location": "/new"})
+            return httpx.Response(
+                200,
+                content="본문".encode("euc-kr"),
+                headers={"Content-Type": "text/html; charset=euc-kr"},
+            )
+
+        fetcher = _fetcher(handler)
+        page = await fetcher.fetch("https://example.com/old")
+        await fetcher.close()
+
+        assert page.url == "https://example.com/new"
+        assert page.text == "본문"
+
+    @pytest.mark.asyncio
+    async def test_rejects_declared_oversized_body(self) -> None:
+        """Test a Content-Length over the limit fails before the body is read."""
+        read = False
+
+        async def body() -> AsyncIterator[bytes]:
+            nonlocal read
+            read = True
+            yield b"x" * 100
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, headers={"Content-Length": "100"}, content=body())
+
+        fetcher = _fetcher(handler, max_bytes=10)
+        with pytest.raises(ValueError):
+            await fetcher.fetch("https://example.com/")
+        await fetcher.close()
+
+        assert not read
+
+    @pytest.mark.asyncio
+    async def test_aborts_streamed_body_past_limit(self) -> None:
+        """Test bodies without Content-Length stop once they pass the limit."""
+        sent = 0
+
+        async def body() -> AsyncIterator[bytes]:
+            nonlocal sent
+            for _ in range(100):
+                sent += 1
+                yield b"x" * 10
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body())
+
+        fetcher = _fetcher(handler, max_bytes=25)
+        with pytest.raises(ValueError):
+            await fetcher.fetch("https://example.com/")
+        await fetcher.close()
+
+        assert sent < 100
+
+    @pytest.mark.asyncio
+    async def test_total_timeout(self) -> None:
+        """Test a slow response is abandoned after the total timeout."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(1)
+            return httpx.Response(200, text="late")
+
+        fetcher = _fetcher(handler, total_timeout=0.05)
+        with pytest.raises(ValueError):
+            await fetcher.fetch("https://example.com/")
+        await fetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_http_errors_raise(self) -> None:
+        """Test 4xx/5xx responses raise like raise_for_status."""
+        fetcher = _fetcher(lambda request: httpx.Response(404))
+        with pytest.raises(httpx.HTTPStatusError):
+            await fetcher.fetch("https://example.com/missing")
+        await fetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_requests_per_host(self) -> None:
+        """Test requests to one host queue once the per-host limit is reached."""
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200, text="ok")
+
+        fetcher = _fetcher(handler, max_connections_per_host=2)
+        await asyncio.gather(
+            *(fetcher.fetch(f"https://a.example/{i}") for i in range(6)),
+            *(fetcher.fetch(f"https://b.example/{i}") for i in range(2)),
+        )
+        await fetcher.close()
+
+        assert peak == {"a.example": 2, "b.example": 2}
+        assert fetcher._host_limits == {}
+
+    @pytest.mark.asyncio
+    async def test_host_limit_released_after_failure(self) -> None:
+        """Test a failed request does not leave its host's limit behind."""
+        fetcher = _fetcher(lambda request: httpx.Response(500))
+        for i in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetcher.fetch(f"https://host{i}.example/")
+        await fetcher.close()
+
+        assert fetcher._host_limits == {}
+
+
+class TestURLExtractor:
+    """Tests for URLExtractor on top of the fetcher."""
+
+    @pytest.mark.asyncio
+    async def test_extracts_article(self) -> None:
+        """Test title, code blocks and links survive extraction."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200, text=ARTICLE, headers={"Content-Type": "text/html"}
+            )
+
+        fetcher = _fetcher(handler)
+        extracted = await URLExtractor(
+            fetcher, ParsePool(executor_type="inline")
+        ).extract("https://example.com/a")
+        await fetcher.close()
+
+        assert extracted.title == "Async IO"
+        assert "```python\nawait asyncio.sleep(1)\n```" in extracted.text
+        assert "[the docs](https://docs.python.org/3/library/asyncio.html)" in (
+            extracted.text
+        )
+        assert requests[0].headers["User-Agent"] == URLExtractor.USER_AGENT
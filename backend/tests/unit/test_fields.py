@@ -0,0 +1,54 @@
+"""Unit tests for sparse fieldset helpers."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.crud.fields import field_load_options
+from app.models import TIL
+from app.schemas import TILResponse
+from app.schemas.common import parse_fields, partial_schema
+
+
+class TestParseFields:
+    """Tests for parse_fields."""
+
+    def test_none_selects_everything(self) -> None:
+        """Test that a missing or blank value means all fields."""
+        assert parse_fields(TILResponse, None) is None
+        assert parse_fields(TILResponse, " , ") is None
+
+    def test_parses_comma_separated(self) -> None:
+        """Test that names are split and stripped."""
+        assert parse_fields(TILResponse, "slug, title,") == {"slug", "title"}
+
+    def test_unknown_field_raises(self) -> None:
+        """Test that fields outside the schema are rejected."""
+        with pytest.raises(ValueError, match="Unknown fields: password"):
+            parse_fields(TILResponse, "slug,password")
+
+
+class TestPartialSchema:
+    """Tests for partial_schema."""
+
+    def test_keeps_only_selected_fields(self) -> None:
+        """Test that the derived schema has just the selected fields."""
+        schema = partial_schema(TILResponse, frozenset({"slug", "day_number"}))
+        assert set(schema.model_fields) == {"slug", "day_number"}
+        assert partial_schema(TILResponse, frozenset({"slug", "day_number"})) is schema
+
+
+class TestFieldLoadOptions:
+    """Tests for field_load_options."""
+
+    def test_selects_only_requested_columns(self) -> None:
+        """Test that unrequested columns are left out of the SELECT."""
+        query = select(TIL).options(
+            *field_load_options(TIL, {"slug", "tags"}, always=[TIL.day_number])
+        )
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "tils.slug" in sql
+        assert "tils.day_number" in sql
+        assert "tils.id" in sql
+        assert "tils.content" not in sql
+        assert "tils.title" not in sql
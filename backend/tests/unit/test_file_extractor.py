@@ -0,0 +1,105 @@
+"""Unit tests for streaming file extraction."""
+
+import io
+from typing import Optional
+
+import pytest
+from fastapi import UploadFile
+
+from app.services.content.extractors.file import FileExtractor, FileTooLargeError
+from app.services.content.extractors.url import ContentProcessor
+
+
+class _CountingFile(io.BytesIO):
+    """BytesIO that records how many bytes each read returned."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.reads: list[int] = []
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        chunk = super().read(size)
+        self.reads.append(len(chunk))
+        return chunk
+
+
+def _upload(data: bytes, name: str = "notes.md", size: Optional[int] = None):
+    raw = _CountingFile(data)
+    return UploadFile(raw, filename=name, size=size), raw
+
+
+class TestFileExtractor:
+    """Tests for FileExtractor."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_multibyte_text_across_chunks(self, monkeypatch):
+        """Test UTF-8 characters split between chunks decode correctly."""
+        monkeypatch.setattr(FileExtractor, "CHUNK_SIZE", 5)
+        text = "# 비동기 노트\n이벤트 루프 🚀"
+        upload, raw = _upload(text.encode())
+
+        extracted = await FileExtractor().extract(upload)
+
+        assert extracted.text == text
+        assert extracted.filename == "notes.md"
+        assert max(raw.reads) == 5
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_latin1(self):
+        """Test non-UTF-8 files are re-read as latin-1."""
+        upload, _ = _upload("café notes".encode("latin-1"))
+
+        extracted = await FileExtractor().extract(upload)
+
+        assert extracted.text == "café notes"
+
+    @pytest.mark.asyncio
+    async def test_rejects_as_soon_as_limit_is_exceeded(self, monkeypatch):
+        """Test reading stops at the first chunk past MAX_FILE_SIZE."""
+        monkeypatch.setattr(FileExtractor, "CHUNK_SIZE", 10)
+        monkeypatch.setattr(FileExtractor, "MAX_FILE_SIZE", 25)
+        upload, raw = _upload(b"x" * 1000)
+
+        with pytest.raises(FileTooLargeError):
+            await FileExtractor().extract(upload)
+
+        assert sum(raw.reads) == 30
+
+    @pytest.mark.asyncio
+    async def test_rejects_known_size_without_reading(self, monkeypatch):
+        """Test a declared size over the limit is rejected before reading."""
+        monkeypatch.setattr(FileExtractor, "MAX_FILE_SIZE", 25)
+        upload, raw = _upload(b"x" * 100, size=100)
+
+        with pytest.raises(FileTooLargeError):
+            await FileExtractor().extract(upload)
+
+        assert raw.reads == []
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_max_chars(self, monkeypatch):
+        """Test text past max_chars is dropped while the whole file is checked."""
+        monkeypatch.setattr(FileExtractor, "CHUNK_SIZE", 4)
+        upload, raw = _upload(b"abcdefghij" * 10)
+
+        extracted = await FileExtractor().extract(upload, max_chars=15)
+
+        assert extracted.text == "abcdefghijabcde"
+        assert sum(raw.reads) == 100
+
+
+class TestContentProcessorFile:
+    """Tests for file input through ContentProcessor."""
+
+    @pytest.mark.asyncio
+    async def test_truncates_long_files(self, monkeypatch):
+        """Test long uploads are cut to MAX_CONTENT_LENGTH as before."""
+        monkeypatch.setattr(ContentProcessor, "MAX_CONTENT_LENGTH", 40)
+        upload, _ = _upload(b"0123456789" * 10)
+
+        text = await ContentProcessor().process(input_type="file", file=upload)
+
+        prefix = "원본 파일: notes.md\n\n"
+        assert text == (prefix + "0123456789" * 4)[:40] + (
+            "\n\n[콘텐츠가 너무 길어 잘렸습니다...]"
+        )
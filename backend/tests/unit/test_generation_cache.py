@@ -0,0 +1,129 @@
+"""Unit tests for the on-disk LLM generation cache."""
+
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from app.services.ai.cache import CachedLLMProvider, GenerationCache
+from app.services.ai.providers.base import BaseLLMProvider, LLMResponse
+
+
+class CountingProvider(BaseLLMProvider):
+    """Provider returning numbered replies so repeated calls are visible."""
+
+    name = "fake"
+    model = "fake-model"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(content=f"reply {self.calls}", model=self.model)
+
+    async def generate_stream(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        self.calls += 1
+        for chunk in ("streamed ", "reply ", str(self.calls)):
+            yield chunk
+
+    async def health_check(self) -> bool:
+        return True
+
+
+class TestGenerationCache:
+    """Tests for GenerationCache."""
+
+    def test_key_covers_all_inputs(self) -> None:
+        """Test that each input changes the key."""
+        base = GenerationCache.key("anthropic", "m", "sys", "prompt")
+        assert base == GenerationCache.key("anthropic", "m", "sys", "prompt")
+        assert base != GenerationCache.key("other", "m", "sys", "prompt")
+        assert base != GenerationCache.key("anthropic", "m2", "sys", "prompt")
+        assert base != GenerationCache.key("anthropic", "m", None, "prompt")
+        assert base != GenerationCache.key("anthropic", "m", "sys", "prompt2")
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that a stored response is read back unchanged."""
+        cache = GenerationCache(str(tmp_path), max_bytes=1024 * 1024)
+        response = LLMResponse(content="본문", model="m", usage={"input_tokens": 3})
+
+        assert await cache.get("ab" * 32) is None
+        await cache.set("ab" * 32, response)
+        assert await cache.get("ab" * 32) == response
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Test that the total size stays under the limit, oldest first."""
+        entry = LLMResponse(content="x" * 100, model="m")
+        cache = GenerationCache(str(tmp_path), max_bytes=1024 * 1024)
+        keys = [f"{i:064x}" for i in range(4)]
+        for i, key in enumerate(keys[:3]):
+            await cache.set(key, entry)
+            os.utime(cache.store.path(key), (1000 + i, 1000 + i))
+        # Room for exactly three entries
+        cache.store.max_bytes = cache.store.path(keys[0]).stat().st_size * 3
+
+        await cache.get(keys[0])  # now the most recently used
+        await cache.set(keys[3], entry)
+
+        assert await cache.get(keys[1]) is None
+        for key in (keys[0], keys[2], keys[3]):
+            assert await cache.get(key) == entry
+
+    @pytest.mark.asyncio
+    async def test_overwrite_is_not_counted_twice(self, tmp_path: Path) -> None:
+        """Test that rewriting a key (force=True) keeps the size accurate."""
+        entry = LLMResponse(content="x" * 100, model="m")
+        cache = GenerationCache(str(tmp_path), max_bytes=1024 * 1024)
+        keys = [f"{i:064x}" for i in range(2)]
+        for key in keys:
+            await cache.set(key, entry)
+
+        for _ in range(5):
+            await cache.set(keys[0], entry)
+
+        assert cache.store._size == sum(cache.store.path(key).stat().st_size for key in keys)
+
+
+class TestCachedLLMProvider:
+    """Tests for CachedLLMProvider."""
+
+    @pytest.mark.asyncio
+    async def test_generate_hit_and_force(self, tmp_path: Path) -> None:
+        """Test hits skip the provider and force regenerates and refreshes."""
+        cache = GenerationCache(str(tmp_path), max_bytes=1024 * 1024)
+        provider = CountingProvider()
+        cached = CachedLLMProvider(provider, cache)
+
+        assert (await cached.generate("p", "sys")).content == "reply 1"
+        assert (await cached.generate("p", "sys")).content == "reply 1"
+        assert (await cached.generate("p", "other sys")).content == "reply 2"
+
+        forced = CachedLLMProvider(provider, cache, force=True)
+        assert (await forced.generate("p", "sys")).content == "reply 3"
+        assert (await cached.generate("p", "sys")).content == "reply 3"
+        assert provider.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_replays_cached_output(self, tmp_path: Path) -> None:
+        """Test a completed stream is replayed from the cache as chunks."""
+        cache = GenerationCache(str(tmp_path), max_bytes=1024 * 1024)
+        provider = CountingProvider()
+        cached = CachedLLMProvider(provider, cache)
+        cached.REPLAY_CHUNK_SIZE = 4
+
+        first = [chunk async for chunk in cached.generate_stream("p")]
+        replay = [chunk async for chunk in cached.generate_stream("p")]
+
+        assert "".join(first) == "streamed reply 1"
+        assert "".join(replay) == "streamed reply 1"
+        assert len(replay) == 4
+        assert provider.calls == 1
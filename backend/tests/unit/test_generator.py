@@ -0,0 +1,109 @@
+"""Unit tests for TIL title/excerpt generation."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Optional
+
+import pytest
+
+from app.services.ai.generator import TILGenerator
+from app.services.ai.prompts import EXCERPT_PROMPT, METADATA_PROMPT, TITLE_PROMPT
+from app.services.ai.providers.base import BaseLLMProvider, LLMResponse
+
+
+def _kind(prompt: str) -> str:
+    for kind, template in (
+        ("title", TITLE_PROMPT),
+        ("excerpt", EXCERPT_PROMPT),
+        ("metadata", METADATA_PROMPT),
+    ):
+        if prompt.startswith(template.split("{", 1)[0]):
+            return kind
+    return "content"
+
+
+class FakeProvider(BaseLLMProvider):
+    """Provider answering by prompt kind, with per-kind latency."""
+
+    def __init__(
+        self, replies: dict[str, str], delays: Optional[dict[str, float]] = None
+    ) -> None:
+        self.replies = replies
+        self.delays = delays or {}
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> LLMResponse:
+        kind = _kind(prompt)
+        self.calls.append(kind)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(kind, 0))
+        finally:
+            self.in_flight -= 1
+        return LLMResponse(content=self.replies[kind], model="fake")
+
+    async def generate_stream(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        for chunk in ("# Body", "\n\ntext"):
+            yield chunk
+
+    async def health_check(self) -> bool:
+        return True
+
+
+REPLIES = {"title": '"Async title"', "excerpt": " Short excerpt. "}
+
+
+class TestTILGenerator:
+    """Tests for TILGenerator metadata generation."""
+
+    @pytest.mark.asyncio
+    async def test_title_and_excerpt_run_concurrently(self) -> None:
+        """Test both calls overlap and events follow completion order."""
+        provider = FakeProvider(REPLIES, delays={"title": 0.05, "excerpt": 0.01})
+        generator = TILGenerator(provider=provider, structured_metadata=False)
+
+        events = [
+            event
+            async for event in generator.stream_generate("text", content="notes")
+        ]
+
+        names = [event["event"] for event in events]
+        assert names[-3:] == ["excerpt", "title", "complete"]
+        assert provider.max_in_flight == 2
+        assert events[-1]["data"]["title"] == "Async title"
+        assert events[-1]["data"]["excerpt"] == "Short excerpt."
+
+    @pytest.mark.asyncio
+    async def test_structured_metadata_single_call(self) -> None:
+        """Test structured mode asks for title and excerpt in one call."""
+        replies = {
+            "content": "# Body",
+            "metadata": 'Sure:\n{"title": "Async title", "excerpt": "Short."}',
+        }
+        provider = FakeProvider(replies)
+        generator = TILGenerator(provider=provider, structured_metadata=True)
+
+        result = await generator.generate("text", content="notes")
+
+        assert provider.calls == ["content", "metadata"]
+        assert result["title"] == "Async title"
+        assert result["excerpt"] == "Short."
+
+    @pytest.mark.asyncio
+    async def test_structured_metadata_falls_back(self) -> None:
+        """Test invalid JSON falls back to the two concurrent calls."""
+        replies = {"content": "# Body", "metadata": "not json", **REPLIES}
+        provider = FakeProvider(replies)
+        generator = TILGenerator(provider=provider, structured_metadata=True)
+
+        result = await generator.generate("text", content="notes")
+
+        assert sorted(provider.calls) == ["content", "excerpt", "metadata", "title"]
+        assert result["title"] == "Async title"
@@ -0,0 +1,43 @@
+"""Unit tests for the process-wide LLM provider factory."""
+
+import pytest
+
+from app.services.ai.providers import (
+    AnthropicProvider,
+    close_llm_providers,
+    get_llm_provider,
+)
+
+
+class TestGetLLMProvider:
+    """Tests for get_llm_provider / close_llm_providers."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_provider_per_model(self) -> None:
+        """Test that repeated calls share one client and connection pool."""
+        try:
+            provider = get_llm_provider("anthropic")
+            assert isinstance(provider, AnthropicProvider)
+            assert get_llm_provider("anthropic") is provider
+            assert get_llm_provider("anthropic", provider.model) is provider
+
+            other = get_llm_provider("anthropic", "claude-other-model")
+            assert other is not provider
+            assert other.model == "claude-other-model"
+        finally:
+            await close_llm_providers()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_clients(self) -> None:
+        """Test that closing shuts the HTTP client and drops the instance."""
+        provider = get_llm_provider("anthropic")
+        await close_llm_providers()
+
+        assert provider.client.is_closed()
+        assert get_llm_provider("anthropic") is not provider
+        await close_llm_providers()
+
+    def test_unknown_provider(self) -> None:
+        """Test that unsupported providers are rejected."""
+        with pytest.raises(ValueError):
+            get_llm_provider("openai")
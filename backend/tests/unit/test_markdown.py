@@ -0,0 +1,107 @@
+"""Unit tests for the single-pass HTML to Markdown converter."""
+
+from pathlib import Path
+
+from app.services.content.markdown import html_to_markdown
+from app.services.content.parsing import parse_article
+
+FIXTURES = Path(__file__).parents[2] / "benchmarks" / "fixtures" / "html"
+
+
+class TestHtmlToMarkdown:
+    """Tests for html_to_markdown."""
+
+    def test_headings_and_paragraphs(self):
+        """Test headings get # prefixes and paragraphs are separated by blank lines."""
+        html = "<h1>Title</h1><p>First   line\n wrapped.</p><h3>Sub</h3><p>Second.</p>"
+        assert html_to_markdown(html) == (
+            "# Title\n\nFirst line wrapped.\n\n### Sub\n\nSecond."
+        )
+
+    def test_inline_formatting(self):
+        """Test links, emphasis, inline code and line breaks."""
+        html = (
+            '<p>Use <code>gather</code>, see <a href="https://x.dev/a">the '
+            "<em>docs</em></a> or <strong>not</strong>.<br>Next <a>bare</a></p>"
+        )
+        assert html_to_markdown(html) == (
+            "Use `gather`, see [the *docs*](https://x.dev/a) or **not**.\nNext bare"
+        )
+
+    def test_nested_lists(self):
+        """Test unordered, ordered (with start) and nested lists."""
+        html = (
+            "<ul><li>one</li><li>two<ul><li>inner</li></ul></li></ul>"
+            '<ol start="3"><li>three</li><li><p>four</p><p>more</p></li></ol>'
+        )
+        assert html_to_markdown(html) == (
+            "- one\n- two\n  - inner\n\n3. three\n4. four\n   more"
+        )
+
+    def test_code_block_language(self):
+        """Test pre blocks become fences with the language and keep whitespace."""
+        html = (
+            '<pre><code class="hljs language-python">def f():\n    return 1\n'
+            '</code></pre><div class="highlight-sql"><pre>SELECT  1;</pre></div>'
+            "<pre>plain</pre>"
+        )
+        assert html_to_markdown(html) == (
+            "```python\ndef f():\n    return 1\n```\n\n"
+            "```sql\nSELECT  1;\n```\n\n"
+            "```\nplain\n```"
+        )
+
+    def test_table(self):
+        """Test tables become pipe tables with escaped cells and padded rows."""
+        html = (
+            "<table><thead><tr><th>Name</th><th>Value</th></tr></thead><tbody>"
+            '<tr><td><a href="/a">a|b</a></td><td><code>1</code></td></tr>'
+            "<tr><td>short</td></tr></tbody></table>"
+        )
+        assert html_to_markdown(html) == (
+            "| Name | Value |\n| --- | --- |\n| [a\\|b](/a) | `1` |\n| short |  |"
+        )
+
+    def test_blockquote(self):
+        """Test every blockquote line is prefixed."""
+        html = "<blockquote><p>one</p><p>two</p></blockquote>"
+        assert html_to_markdown(html) == "> one\n>\n> two"
+
+    def test_skips_scripts_and_comments_but_keeps_tails(self):
+        """Test non-content elements are dropped without losing following text."""
+        html = "<p>a<script>var x = 1;</script>b<!-- note -->c<img src='x.png'>d</p>"
+        assert html_to_markdown(html) == "abcd"
+
+    def test_empty_input(self):
+        """Test blank input converts to an empty string."""
+        assert html_to_markdown("  \n") == ""
+
+
+class TestParseArticle:
+    """Tests for parse_article on the saved HTML fixtures."""
+
+    def test_docs_page(self):
+        """Test a docs page keeps code languages, nested lists and the table."""
+        article = parse_article((FIXTURES / "docs_page.html").read_text())
+
+        assert article.title.startswith("Coroutines and Tasks")
+        assert article.text.startswith("# Coroutines and Tasks\n\n")
+        assert "```python3\nimport asyncio\n\nasync def main():" in article.text
+        assert "  ```python\n  await asyncio.sleep(1)" in article.text
+        assert "  - Tasks are scheduled as soon as possible." in article.text
+        assert "| `asyncio.timeout(delay)` | Async context manager" in article.text
+        assert "[PEP 492](https://peps.python.org/pep-0492/)" in article.text
+        # Navigation and footer are left out by readability
+        assert "Streams" not in article.text
+        assert "Copyright" not in article.text
+
+    def test_blog_post(self):
+        """Test a blog post keeps ordered lists, quotes and tables."""
+        article = parse_article((FIXTURES / "blog_post.html").read_text())
+
+        assert "## 해결 과정" in article.text
+        assert "1. 느린 쿼리를 [pg_stat_statements](" in article.text
+        assert "```sql\nEXPLAIN ANALYZE" in article.text
+        assert "> 인덱스는 쿼리가 읽는 순서대로 만들어야 합니다." in article.text
+        assert "| p99 | 820ms | 45ms |" in article.text
+        assert "analytics" not in article.text
@@ -0,0 +1,130 @@
+"""Unit tests for the off-loop parse pool."""
+
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from app.services.content.parsing import parse_article
+from app.services.content.pool import ParsePool
+
+HTML = "<html><head><title>Pool</title></head><body><p>Body text.</p></body></html>"
+
+
+def _where() -> str:
+    if multiprocessing.parent_process() is not None:
+        return "process"
+    if threading.current_thread() is not threading.main_thread():
+        return "thread"
+    return "inline"
+
+
+def _crash_in_child() -> str:
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return _where()
+
+
+def _slow() -> None:
+    time.sleep(0.5)
+
+
+def _sleep(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class TestParsePool:
+    """Tests for ParsePool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor_type", ["process", "thread", "inline"])
+    async def test_runs_where_configured(self, executor_type: str) -> None:
+        """Test each executor type runs the call in the expected place."""
+        pool = ParsePool(workers=1, executor_type=executor_type)
+        try:
+            assert await pool.run(_where) == executor_type
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_parses_article_in_process(self) -> None:
+        """Test parse_article and its result cross the process boundary."""
+        pool = ParsePool(workers=1, executor_type="process")
+        try:
+            article = await pool.run(parse_article, HTML)
+        finally:
+            pool.close()
+
+        assert article.title == "Pool"
+        assert "Body text." in article.text
+
+    @pytest.mark.asyncio
+    async def test_broken_process_pool_raises_and_is_replaced(self) -> None:
+        """Test a crashed worker fails its call and the next call gets a new pool."""
+        pool = ParsePool(workers=1, executor_type="process")
+        try:
+            with pytest.raises(ValueError):
+                await pool.run(_crash_in_child)
+            assert await pool.run(_where) == "process"
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout(self) -> None:
+        """Test a call running past the timeout raises ValueError."""
+        pool = ParsePool(workers=1, timeout=0.05, executor_type="thread")
+        try:
+            with pytest.raises(ValueError):
+                await pool.run(_slow)
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_terminates_worker_process(self) -> None:
+        """Test a timed-out call's process is killed and the pool replaced."""
+        pool = ParsePool(workers=1, timeout=30, executor_type="process")
+        try:
+            # Unpickling the first call imports this test module in the worker,
+            # so only the stuck call runs under a short timeout
+            await pool.run(_where)
+            workers = list(pool._process_pool._processes.values())
+            pool.timeout = 0.2
+            with pytest.raises(ValueError):
+                await pool.run(_sleep, 30)
+            for worker in workers:
+                worker.join(5)
+                assert not worker.is_alive()
+            pool.timeout = 30
+            assert await pool.run(_where) == "process"
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_excludes_queue_wait(self) -> None:
+        """Test time spent waiting for a free worker does not count."""
+        pool = ParsePool(workers=1, timeout=0.3, executor_type="thread")
+        try:
+            await asyncio.gather(*(pool.run(_sleep, 0.2) for _ in range(3)))
+        finally:
+            pool.close()
+
+    def test_parsing_imports_stay_light(self) -> None:
+        """Test workers unpickling parse_article do not import the web stack."""
+        code = (
+            "import sys, app.services.content.parsing; "
+            "print(sorted({'fastapi', 'httpx', 'app.config'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_unknown_executor_type(self) -> None:
+        """Test invalid CONTENT_PARSE_EXECUTOR values are rejected."""
+        with pytest.raises(ValueError):
+            ParsePool(executor_type="fiber")
@@ -0,0 +1,64 @@
+"""Unit tests for connection pool warmup and metrics."""
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, pool_status, warm_up_pool
+
+
+@pytest.fixture
+async def pooled_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    """Provide a file-backed SQLite engine with an instrumented pool."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=3,
+        max_overflow=1,
+    )
+    yield engine
+    await engine.dispose()
+
+
+class TestWarmUpPool:
+    """Tests for warm_up_pool."""
+
+    @pytest.mark.asyncio
+    async def test_opens_idle_connections(self, pooled_engine: AsyncEngine) -> None:
+        """Test warmup leaves the requested connections idle in the pool."""
+        assert await warm_up_pool(pooled_engine, 2) == 2
+
+        status = pool_status(pooled_engine)
+        assert status["idle"] == 2
+        assert status["checked_out"] == 0
+
+    @pytest.mark.asyncio
+    async def test_capped_at_pool_size(self, pooled_engine: AsyncEngine) -> None:
+        """Test warmup never opens overflow connections."""
+        assert await warm_up_pool(pooled_engine, 10) == 3
+        assert pool_status(pooled_engine)["idle"] == 3
+
+
+class TestPoolStatus:
+    """Tests for pool_status."""
+
+    @pytest.mark.asyncio
+    async def test_reports_checkouts_and_overflow(
+        self, pooled_engine: AsyncEngine
+    ) -> None:
+        """Test checked-out, overflow and checkout timing are reported."""
+        conns = [await pooled_engine.connect() for _ in range(4)]
+        try:
+            await conns[0].execute(text("SELECT 1"))
+            status = pool_status(pooled_engine)
+            assert status["checked_out"] == 4
+            assert status["overflow"] == 1
+            assert status["max_overflow"] == 1
+            assert status["checkouts"] == 4
+            assert status["acquire_ms_max"] >= status["acquire_ms_mean"] > 0
+        finally:
+            for conn in conns:
+                await conn.close()
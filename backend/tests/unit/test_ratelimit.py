@@ -0,0 +1,34 @@
+"""Unit tests for the LLM token rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.ai.ratelimit import TokenRateLimiter
+
+
+class TestTokenRateLimiter:
+    """Tests for TokenRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_full_bucket_is_immediate(self) -> None:
+        """Test the first minute's budget is available at once."""
+        limiter = TokenRateLimiter(tokens_per_minute=6000)
+        start = time.perf_counter()
+        await limiter.acquire(6000)
+        assert time.perf_counter() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self) -> None:
+        """Test an empty bucket waits until enough tokens refill."""
+        limiter = TokenRateLimiter(tokens_per_minute=6000)  # 100 tokens/s
+        await limiter.acquire(6000)
+        start = time.perf_counter()
+        await asyncio.gather(limiter.acquire(5), limiter.acquire(5))
+        assert time.perf_counter() - start >= 0.09
+
+    def test_rejects_non_positive_limit(self) -> None:
+        """Test a zero budget is rejected."""
+        with pytest.raises(ValueError):
+            TokenRateLimiter(tokens_per_minute=0)
@@ -0,0 +1,183 @@
+"""Unit tests for the response cache backends and request coalescing."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.cache import (
+    CachedResponse,
+    MemoryCacheBackend,
+    ResponseCache,
+    get_cache_backend,
+)
+from app.config import settings
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMemoryCacheBackend:
+    """Tests for the in-process LRU backend."""
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self) -> None:
+        """Test entries expire after the TTL."""
+        clock = FakeClock()
+        backend = MemoryCacheBackend(max_entries=10, ttl=5, clock=clock)
+        await backend.set("a", CachedResponse(b"1"))
+
+        clock.now = 4.9
+        assert await backend.get("a") is not None
+        clock.now = 5.0
+        assert await backend.get("a") is None
+        assert len(backend) == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted first."""
+        backend = MemoryCacheBackend(max_entries=2, ttl=60)
+        await backend.set("a", CachedResponse(b"1"))
+        await backend.set("b", CachedResponse(b"2"))
+        await backend.get("a")
+        await backend.set("c", CachedResponse(b"3"))
+
+        assert await backend.get("a") is not None
+        assert await backend.get("b") is None
+        assert await backend.get("c") is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_label(self) -> None:
+        """Test invalidation drops exactly the entries carrying the labels."""
+        backend = MemoryCacheBackend(max_entries=10, ttl=60)
+        await backend.set("til", CachedResponse(b"1", labels={"til:1", "tag:1"}))
+        await backend.set("list", CachedResponse(b"2", labels={"tils", "til:1"}))
+        await backend.set("other", CachedResponse(b"3", labels={"til:2"}))
+
+        assert await backend.invalidate(["tag:1", "missing"]) == 1
+        assert await backend.get("til") is None
+        assert await backend.get("list") is not None
+
+        assert await backend.invalidate(["til:1"]) == 1
+        assert await backend.get("list") is None
+        assert await backend.get("other") is not None
+
+
+class TestResponseCache:
+    """Tests for read-through loading and coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self) -> None:
+        """Test a cold key under concurrent load is loaded once."""
+        cache = ResponseCache(MemoryCacheBackend(max_entries=10, ttl=60))
+        calls = 0
+
+        async def load() -> CachedResponse:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return CachedResponse(b"body")
+
+        entries = await asyncio.gather(*(cache.get_or_load("k", load) for _ in range(10)))
+        assert calls == 1
+        assert {entry.content for entry in entries} == {b"body"}
+
+        await cache.get_or_load("k", load)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_shared_and_not_cached(self) -> None:
+        """Test a failed load is raised to all waiters and retried later."""
+        cache = ResponseCache(MemoryCacheBackend(max_entries=10, ttl=60))
+        calls = 0
+
+        async def load() -> CachedResponse:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise HTTPException(status_code=404)
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("k", load) for _ in range(3)), return_exceptions=True
+        )
+        assert calls == 1
+        assert all(isinstance(r, HTTPException) for r in results)
+
+        with pytest.raises(HTTPException):
+            await cache.get_or_load("k", load)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_not_stored(self) -> None:
+        """Test an entry loaded across an invalidation is not cached."""
+        cache = ResponseCache(MemoryCacheBackend(max_entries=10, ttl=60))
+
+        async def load() -> CachedResponse:
+            await cache.invalidate(["til:1"])
+            return CachedResponse(b"stale", labels={"til:1"})
+
+        assert (await cache.get_or_load("k", load)).content == b"stale"
+        assert cache.backend is not None
+        assert await cache.backend.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_loads(self) -> None:
+        """Test a cache without backend calls the loader every time."""
+        cache = ResponseCache(None)
+        calls = 0
+
+        async def load() -> CachedResponse:
+            nonlocal calls
+            calls += 1
+            return CachedResponse(b"body")
+
+        await cache.get_or_load("k", load)
+        await cache.get_or_load("k", load)
+        assert calls == 2
+
+    def test_lazy_render(self) -> None:
+        """Test the body is rendered once, on first access."""
+        renders = 0
+
+        def render() -> bytes:
+            nonlocal renders
+            renders += 1
+            return b"body"
+
+        entry = CachedResponse(render)
+        assert renders == 0
+        assert entry.content == b"body"
+        assert entry.content == b"body"
+        assert renders == 1
+
+
+class TestGetCacheBackend:
+    """Tests for choosing the response cache backend."""
+
+    def test_auto_without_redis_disables_caching(self, monkeypatch) -> None:
+        """Test "auto" never falls back to a per-process cache."""
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_REDIS_URL", "")
+        assert get_cache_backend("auto") is None
+
+    def test_auto_with_redis_url_selects_redis(self, monkeypatch) -> None:
+        """Test "auto" picks the shared backend once a URL is configured."""
+        pytest.importorskip("redis")
+        from app.cache.redis import RedisCacheBackend
+
+        monkeypatch.setattr(
+            settings, "RESPONSE_CACHE_REDIS_URL", "redis://cache:6379/0"
+        )
+        assert isinstance(get_cache_backend("auto"), RedisCacheBackend)
+
+    def test_redis_requires_url(self, monkeypatch) -> None:
+        """Test selecting redis explicitly without a URL is rejected."""
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_REDIS_URL", "")
+        with pytest.raises(ValueError):
+            get_cache_backend("redis")
@@ -0,0 +1,31 @@
+"""Unit tests for search query building."""
+
+from app.crud.search import bigram_tsquery
+
+
+class TestBigramTsquery:
+    """Tests for the bigram_tsquery function."""
+
+    def test_korean_word(self) -> None:
+        """Test that a word becomes all of its two-character windows."""
+        assert bigram_tsquery("비동기") == "'비동' & '동기'"
+
+    def test_multiple_words_and_punctuation(self) -> None:
+        """Test that words are split on whitespace and punctuation."""
+        assert bigram_tsquery("코드, 리뷰!") == "'코드' & '리뷰'"
+
+    def test_lowercases_and_deduplicates(self) -> None:
+        """Test that lexemes are lowercased and not repeated."""
+        assert bigram_tsquery("AAA") == "'aa'"
+
+    def test_single_character_is_prefix(self) -> None:
+        """Test that a one-character word becomes a prefix match."""
+        assert bigram_tsquery("값") == "'값':*"
+
+    def test_quotes_split_words(self) -> None:
+        """Test that quote characters never reach a lexeme."""
+        assert bigram_tsquery("it's") == "'it' & 's':*"
+
+    def test_empty_query(self) -> None:
+        """Test that a query without words yields an empty string."""
+        assert bigram_tsquery("  ... ") == ""
@@ -0,0 +1,96 @@
+"""Unit tests for direct row-to-JSON rendering."""
+
+import uuid
+from datetime import date, datetime, timezone
+
+from app.api.serialization import dump_json, row_dict
+from app.models import TIL, Book, BookNote, Tag
+from app.schemas import (
+    BookNoteResponse,
+    BookResponse,
+    TILResponse,
+    TILSummaryResponse,
+)
+from app.schemas.common import partial_schema
+
+NOW = datetime(2026, 10, 18, 9, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+def _tag() -> Tag:
+    return Tag(
+        id=uuid.uuid4(), name="Python", slug="python", created_at=NOW, updated_at=NOW
+    )
+
+
+def _til() -> TIL:
+    return TIL(
+        id=uuid.uuid4(),
+        title="Async \"SQLAlchemy\" — 한국어",
+        slug="async-sqlalchemy",
+        day_number=3,
+        excerpt="Excerpt",
+        content="# Content\n\nBody",
+        is_published=True,
+        published_at=None,
+        created_at=NOW,
+        updated_at=NOW.replace(microsecond=0),
+        tags=[_tag()],
+    )
+
+
+class TestRowDict:
+    """Tests that row_dict + dump_json match Pydantic serialization."""
+
+    def test_til_matches_model_dump_json(self) -> None:
+        """Test a TIL with nested tags renders identically."""
+        til = _til()
+        for schema in (TILResponse, TILSummaryResponse):
+            expected = schema.model_validate(til).model_dump_json().encode()
+            assert dump_json(row_dict(schema, til)) == expected
+
+    def test_book_note_matches_model_dump_json(self) -> None:
+        """Test dates, lists and nullable fields render identically."""
+        note = BookNote(
+            id=uuid.uuid4(),
+            book_id=uuid.uuid4(),
+            chapter_number=None,
+            chapter_title="Chapter 1",
+            slug="chapter-1",
+            pages="1-20",
+            content="Body",
+            key_takeaways=["one", "two"],
+            questions=None,
+            ai_summary=None,
+            reading_date=date(2026, 10, 1),
+            is_published=False,
+            published_at=None,
+            created_at=NOW,
+            updated_at=NOW,
+            tags=[],
+        )
+        expected = BookNoteResponse.model_validate(note).model_dump_json().encode()
+        assert dump_json(row_dict(BookNoteResponse, note)) == expected
+
+    def test_book_with_computed_fields(self) -> None:
+        """Test query-expression values and partial schemas render identically."""
+        book = Book(
+            id=uuid.uuid4(),
+            title="Clean Code",
+            author="Robert C. Martin",
+            slug="clean-code",
+            cover_image=None,
+            total_chapters=4,
+            status="reading",
+            start_date=date(2026, 10, 1),
+            end_date=None,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        book.notes_count = 3
+        book.progress = 75.0
+        for schema in (
+            BookResponse,
+            partial_schema(BookResponse, frozenset({"slug", "progress"})),
+        ):
+            expected = schema.model_validate(book).model_dump_json().encode()
+            assert dump_json(row_dict(schema, book)) == expected
@@ -0,0 +1,80 @@
+"""Unit tests for SSE formatting and heartbeats."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.api.sse import HEARTBEAT, parse_last_event_id, sse_message, with_heartbeat
+
+
+class TestSSEMessage:
+    """Tests for sse_message and parse_last_event_id."""
+
+    def test_message_with_id(self) -> None:
+        """Test the id line precedes event and data."""
+        assert sse_message("title", {"title": "제목"}, id=3) == (
+            'id: 3\nevent: title\ndata: {"title": "제목"}\n\n'
+        )
+
+    def test_message_without_id(self) -> None:
+        """Test messages without an id leave the field out."""
+        assert sse_message("job", {}) == "event: job\ndata: {}\n\n"
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(None, 0), ("", 0), ("7", 7), ("-1", 0), ("abc", 0)],
+    )
+    def test_parse_last_event_id(self, value: str, expected: int) -> None:
+        """Test missing or invalid headers resume from the start."""
+        assert parse_last_event_id(value) == expected
+
+
+class TestHeartbeat:
+    """Tests for with_heartbeat."""
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_while_source_is_idle(self) -> None:
+        """Test heartbeats fill idle gaps without dropping messages."""
+
+        async def source() -> AsyncIterator[str]:
+            yield "a"
+            await asyncio.sleep(0.05)
+            yield "b"
+
+        messages = [m async for m in with_heartbeat(source(), 0.01)]
+
+        assert messages[0] == "a"
+        assert messages[-1] == "b"
+        assert HEARTBEAT in messages
+        assert set(messages[1:-1]) == {HEARTBEAT}
+
+    @pytest.mark.asyncio
+    async def test_no_heartbeat_when_source_is_busy(self) -> None:
+        """Test a steady source passes through unchanged."""
+
+        async def source() -> AsyncIterator[str]:
+            for message in ("a", "b", "c"):
+                yield message
+
+        assert [m async for m in with_heartbeat(source(), 1.0)] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_closes_source(self) -> None:
+        """Test a disconnected client stops the source generator."""
+        closed = asyncio.Event()
+
+        async def source() -> AsyncIterator[str]:
+            try:
+                yield "a"
+                await asyncio.sleep(10)
+                yield "b"
+            finally:
+                closed.set()
+
+        stream = with_heartbeat(source(), 0.01)
+        assert await anext(stream) == "a"
+        assert await anext(stream) == HEARTBEAT
+        await stream.aclose()
+
+        assert closed.is_set()
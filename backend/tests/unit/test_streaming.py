@@ -0,0 +1,86 @@
+"""Unit tests for LLM stream chunk coalescing."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.services.ai.streaming import coalesce_chunks
+
+
+async def _source(*items: object) -> AsyncIterator[str]:
+    """Yield strings; floats are pauses in seconds."""
+    for item in items:
+        if isinstance(item, float):
+            await asyncio.sleep(item)
+        else:
+            yield str(item)
+
+
+async def _collect(stream: AsyncIterator[str]) -> list[str]:
+    return [chunk async for chunk in stream]
+
+
+class TestCoalesceChunks:
+    """Tests for coalesce_chunks."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_max_bytes(self) -> None:
+        """Test a burst of deltas is cut into max_bytes frames."""
+        chunks = await _collect(
+            coalesce_chunks(_source(*["abcd"] * 5), max_delay=1.0, max_bytes=8)
+        )
+
+        assert chunks == ["abcdabcd", "abcdabcd", "abcd"]
+
+    @pytest.mark.asyncio
+    async def test_counts_utf8_bytes(self) -> None:
+        """Test the size limit applies to encoded bytes, not characters."""
+        chunks = await _collect(
+            coalesce_chunks(_source("가", "나", "다"), max_delay=1.0, max_bytes=6)
+        )
+
+        assert chunks == ["가나", "다"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_max_delay_while_source_pauses(self) -> None:
+        """Test buffered text is sent without waiting for the next delta."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        received: list[tuple[str, float]] = []
+
+        async for chunk in coalesce_chunks(
+            _source("a", "b", 0.2, "c"), max_delay=0.02, max_bytes=1024
+        ):
+            received.append((chunk, loop.time() - start))
+
+        assert [chunk for chunk, _ in received] == ["ab", "c"]
+        assert received[0][1] < 0.15
+
+    @pytest.mark.asyncio
+    async def test_zero_delay_passes_deltas_through(self) -> None:
+        """Test coalescing can be disabled."""
+        chunks = await _collect(
+            coalesce_chunks(_source("a", "b", "c"), max_delay=0, max_bytes=1024)
+        )
+
+        assert chunks == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_closes_source(self) -> None:
+        """Test an abandoned stream stops the provider stream."""
+        closed = asyncio.Event()
+
+        async def source() -> AsyncIterator[str]:
+            try:
+                yield "a"
+                await asyncio.sleep(10)
+                yield "b"
+            finally:
+                closed.set()
+
+        stream = coalesce_chunks(source(), max_delay=0.01, max_bytes=1024)
+        assert await anext(stream) == "a"
+        await stream.aclose()
+
+        assert closed.is_set()